@@ -0,0 +1,185 @@
+"""Shared timing, baseline and comparison code for the benchmark scripts."""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+
+import numpy as np
+import matplotlib
+
+# Benchmarks import the engine the way game.py does, from the repo root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+DEFAULT_REPEAT = 20  # timed runs per case
+DEFAULT_WARMUP = 2  # untimed runs first, so caches and fonts are loaded
+DEFAULT_THRESHOLD = 0.15  # median slowdown that counts as a regression
+NOISE_FLOOR_MS = 0.05  # differences below this are never flagged, in ms
+
+
+def time_case(
+    run, repeat: int = DEFAULT_REPEAT, warmup: int = DEFAULT_WARMUP, number: int = 1
+) -> dict:
+    """
+    Call *run* repeatedly and summarise the time per call in milliseconds.
+
+    Each of the *repeat* samples times *number* calls back to back, so
+    calls far shorter than the timer's resolution can still be measured.
+    """
+    for _ in range(warmup):
+        run()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        samples.append((time.perf_counter() - start) / number)
+    ms = np.array(samples) * 1000
+    return {
+        "median_ms": round(float(np.median(ms)), 6),
+        "min_ms": round(float(ms.min()), 6),
+        "p95_ms": round(float(np.percentile(ms, 95)), 6),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def run_cases(
+    cases: dict, repeat: int, only: list | None = None, measure=time_case
+) -> dict:
+    """
+    Time every case whose name contains one of *only*.
+
+    *cases* maps a name to a setup function. Setup runs untimed and
+    returns the callable that is timed; *measure(run, repeat)* times it.
+    """
+    results = {}
+    for name, setup in cases.items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        results[name] = measure(setup(), repeat)
+        line = f"{name:<40} {results[name]['median_ms']:12.4f} ms"
+        if "ops_per_sec" in results[name]:
+            line += f" {results[name]['ops_per_sec']:14,.0f} ops/s"
+        if "alloc_peak_bytes" in results[name]:
+            line += f" {results[name]['alloc_peak_bytes']:10,} B/op"
+        print(line, flush=True)
+    return results
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "matplotlib": matplotlib.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.node(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def save(path: str, suite: str, results: dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"suite": suite, "environment": environment(), "results": results},
+            f,
+            indent=2,
+        )
+        f.write("\n")
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    noise_floor: float = NOISE_FLOOR_MS,
+):
+    """
+    Compare median times case by case.
+
+    Returns (name, baseline_ms, current_ms, ratio, status) rows, where
+    status is "regressed", "improved", "ok", "new" or "missing".
+    """
+    rows = []
+    base, cur = baseline["results"], current["results"]
+    for name in sorted(set(base) | set(cur)):
+        if name not in cur:
+            rows.append((name, base[name]["median_ms"], None, None, "missing"))
+            continue
+        if name not in base:
+            rows.append((name, None, cur[name]["median_ms"], None, "new"))
+            continue
+
+        before, after = base[name]["median_ms"], cur[name]["median_ms"]
+        ratio = after / before if before else float("inf")
+        status = "ok"
+        if abs(after - before) >= noise_floor:
+            if ratio > 1 + threshold:
+                status = "regressed"
+            elif ratio < 1 / (1 + threshold):
+                status = "improved"
+        rows.append((name, before, after, ratio, status))
+    return rows
+
+
+def _fmt(ms) -> str:
+    return "-" if ms is None else f"{ms:.4f}"
+
+
+def print_comparison(rows: list) -> None:
+    print(f"{'case':<40} {'baseline':>12} {'current':>12} {'ratio':>7}  status")
+    for name, before, after, ratio, status in rows:
+        shown = "-" if ratio is None else f"{ratio:.2f}x"
+        print(f"{name:<40} {_fmt(before):>12} {_fmt(after):>12} {shown:>7}  {status}")
+
+
+def main(
+    suite: str,
+    cases: dict,
+    argv: list | None = None,
+    measure=time_case,
+    noise_floor: float = NOISE_FLOOR_MS,
+) -> int:
+    """Command line for a benchmark script: run cases or compare two result files."""
+    parser = argparse.ArgumentParser(description=f"{suite} benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="time the cases and write a JSON result")
+    run.add_argument("--out", default=f"{suite}.json", help="result file to write")
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run.add_argument(
+        "--only", nargs="*", metavar="NAME", help="cases whose name contains NAME"
+    )
+
+    cmp = commands.add_parser("compare", help="flag regressions against a baseline")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"median slowdown flagged as a regression (default {DEFAULT_THRESHOLD})",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        results = run_cases(cases, args.repeat, args.only, measure)
+        save(args.out, suite, results)
+        print(f"Wrote {len(results)} results to {args.out}")
+        return 0
+
+    rows = compare(load(args.baseline), load(args.current), args.threshold, noise_floor)
+    print_comparison(rows)
+    regressed = [row[0] for row in rows if row[4] == "regressed"]
+    if regressed:
+        print(f"{len(regressed)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    return 0
@@ -0,0 +1,269 @@
+"""
+Render benchmarks on the Agg backend.
+
+Each case builds one minigame or scene on a real figure, then times a
+frame: the game's _draw() plus a full canvas draw. Board games are timed
+at the size the story uses and at a scaled-up size, so costs that grow
+with the board show up. Their boards change before every frame, as in
+play; GridRenderer skips an unchanged board. The conversation and text
+scenes are timed the way the engine shows them.
+
+    python benchmarks/render_bench.py run --out baseline.json
+    python benchmarks/render_bench.py run --out current.json
+    python benchmarks/render_bench.py compare baseline.json current.json
+"""
+
+import os
+import sys
+import random
+import itertools
+from unittest.mock import patch
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import harness  # puts the repo root on sys.path
+from game import HEIGHT, WIDTH
+from scenes.assets import display_size, load_image
+from scenes.compositor import Compositor
+from scenes.conversation_cutscene import ConversationLayout, _sprite_extent
+from scenes.flappy_bird import FlappyBirdGame
+from scenes.minesweeper import MinesweeperGame
+from scenes.nine_puzzle import NinePuzzleGame
+from scenes.password_puzzle import PasswordPuzzleGame
+from scenes.pong_game import PongGame
+from scenes.snake_game import SnakeGame
+from scenes.tetris_game import COLOR_INDEX, TetrisGame
+from scenes.text_scene import text_scene
+from scenes.two_guards import TwoGuardsGame
+from sim_bench import long_snake
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+FIGSIZE = (12, 8)  # inches, as the game window opens
+DPI = 100
+SEED = 1234  # boards are random but the same on every run
+MINE_DENSITY = 10 / 96  # the story's 10 mines on a 12x8 board
+REVEALED_FRACTION = 0.5  # share of a Minesweeper board shown as revealed
+SNAKE_FILL = 0.25  # share of a Snake board the snake starts out covering
+ASSETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "assets")
+BACKGROUND = os.path.join(ASSETS, "valley.jpg")
+SPRITE = os.path.join(ASSETS, "character.jpg")
+
+TETRIS_SIZES = [(10, 20), (50, 100)]
+MINESWEEPER_SIZES = [(WIDTH, HEIGHT), (200, 200)]
+SNAKE_SIZES = [(20, 20), (100, 100)]
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+def make_figure():
+    fig = Figure(figsize=FIGSIZE, dpi=DPI)
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes((0, 0, 1, 1))
+    return fig, ax
+
+
+def frame(game, step=None):
+    """
+    One rendered frame of a minigame, as the engine's full redraw does it.
+
+    *step*, if given, changes the game state first. It is a cheap
+    assignment or single move, timed along with the frame.
+    """
+
+    def run():
+        if step is not None:
+            step()
+        game._draw()
+        game.fig.canvas.draw()
+
+    return run
+
+
+def seeded(setup):
+    """Seed both RNGs so every run benchmarks the same board."""
+
+    def wrapper():
+        random.seed(SEED)
+        return setup(np.random.default_rng(SEED))
+
+    return wrapper
+
+
+# ── Minigames ──────────────────────────────────────────────────────────────────
+
+
+def tetris(width: int, height: int):
+    def setup(rng):
+        fig, ax = make_figure()
+        game = TetrisGame(fig, ax, width=width, height=height)
+        # Lower half stacked with placed pieces, one gap per row so none clear
+        rows = height // 2
+        board = rng.integers(1, len(COLOR_INDEX) + 1, size=(rows, width))
+        board[np.arange(rows), rng.integers(0, width, size=rows)] = 0
+        game.board[:rows] = board
+
+        # Nudge the falling piece back and forth: piece and ghost both move
+        start = game.current_x
+        shift = itertools.cycle([1, 0])
+
+        def step():
+            game.current_x = start + next(shift)
+
+        return frame(game, step)
+
+    return seeded(setup)
+
+
+def minesweeper(width: int, height: int):
+    def setup(rng):
+        fig, ax = make_figure()
+        mines = max(1, round(width * height * MINE_DENSITY))
+        game = MinesweeperGame(fig, ax, width=width, height=height, num_mines=mines)
+        game._place_mines(0, 0)
+        game.revealed[:] = rng.random((height, width)) < REVEALED_FRACTION
+        game.revealed[game.board == -1] = False
+
+        # Flag and unflag a hidden cell, as right clicks do
+        hidden = np.argwhere(~game.revealed)[0]
+
+        def step():
+            game.flagged[tuple(hidden)] ^= True
+
+        return frame(game, step)
+
+    return seeded(setup)
+
+
+def snake(width: int, height: int):
+    def setup(rng):
+        fig, ax = make_figure()
+        game = SnakeGame(fig, ax, width=width, height=height)
+        cycle = long_snake(game, SNAKE_FILL)
+        game.food = game._generate_food()
+        turns = {
+            cell: (nxt[0] - cell[0], nxt[1] - cell[1])
+            for cell, nxt in zip(cycle, cycle[1:] + cycle[:1])
+        }
+
+        # Move one cell per frame along the cycle, eating and growing as it goes
+        def step():
+            if game.game_over:  # filled the board — start again
+                game.game_over = False
+                long_snake(game, SNAKE_FILL)
+                game.food = game._generate_food()
+            game._queued_dir = turns[game.snake[0]]
+            game._move_snake()
+
+        return frame(game, step)
+
+    return seeded(setup)
+
+
+def pong(rng):
+    fig, ax = make_figure()
+    return frame(PongGame(fig, ax, width=WIDTH, height=HEIGHT))
+
+
+def flappy_bird(rng):
+    fig, ax = make_figure()
+    game = FlappyBirdGame(fig, ax, width=WIDTH, height=HEIGHT)
+    for _ in range(3):
+        game._spawn_pipe()
+        game.pipes[-1]["x"] -= 4 * len(game.pipes)
+    return frame(game)
+
+
+def nine_puzzle(rng):
+    fig, ax = make_figure()
+    return frame(NinePuzzleGame(fig, ax))
+
+
+def password_puzzle(rng):
+    fig, ax = make_figure()
+    clues = ["It guards the gate", "Five letters", "Starts with the last"]
+    game = PasswordPuzzleGame(fig, ax, clues, "tower")
+    game.current_guess = "TOW"
+    return frame(game)
+
+
+def two_guards(rng):
+    fig, ax = make_figure()
+    return frame(TwoGuardsGame(fig, ax))
+
+
+# ── Scenes ─────────────────────────────────────────────────────────────────────
+
+
+def conversation(new_speaker: bool):
+    """
+    One dialogue line, composed and shown through ConversationLayout.
+
+    A new speaker means a freshly composed frame and a full canvas draw;
+    the same speaker again reuses the composed frame and blits the text.
+    """
+
+    def setup(rng):
+        fig, ax = make_figure()
+        ax.axis("off")
+        size = display_size(ax)
+        bg = load_image(BACKGROUND, size)
+        sprite = load_image(SPRITE, display_size(ax, _sprite_extent("left")))
+        compositor = Compositor(size)
+        layout = ConversationLayout(ax)
+
+        def run():
+            if new_speaker:
+                compositor.clear()
+            image = compositor.compose(
+                ("bench", "Keeper", "left"),
+                bg,
+                sprites=[(sprite, _sprite_extent("left"))],
+                dims=[(0.65, 1.0, 0.3)],
+            )
+            layout.show(image, "Keeper", "The gate opens only at dusk.", "left")
+
+        return run
+
+    return seeded(setup)
+
+
+def text(rng):
+    fig, ax = make_figure()
+    story_scene = {
+        "type": "text",
+        "location": "valley",
+        "title": "The Valley",
+        "content": [f"Line {i} of the opening text." for i in range(10)],
+    }
+    settings = {"valley": {"background": BACKGROUND}}
+
+    def run():
+        # The scene draws then waits for a key press — skip the wait
+        with patch("scenes.text_scene.wait_for_continue", return_value=True):
+            text_scene(ax, story_scene, settings)
+
+    return run
+
+
+# ── Cases ──────────────────────────────────────────────────────────────────────
+
+CASES = {
+    **{f"tetris {w}x{h}": tetris(w, h) for w, h in TETRIS_SIZES},
+    **{f"minesweeper {w}x{h}": minesweeper(w, h) for w, h in MINESWEEPER_SIZES},
+    **{f"snake {w}x{h}": snake(w, h) for w, h in SNAKE_SIZES},
+    f"pong {WIDTH}x{HEIGHT}": seeded(pong),
+    f"flappy_bird {WIDTH}x{HEIGHT}": seeded(flappy_bird),
+    "nine_puzzle": seeded(nine_puzzle),
+    "password_puzzle": seeded(password_puzzle),
+    "two_guards": seeded(two_guards),
+    "conversation new speaker": conversation(new_speaker=True),
+    "conversation same speaker": conversation(new_speaker=False),
+    "text_scene": seeded(text),
+}
+
+
+if __name__ == "__main__":
+    sys.exit(harness.main("render", CASES))
@@ -0,0 +1,311 @@
+"""
+Simulation-step microbenchmarks for the minigames' pure logic.
+
+Each case calls one game method on a prepared board, with no drawing.
+A result reports time per call, calls per second and memory: the peak
+bytes allocated during one call and the bytes each call leaves behind.
+Use it to judge an algorithm change to one of these methods.
+
+    python benchmarks/sim_bench.py run --out baseline.json
+    python benchmarks/sim_bench.py run --out current.json
+    python benchmarks/sim_bench.py compare baseline.json current.json
+"""
+
+import sys
+import time
+import random
+import tracemalloc
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import harness  # puts the repo root on sys.path
+from game import HEIGHT, WIDTH
+from scenes.minesweeper import MinesweeperGame
+from scenes.nine_puzzle import NinePuzzleGame
+from scenes.snake_game import SnakeGame
+from scenes.tetris_game import COLOR_INDEX, PIECES, TetrisGame
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+SEED = 1234  # boards are random but the same on every run
+MIN_BATCH_SECONDS = 0.01  # calls per sample grow until a sample takes this long
+ALLOC_CALLS = 20  # calls traced by tracemalloc, after the timing
+MINE_DENSITY = 10 / 96  # the story's 10 mines on a 12x8 board
+FULL_LINES = 4  # rows a Tetris line clear removes
+SNAKE_FILL = 0.9  # share of the board the snake covers — "near full"
+
+TETRIS_SIZES = [(10, 20), (50, 100)]
+MINESWEEPER_SIZES = [(WIDTH, HEIGHT), (200, 200)]
+SNAKE_SIZES = [(20, 20), (100, 100)]
+
+
+# ── Measurement ────────────────────────────────────────────────────────────────
+
+
+def calibrate(run) -> int:
+    """Calls per sample so one sample takes at least MIN_BATCH_SECONDS."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        if time.perf_counter() - start >= MIN_BATCH_SECONDS:
+            return number
+        number *= 2
+
+
+def allocations(run, calls: int = ALLOC_CALLS) -> dict:
+    """
+    Memory one call allocates, traced separately from the timing.
+
+    Python keeps no count of allocations, so tracemalloc's peak above the
+    memory in use before the call stands in for it: the most the call
+    had allocated at once. Net bytes are what each call leaves allocated.
+    """
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        run()  # allocate anything the first call caches
+        peaks = []
+        start, _ = tracemalloc.get_traced_memory()
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            run()
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return {
+        "alloc_peak_bytes": int(np.median(peaks)),
+        "alloc_net_bytes": round((end - start) / calls),
+    }
+
+
+def measure(run, repeat: int) -> dict:
+    result = harness.time_case(run, repeat, number=calibrate(run))
+    result["ops_per_sec"] = round(1000 / result["median_ms"])
+    result.update(allocations(run))
+    return result
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+def make_figure():
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
+def seeded(setup):
+    """Seed both RNGs so every run benchmarks the same board."""
+
+    def wrapper():
+        random.seed(SEED)
+        return setup(np.random.default_rng(SEED))
+
+    return wrapper
+
+
+def hamiltonian_cycle(width: int, height: int) -> list:
+    """
+    A closed path through every cell, for an even *height*.
+
+    Along the bottom row, back and forth up columns 1.. and down column 0.
+    A snake following it never hits itself, so a move can be timed forever.
+    """
+    cells = [(x, 0) for x in range(width)]
+    for y in range(1, height):
+        xs = range(width - 1, 0, -1) if y % 2 else range(1, width)
+        cells.extend((x, y) for x in xs)
+    cells.extend((0, y) for y in range(height - 1, 0, -1))
+    return cells
+
+
+def long_snake(game: SnakeGame, fill: float) -> list:
+    """Lay the snake along a Hamiltonian cycle; returns the cycle."""
+    cycle = hamiltonian_cycle(game.width, game.height)
+    length = int(len(cycle) * fill)
+    body = cycle[length - 1 :: -1]  # head first
+    game.snake.clear()
+    game.snake.extend(body)
+    game.snake_set = set(body)
+    return cycle
+
+
+# ── Tetris ─────────────────────────────────────────────────────────────────────
+
+
+def tetris_game(rng, width: int, height: int) -> TetrisGame:
+    """A game with the lower half stacked, one gap per row, and a T at spawn."""
+    fig, ax = make_figure()
+    game = TetrisGame(fig, ax, width=width, height=height)
+    rows = height // 2
+    board = rng.integers(1, len(COLOR_INDEX) + 1, size=(rows, width))
+    board[np.arange(rows), rng.integers(0, width, size=rows)] = 0
+    game.board[:rows] = board
+    game.current_piece = PIECES["T"]["shape"].copy()
+    game.current_color = "T"
+    game.current_x = width // 2 - 1
+    game.current_y = height - 1
+    return game
+
+
+def tetris_is_valid(width: int, height: int):
+    def setup(rng):
+        game = tetris_game(rng, width, height)
+        piece, x, y = game.current_piece, game.current_x, game.current_y
+        return lambda: game._is_valid(piece, x, y)
+
+    return seeded(setup)
+
+
+def tetris_ghost_y(width: int, height: int):
+    def setup(rng):
+        game = tetris_game(rng, width, height)
+        return game._ghost_y
+
+    return seeded(setup)
+
+
+def tetris_clear_lines(width: int, height: int):
+    def setup(rng):
+        game = tetris_game(rng, width, height)
+        game.board[1 : 1 + FULL_LINES] = COLOR_INDEX["I"]
+        board = game.board
+
+        def run():
+            # _clear_lines replaces the board — put the full one back first
+            game.board = board.copy()
+            game._clear_lines()
+
+        return run
+
+    return seeded(setup)
+
+
+# ── Minesweeper ────────────────────────────────────────────────────────────────
+
+
+def minesweeper_game(width: int, height: int) -> MinesweeperGame:
+    fig, ax = make_figure()
+    mines = max(1, round(width * height * MINE_DENSITY))
+    return MinesweeperGame(fig, ax, width=width, height=height, num_mines=mines)
+
+
+def minesweeper_place_mines(width: int, height: int):
+    def setup(rng):
+        game = minesweeper_game(width, height)
+
+        def run():
+            game.board.fill(0)
+            game._place_mines(width // 2, height // 2)
+
+        return run
+
+    return seeded(setup)
+
+
+def minesweeper_reveal_cell(width: int, height: int):
+    """Flood fill from the empty cell that opens the largest region."""
+
+    def setup(rng):
+        game = minesweeper_game(width, height)
+        game._place_mines(0, 0)
+        game.first_click = False
+
+        start, largest = None, 0
+        for y, x in np.argwhere(game.board == 0):
+            if game.revealed[y, x]:
+                continue
+            before = int(game.revealed.sum())
+            game._reveal_cell(int(x), int(y))
+            opened = int(game.revealed.sum()) - before
+            if opened > largest:
+                start, largest = (int(x), int(y)), opened
+
+        def run():
+            game.revealed.fill(False)
+            game._reveal_cell(*start)
+
+        return run
+
+    return seeded(setup)
+
+
+# ── Snake ──────────────────────────────────────────────────────────────────────
+
+
+def snake_move(width: int, height: int):
+    def setup(rng):
+        fig, ax = make_figure()
+        game = SnakeGame(fig, ax, width=width, height=height)
+        cycle = long_snake(game, SNAKE_FILL)
+        game.food = (-1, -1)  # off the board, so the snake never grows
+        turns = {
+            cell: (nxt[0] - cell[0], nxt[1] - cell[1])
+            for cell, nxt in zip(cycle, cycle[1:] + cycle[:1])
+        }
+
+        def run():
+            game._queued_dir = turns[game.snake[0]]
+            game._move_snake()
+
+        return run
+
+    return seeded(setup)
+
+
+def snake_generate_food(width: int, height: int):
+    def setup(rng):
+        fig, ax = make_figure()
+        game = SnakeGame(fig, ax, width=width, height=height)
+        long_snake(game, SNAKE_FILL)
+        return game._generate_food
+
+    return seeded(setup)
+
+
+# ── Nine puzzle ────────────────────────────────────────────────────────────────
+
+
+def nine_puzzle_is_solvable(rng):
+    fig, ax = make_figure()
+    game = NinePuzzleGame(fig, ax)
+    tiles = rng.permutation(game.tiles.size).reshape(game.tiles.shape)
+    return lambda: game._is_solvable(tiles)
+
+
+# ── Cases ──────────────────────────────────────────────────────────────────────
+
+CASES = {
+    **{f"tetris._is_valid {w}x{h}": tetris_is_valid(w, h) for w, h in TETRIS_SIZES},
+    **{f"tetris._ghost_y {w}x{h}": tetris_ghost_y(w, h) for w, h in TETRIS_SIZES},
+    **{
+        f"tetris._clear_lines {w}x{h}": tetris_clear_lines(w, h)
+        for w, h in TETRIS_SIZES
+    },
+    **{
+        f"minesweeper._place_mines {w}x{h}": minesweeper_place_mines(w, h)
+        for w, h in MINESWEEPER_SIZES
+    },
+    **{
+        f"minesweeper._reveal_cell {w}x{h}": minesweeper_reveal_cell(w, h)
+        for w, h in MINESWEEPER_SIZES
+    },
+    **{f"snake._move_snake {w}x{h}": snake_move(w, h) for w, h in SNAKE_SIZES},
+    **{
+        f"snake._generate_food {w}x{h}": snake_generate_food(w, h)
+        for w, h in SNAKE_SIZES
+    },
+    "nine_puzzle._is_solvable": seeded(nine_puzzle_is_solvable),
+}
+
+
+if __name__ == "__main__":
+    # Calls take microseconds — the render suite's absolute floor would hide them
+    sys.exit(harness.main("sim", CASES, measure=measure, noise_floor=0))
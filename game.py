@@ -1,52 +1,133 @@
 import matplotlib.pyplot as plt
+import argparse
+import importlib
+import importlib.metadata
 import sys
 import os
-import json
+import time
 import logging
+from contextlib import nullcontext
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from scenes.conversation_cutscene import conversation_cutscene
-from scenes.text_scene import text_scene
-from scenes.flappy_bird import FlappyBirdGame
-from scenes.minesweeper import MinesweeperGame
-from scenes.nine_puzzle import NinePuzzleGame
-from scenes.password_puzzle import PasswordPuzzleGame
-from scenes.pong_game import PongGame
-from scenes.snake_game import SnakeGame
-from scenes.tetris_game import TetrisGame
-from scenes.two_guards import TwoGuardsGame
+from scenes.assets import (
+    DiskCache,
+    asset_cache,
+    default_cache_dir,
+    display_size,
+    prefetch_images,
+)
+from scenes.clock import EngineClock
+from scenes.conversation_cutscene import conversation_assets, conversation_cutscene
+from scenes.hud import HUD_KEY, DebugHud
+from scenes.metrics import DEFAULT_METRICS_PATH, SessionMetrics
+from scenes.profiler import profiler
+from scenes.scene_profile import PROFILE_MODES, SceneProfiler
+from scenes.story import StoryError, load_story
+from scenes.trace import DEFAULT_TRACE_PATH, tracer
+from scenes.watchdog import WATCHDOG_MODES, LeakWatchdog
+from scenes.text_scene import text_scene, text_scene_assets
 
 # ── Constants ─────────────────────────────────────────────────────────────────
 WIDTH = 12
 HEIGHT = 8
 WINDOW_TITLE = "Adventures"
+PREFETCH_LOOKAHEAD = 2  # upcoming scenes whose images are decoded in the background
+TRACE_COUNTER_INTERVAL = 0.1  # seconds between artist / cache counter samples
 
 # ── Logging ───────────────────────────────────────────────────────────────────
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
 
 # ── Minigame registry ─────────────────────────────────────────────────────────
-# To add a new minigame: import it above, then add one line here.
+# To add a new minigame: add one "module:Class" line here. Modules are only
+# imported when a story first starts that game.
 MINIGAME_REGISTRY: dict = {
-    "flappy_bird": FlappyBirdGame,
-    "minesweeper": MinesweeperGame,
-    "nine_puzzle": NinePuzzleGame,
-    "password_puzzle": PasswordPuzzleGame,
-    "pong_game": PongGame,
-    "snake_game": SnakeGame,
-    "tetris_game": TetrisGame,
-    "two_guards": TwoGuardsGame,
+    "flappy_bird": "scenes.flappy_bird:FlappyBirdGame",
+    "minesweeper": "scenes.minesweeper:MinesweeperGame",
+    "nine_puzzle": "scenes.nine_puzzle:NinePuzzleGame",
+    "password_puzzle": "scenes.password_puzzle:PasswordPuzzleGame",
+    "pong_game": "scenes.pong_game:PongGame",
+    "snake_game": "scenes.snake_game:SnakeGame",
+    "tetris_game": "scenes.tetris_game:TetrisGame",
+    "two_guards": "scenes.two_guards:TwoGuardsGame",
 }
+BUILTIN_MINIGAMES = frozenset(MINIGAME_REGISTRY)
+
+# Installed packages can add minigames under this entry point group, e.g.
+#   [project.entry-points."matplotlib_engine.minigames"]
+#   chess = "my_games.chess:ChessGame"
+MINIGAME_ENTRY_POINT_GROUP = "matplotlib_engine.minigames"
+
+
+def register_plugins(group: str = MINIGAME_ENTRY_POINT_GROUP) -> list:
+    """
+    Add minigames advertised by installed packages to MINIGAME_REGISTRY.
+
+    Only the "module:Class" reference is recorded — nothing is imported
+    until the game is played. Built-in names cannot be replaced.
+    Returns the names that were added.
+    """
+    added = []
+    for entry_point in importlib.metadata.entry_points(group=group):
+        if entry_point.name in BUILTIN_MINIGAMES:
+            logger.warning(
+                "Ignoring plugin minigame %s from %s — name is built in",
+                entry_point.name,
+                entry_point.value,
+            )
+            continue
+        if entry_point.name in MINIGAME_REGISTRY:
+            continue  # registered by an earlier call
+        MINIGAME_REGISTRY[entry_point.name] = entry_point.value
+        added.append(entry_point.name)
+
+    if added:
+        logger.info("Plugin minigames: %s", ", ".join(sorted(added)))
+    return added
+
+
+def resolve_minigame(name: str):
+    """Return the class registered as *name*, importing it on first use."""
+    target = MINIGAME_REGISTRY.get(name)
+    if not isinstance(target, str):
+        return target
+
+    module_name, _, attr = target.partition(":")
+    try:
+        target = getattr(importlib.import_module(module_name), attr)
+    except (ImportError, AttributeError) as e:
+        logger.error("Cannot load minigame %s from %s: %s", name, module_name, e)
+        return None
+
+    MINIGAME_REGISTRY[name] = target
+    return target
 
 
 class SceneManager:
     """Owns scene state and dispatch logic, keeping Game focused on lifecycle."""
 
-    def __init__(self, scenes: list, characters: dict, settings: dict):
+    def __init__(
+        self,
+        scenes: list,
+        characters: dict,
+        settings: dict,
+        blit: bool = False,
+        lookahead: int = PREFETCH_LOOKAHEAD,
+        manifests: list | None = None,
+    ):
         self.scenes = scenes
         self.characters = characters
         self.settings = settings
+        self.blit = blit  # opt-in blitting for the animated minigames
+        self.lookahead = lookahead
+        self.manifests = manifests  # per-scene (path, extent) lists from the compiler
+        self.ax = None  # set once the figure exists; sizes prefetched images
+        self.clock = None  # the Game's EngineClock, shared by the animated minigames
+        self.watchdog = None  # optional LeakWatchdog checked after every scene
+        self.metrics = None  # optional SessionMetrics given one record per scene
+        self.outcome: dict = {}  # game, retries and score of the minigame just played
+        self.scene_profiler = None  # optional SceneProfiler for selected scenes
         self.index = 0
 
     @property
@@ -56,15 +137,93 @@ class SceneManager:
     def next(self) -> dict:
         scene = self.scenes[self.index]
         self.index += 1
+        # Decode what the following scenes need while this one waits for input
+        self.prefetch()
         return scene
 
+    # ── Asset prefetch ─────────────────────────────────────────────────────────
+
+    def scene_assets(self, scene: dict) -> list:
+        """Return the (path, extent) images a scene will load when it starts."""
+        scene_type = scene.get("type")
+
+        if scene_type == "conversation":
+            bg = self.settings.get(scene.get("location"), {}).get("background")
+            return conversation_assets(
+                bg, scene.get("conversation", []), self.characters
+            )
+
+        if scene_type == "text":
+            return text_scene_assets(scene, self.settings)
+
+        return []
+
+    def prefetch(self) -> list:
+        """Queue background decodes for the next `lookahead` scenes."""
+        requests = []
+        for i in range(self.index, min(self.index + self.lookahead, len(self.scenes))):
+            if self.manifests is not None:
+                manifest = self.manifests[i]
+            else:
+                manifest = self.scene_assets(self.scenes[i])
+            for path, extent in manifest:
+                requests.append((path, display_size(self.ax, extent)))
+        return prefetch_images(requests)
+
     def render(self, scene: dict, fig, ax) -> bool:
         """Render a scene. Returns False if the game should stop."""
+        label = self.scene_label(scene)
+        self.outcome = {}
+        if self.metrics is not None:
+            self.metrics.begin_scene()
+        profiler.begin_scene(label)
+        self.trace_counters()
+        completed = False
+        try:
+            with tracer.span(label, "scene"), self._profile_scene(scene, label):
+                result = self._render(scene, fig, ax)
+            completed = True
+        finally:
+            profiler.end_scene()
+            self.trace_counters()
+            # Closing the window exits mid-scene — still record what was played
+            if self.metrics is not None:
+                if not completed:
+                    self.outcome["interrupted"] = True
+                self.metrics.end_scene(
+                    self.index - 1, scene.get("type"), label, **self.outcome
+                )
+
+        if self.watchdog is not None:
+            self.watchdog.check(label)
+        return result
+
+    def _profile_scene(self, scene: dict, label: str):
+        if self.scene_profiler is None:
+            return nullcontext()
+        # next() has already advanced the index — it is the scene's number from 1
+        return self.scene_profiler.profile(self.index, scene, label)
+
+    def trace_counters(self) -> None:
+        """Sample the artist count and asset cache size into the trace."""
+        if not tracer.enabled:
+            return
+        if self.ax is not None:
+            tracer.counter("artists", count=len(self.ax.get_children()))
+        tracer.counter("asset cache", MB=asset_cache.stats()["bytes"] / 1e6)
+
+    @staticmethod
+    def scene_label(scene: dict) -> str:
+        """A short name for log lines, e.g. "minigame snake_game"."""
+        detail = scene.get("game") or scene.get("location") or scene.get("title")
+        return f"{scene.get('type')} {detail}" if detail else str(scene.get("type"))
+
+    def _render(self, scene: dict, fig, ax) -> bool:
         scene_type = scene.get("type")
 
         if scene_type == "conversation":
             location = scene.get("location")
-            bg = self.settings[location].get("background")
+            bg = self.settings.get(location, {}).get("background")
             conversation_cutscene(ax, bg, scene["conversation"], self.characters)
 
         elif scene_type == "text":
@@ -83,7 +242,7 @@ class SceneManager:
 
     def _run_minigame(self, scene: dict, fig, ax) -> None:
         minigame_name = scene.get("game")
-        minigame_cls = MINIGAME_REGISTRY.get(minigame_name)
+        minigame_cls = resolve_minigame(minigame_name)
 
         if minigame_cls is None:
             logger.error("Unknown minigame: %s — skipping", minigame_name)
@@ -96,7 +255,9 @@ class SceneManager:
         if minigame_name == "flappy_bird":
             target_score = scene.get("score_to_beat", 10)
             score = 0
+            attempts = 0
             while score < target_score:
+                attempts += 1
                 game = minigame_cls(
                     fig,
                     ax,
@@ -105,12 +266,17 @@ class SceneManager:
                     height=HEIGHT,
                     victory_message=scene.get("victory_message", "You win!"),
                     defeat_message=scene.get("defeat_message", "You lose!"),
+                    blit=self.blit,
+                    clock=self.clock,
                 )
-                score = game.run()
+                score = self._play(minigame_name, game)
+            self.outcome.update(retries=attempts - 1)
 
         elif minigame_name == "minesweeper":
             game_won = False
+            attempts = 0
             while not game_won:
+                attempts += 1
                 game = minigame_cls(
                     fig,
                     ax,
@@ -118,7 +284,8 @@ class SceneManager:
                     height=HEIGHT,
                     num_mines=scene.get("num_mines", 10),
                 )
-                game_won = game.run()
+                game_won = self._play(minigame_name, game)
+            self.outcome.update(retries=attempts - 1)
 
         elif minigame_name == "password_puzzle":
             game = minigame_cls(
@@ -128,23 +295,64 @@ class SceneManager:
                 scene.get("password"),
                 max_attempts=scene.get("max_attempts", 10),
             )
-            game.run()
+            self._play(minigame_name, game)
 
         elif minigame_name in ("nine_puzzle", "two_guards"):
             # These games have fixed dimensions, no width/height args
             game = minigame_cls(fig, ax)
-            game.run()
+            self._play(minigame_name, game)
+
+        elif minigame_name in BUILTIN_MINIGAMES:
+            game = minigame_cls(
+                fig,
+                ax,
+                width=WIDTH,
+                height=HEIGHT,
+                blit=self.blit,
+                clock=self.clock,
+            )
+            self._play(minigame_name, game)
 
         else:
-            game = minigame_cls(fig, ax, width=WIDTH, height=HEIGHT)
-            game.run()
+            # Plugin minigames follow the basic (fig, ax) + run() contract
+            game = minigame_cls(fig, ax)
+            self._play(minigame_name, game)
+
+    def _play(self, name: str, game):
+        with tracer.span(f"{name}.run", "minigame"):
+            result = game.run()
+        self.outcome.update(game=name, score=getattr(game, "score", None))
+        self.outcome.setdefault("retries", 0)
+        return result
 
 
 class Game:
-    def __init__(self):
+    def __init__(
+        self,
+        blit: bool = False,
+        cache_dir: str | None = None,
+        profile: bool = False,
+        trace: str | None = None,
+        watchdog: str | None = None,
+        metrics: str | None = None,
+        profile_scene: str | None = None,
+        profile_mode: str = "cprofile",
+    ):
         self.running = False
         self.figure_closed = False
         self.space_pressed = False
+        self.blit = blit
+        self.cache_dir = cache_dir  # keeps the compiled story between runs
+        self.profile = profile  # log per-phase frame timings after each scene
+        self.trace = trace  # where to write a Chrome trace of the playthrough
+        self.watchdog = watchdog  # None, "warn" or "strict" about leaks between scenes
+        self.metrics = metrics  # where to append one JSON record per scene
+        self.profile_scene = profile_scene  # index, type or game to profile
+        self.profile_mode = profile_mode
+        self._counters_at = 0.0
+
+        if self.trace:
+            tracer.start(self.trace)
 
         self._load_story()
         self._init_renderer()
@@ -156,26 +364,40 @@ class Game:
         base_path = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
         story_path = os.path.join(base_path, "data", "story.json")
 
+        register_plugins()
         try:
-            with open(story_path, encoding="utf-8") as f:
-                story = json.load(f)
+            with tracer.span("load story"):
+                story = load_story(
+                    story_path,
+                    base_path,
+                    cache_dir=self.cache_dir,
+                    minigames=MINIGAME_REGISTRY,
+                )
         except FileNotFoundError:
             logger.error("story.json not found at %s", story_path)
             sys.exit(1)
-        except json.JSONDecodeError as e:
-            logger.error("story.json is malformed: %s", e)
+        except StoryError as e:
+            logger.error("story.json has %d problem(s):", len(e.problems))
+            for problem in e.problems:
+                logger.error("  %s", problem)
             sys.exit(1)
 
-        characters = story.get("characters", {})
-        settings = story.get("settings", {})
-        scenes = story.get("scenes", [])
-
-        # Normalise scenes — accept both list and dict formats
-        if isinstance(scenes, dict):
-            scenes = list(scenes.values())
-
-        self.scene_manager = SceneManager(scenes, characters, settings)
-        logger.info("Loaded %d scenes", len(scenes))
+        self.scene_manager = SceneManager(
+            story.scenes,
+            story.characters,
+            story.settings,
+            blit=self.blit,
+            manifests=story.manifests,
+        )
+        if self.profile_scene:
+            self.scene_manager.scene_profiler = SceneProfiler(
+                self.profile_scene, self.profile_mode
+            )
+        logger.info(
+            "Loaded %d scenes across %d locations",
+            len(story.scenes),
+            len(story.locations),
+        )
 
     # ── Renderer ───────────────────────────────────────────────────────────────
 
@@ -185,10 +407,38 @@ class Game:
         self.ax.margins(0)
         self.fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
         self.fig.canvas.manager.set_window_title(WINDOW_TITLE)
+        self.scene_manager.ax = self.ax
+        self.clock = EngineClock(self.fig)
+        self.scene_manager.clock = self.clock
+        if self.profile:
+            profiler.enable(self.fig)
+        if self.trace:
+            profiler.watch(self._on_trace_frame, self.fig)
+        self.hud = DebugHud(self.fig, self.ax)
+        if self.metrics:
+            self._enable_metrics(self.metrics)
+        if self.watchdog:
+            self.scene_manager.watchdog = LeakWatchdog(
+                self.fig, self.ax, strict=self.watchdog == "strict"
+            )
 
         self.fig.canvas.mpl_connect("close_event", self.on_figure_close)
         self.fig.canvas.mpl_connect("key_press_event", self.on_key_press)
 
+    def _enable_metrics(self, path: str) -> None:
+        try:
+            self.scene_manager.metrics = SessionMetrics(self.fig, path, self.clock)
+        except OSError as e:
+            logger.warning("Scene metrics unavailable at %s: %s", path, e)
+        else:
+            logger.info("Scene metrics: %s", path)
+
+    def _on_trace_frame(self, phases: tuple) -> None:
+        now = time.perf_counter()
+        if now - self._counters_at >= TRACE_COUNTER_INTERVAL:
+            self._counters_at = now
+            self.scene_manager.trace_counters()
+
     # ── Event handlers ─────────────────────────────────────────────────────────
 
     def on_figure_close(self, event) -> None:
@@ -203,6 +453,8 @@ class Game:
     def on_key_press(self, event) -> None:
         if event.key in (" ", "space"):
             self.space_pressed = True
+        elif event.key == HUD_KEY:
+            self.hud.toggle()
 
     def is_figure_closed(self) -> bool:
         if self.figure_closed:
@@ -231,12 +483,146 @@ class Game:
         self.cleanup()
 
     def cleanup(self) -> None:
+        self.clock.detach()
+        if self.scene_manager.watchdog is not None:
+            self.scene_manager.watchdog.close()
+        if self.scene_manager.metrics is not None:
+            self.scene_manager.metrics.close()
+        asset_cache.shutdown()
+        stats = asset_cache.stats()
+        logger.info(
+            "Asset cache: %d hits, %d misses, %d prefetched, %d evictions, "
+            "%.1f MB held",
+            stats["hits"],
+            stats["misses"],
+            stats["prefetched"],
+            stats["evictions"],
+            stats["bytes"] / 1e6,
+        )
+        if "disk_hits" in stats:
+            logger.info(
+                "Asset disk cache: %d hits, %d misses, %d written",
+                stats["disk_hits"],
+                stats["disk_misses"],
+                stats["disk_writes"],
+            )
+        if self.trace:
+            tracer.save()
+            tracer.stop()
         logger.info("Game exiting cleanly")
         plt.close("all")
 
 
+def _env_choice(name: str, choices, default: str | None) -> str | None:
+    """An option default from the environment; argparse does not check defaults."""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    if value not in choices:
+        logger.warning(
+            "Ignoring %s=%s — expected one of %s", name, value, ", ".join(choices)
+        )
+        return default
+    return value
+
+
+def parse_args(argv: list | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the story in data/story.json.")
+    parser.add_argument(
+        "--blit",
+        action="store_true",
+        default=os.environ.get("ENGINE_BLIT") == "1",
+        help="redraw only moving sprites over a cached background "
+        "(also enabled by ENGINE_BLIT=1)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=os.environ.get("ENGINE_PROFILE") == "1",
+        help="log p50/p95/p99 update, build and rasterize times after each scene "
+        "(also enabled by ENGINE_PROFILE=1)",
+    )
+    parser.add_argument(
+        "--trace",
+        nargs="?",
+        const=DEFAULT_TRACE_PATH,
+        default=os.environ.get("ENGINE_TRACE"),
+        metavar="PATH",
+        help="write a Chrome/Perfetto trace of the playthrough "
+        f"(default {DEFAULT_TRACE_PATH}; also set by ENGINE_TRACE=PATH)",
+    )
+    parser.add_argument(
+        "--watchdog",
+        nargs="?",
+        const="warn",
+        choices=WATCHDOG_MODES,
+        default=_env_choice("ENGINE_WATCHDOG", WATCHDOG_MODES, None),
+        help="check callbacks, artists, animations and heap growth after each "
+        "scene; strict stops the game on a leak (also set by ENGINE_WATCHDOG)",
+    )
+    parser.add_argument(
+        "--metrics",
+        nargs="?",
+        const=DEFAULT_METRICS_PATH,
+        default=os.environ.get("ENGINE_METRICS"),
+        metavar="PATH",
+        help="append one JSON line of performance metrics per scene "
+        f"(default {DEFAULT_METRICS_PATH}; also set by ENGINE_METRICS=PATH)",
+    )
+    parser.add_argument(
+        "--profile-scene",
+        default=os.environ.get("ENGINE_PROFILE_SCENE"),
+        metavar="SCENE",
+        help="profile the scenes matching a scene number (from 1, as in story "
+        "errors), scene type or game name (* for all) into profiles/ "
+        "(also set by ENGINE_PROFILE_SCENE)",
+    )
+    parser.add_argument(
+        "--profile-mode",
+        choices=PROFILE_MODES,
+        default=_env_choice("ENGINE_PROFILE_MODE", PROFILE_MODES, "cprofile"),
+        help="cprofile writes .pstats and .folded files; sample writes only the "
+        "low-overhead sampled .folded stacks (default cprofile)",
+    )
+    parser.add_argument(
+        "--asset-cache-dir",
+        default=default_cache_dir(),
+        metavar="DIR",
+        help="where decoded images and the compiled story are kept between runs "
+        "(default: ENGINE_ASSET_CACHE_DIR or ~/.cache/matplotlib-engine/assets)",
+    )
+    parser.add_argument(
+        "--no-asset-cache",
+        action="store_true",
+        help="decode every image and recompile the story on each launch",
+    )
+    return parser.parse_args(argv)
+
+
+def _enable_disk_cache(directory: str) -> None:
+    try:
+        asset_cache.disk = DiskCache(directory)
+    except OSError as e:
+        logger.warning("Asset disk cache unavailable at %s: %s", directory, e)
+    else:
+        logger.info("Asset disk cache: %s", directory)
+
+
 def main() -> None:
-    game = Game()
+    args = parse_args()
+    cache_dir = None if args.no_asset_cache else args.asset_cache_dir
+    if cache_dir:
+        _enable_disk_cache(cache_dir)
+    game = Game(
+        blit=args.blit,
+        cache_dir=cache_dir,
+        profile=args.profile,
+        trace=args.trace,
+        watchdog=args.watchdog,
+        metrics=args.metrics,
+        profile_scene=args.profile_scene,
+        profile_mode=args.profile_mode,
+    )
     game.run()
 
 
@@ -1,4 +1,5 @@
 # -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_submodules
 
 
 a = Analysis(
@@ -6,7 +7,8 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('assets', 'assets'), ('data', 'data')],
-    hiddenimports=[],
+    # Minigames are imported lazily by name, so analysis cannot see them
+    hiddenimports=collect_submodules('scenes'),
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
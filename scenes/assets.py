@@ -0,0 +1,421 @@
+import os
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+import numpy as np
+import matplotlib.image as mpimg
+from PIL import Image
+
+from scenes.trace import tracer
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+ASSET_CACHE_BYTES = 256 * 1024 * 1024  # decoded-pixel budget shared by all scenes
+PREFETCH_WORKERS = 2  # background decoder threads
+FULL_EXTENT = (0, 1, 0, 1)  # [x0, x1, y0, y1] in axes fractions
+MIN_SHRINK_SAVING = 0.25  # skip resizes that would drop fewer pixels than this
+DISK_CACHE_BYTES = 512 * 1024 * 1024  # on-disk budget for decoded arrays
+DISK_CACHE_VERSION = 1  # bump when decoding changes so old entries are ignored
+
+
+def display_size(ax, extent=FULL_EXTENT) -> tuple | None:
+    """
+    Return the (width, height) in pixels that *extent* covers on screen.
+
+    extent is given in axes fractions, as the scene renderers use it.
+    Returns None without an axes, meaning "decode at full resolution".
+    """
+    if ax is None:
+        return None
+    fig = ax.figure
+    box = ax.get_position()
+    fig_w, fig_h = fig.get_size_inches() * fig.dpi
+    x0, x1, y0, y1 = extent
+    return (
+        max(1, round(fig_w * box.width * abs(x1 - x0))),
+        max(1, round(fig_h * box.height * abs(y1 - y0))),
+    )
+
+
+def _asset_key(path: str | None, size: tuple | None = None) -> tuple | None:
+    """Return the cache key for *path*, or None if the file is missing."""
+    if not path:
+        return None
+    try:
+        return os.path.realpath(path), os.stat(path).st_mtime_ns, size
+    except OSError:
+        return None
+
+
+def _decode_scaled(path: str, size: tuple) -> np.ndarray:
+    """
+    Decode *path* straight to at most *size* pixels as a uint8 array.
+
+    JPEG draft mode lets the decoder skip to the nearest 1/2, 1/4 or 1/8
+    scale that still covers *size*, so large photos are never expanded to
+    full resolution. The rest is a box-filter shrink, skipped when the
+    image is already close to *size*. Images are never enlarged.
+    """
+    with Image.open(path) as img:
+        img.draft(img.mode, size)
+        keep_alpha = "A" in img.getbands() or "transparency" in img.info
+        img = img.convert("RGBA" if keep_alpha else "RGB")
+        target = (min(size[0], img.width), min(size[1], img.height))
+        saving = 1 - (target[0] * target[1]) / (img.width * img.height)
+        if saving >= MIN_SHRINK_SAVING:
+            img = img.resize(target, Image.Resampling.BOX)
+        return np.asarray(img)
+
+
+def _heap_nbytes(image: np.ndarray) -> int:
+    """Bytes *image* holds in process memory; a disk cache memory map holds none."""
+    return 0 if isinstance(image, np.memmap) else image.nbytes
+
+
+def default_cache_dir() -> str:
+    """Return ENGINE_ASSET_CACHE_DIR, or a matplotlib-engine folder in the user cache."""
+    override = os.environ.get("ENGINE_ASSET_CACHE_DIR")
+    if override:
+        return override
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "matplotlib-engine", "assets")
+
+
+class DiskCache:
+    """
+    Content-addressed store of decoded images as .npy files.
+
+    File names combine a SHA-1 of the source bytes with the decoded size and
+    dtype, so an edited source simply maps to a new entry. Entries are
+    opened with np.load(mmap_mode="r"): a cold start skips decoding and pages
+    are only read in as scenes display them. Files are written atomically,
+    and the least recently used ones are pruned past max_bytes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DISK_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._digests: dict = {}  # (realpath, mtime_ns) -> source SHA-1
+        self._writable = True
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self.prune()
+
+    # ── Keys ───────────────────────────────────────────────────────────────────
+
+    def _digest(self, path: str) -> str:
+        stat = os.stat(path)
+        memo_key = (os.path.realpath(path), stat.st_mtime_ns)
+        digest = self._digests.get(memo_key)
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = hashlib.file_digest(f, "sha1").hexdigest()
+            self._digests[memo_key] = digest
+        return digest
+
+    def entry_path(self, path: str, size: tuple, dtype: str = "uint8") -> str:
+        width, height = size
+        name = (
+            f"{self._digest(path)}-{width}x{height}-{dtype}-v{DISK_CACHE_VERSION}.npy"
+        )
+        return os.path.join(self.directory, name)
+
+    # ── Entries ────────────────────────────────────────────────────────────────
+
+    def load(self, path: str, size: tuple):
+        """Return a read-only memory map of the cached image, or None."""
+        entry = self.entry_path(path, size)
+        try:
+            image = np.load(entry, mmap_mode="r")
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Discarding unreadable cache entry %s: %s", entry, e)
+            self._unlink(entry)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._touch(entry)
+        return image
+
+    def store(self, path: str, size: tuple, image: np.ndarray) -> None:
+        """Write *image* for (path, size); failures only disable the disk cache."""
+        if not self._writable:
+            return
+        entry = self.entry_path(path, size, image.dtype.name)
+        tmp = None
+        try:
+            # Write beside the entry and rename, so readers never see half a file
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, image, allow_pickle=False)
+            os.replace(tmp, entry)
+        except OSError as e:
+            logger.warning("Asset disk cache disabled — cannot write: %s", e)
+            self._writable = False
+            if tmp is not None:
+                self._unlink(tmp)
+            return
+        self.writes += 1
+
+    def _touch(self, entry: str) -> None:
+        try:
+            os.utime(entry)
+        except OSError:
+            pass  # read-only cache directory — recency is best effort
+
+    def _unlink(self, entry: str) -> None:
+        try:
+            os.remove(entry)
+        except OSError:
+            pass
+
+    # ── Housekeeping ───────────────────────────────────────────────────────────
+
+    def prune(self) -> int:
+        """Delete least recently used entries beyond max_bytes. Returns the count."""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith((".npy", ".tmp")) and entry.is_file():
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, entry in sorted(files):
+            if total <= self.max_bytes:
+                break
+            self._unlink(entry)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.debug("Pruned %d asset cache files", removed)
+        return removed
+
+
+class AssetCache:
+    """
+    Process-wide LRU cache of decoded images.
+
+    Entries are keyed by resolved path, modification time and display size,
+    so an edited file is decoded again while an unchanged one is shared by
+    every scene that shows it at that size. Least recently used entries are
+    evicted once the decoded arrays exceed max_bytes.
+
+    prefetch() decodes images on a small thread pool ahead of time. A load()
+    for an image that is still being prefetched waits for that decode
+    instead of starting a second one.
+    """
+
+    def __init__(
+        self, max_bytes: int = ASSET_CACHE_BYTES, disk: DiskCache | None = None
+    ):
+        self.max_bytes = max_bytes
+        self.disk = disk  # decoded arrays persisted between runs, if set
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._heap_bytes = 0  # _bytes less the memory-mapped disk cache entries
+        self._lock = threading.Lock()
+        self._pending: dict = {}  # key -> Future of an in-flight prefetch
+        self._executor: ThreadPoolExecutor | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prefetched = 0
+        self.load_seconds = 0.0  # time callers of load() spent waiting
+
+    # ── Lookup ─────────────────────────────────────────────────────────────────
+
+    def load(self, path: str | None, size: tuple | None = None):
+        """
+        Return the decoded image at *path*, or None if missing or invalid.
+
+        With a (width, height) *size* the image is decoded at that display
+        resolution as uint8; without one it is read at full resolution.
+        """
+        start = time.perf_counter()
+        try:
+            return self._load(path, size)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.load_seconds += elapsed
+
+    def _load(self, path: str | None, size: tuple | None):
+        key = _asset_key(path, size)
+        if key is None:
+            if path:
+                logger.warning("Image not found: %s", path)
+            return None
+
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return image
+            pending = self._pending.get(key)
+
+        if pending is not None:
+            # A background decode is already running — wait for it
+            try:
+                image = pending.result()
+            except CancelledError:
+                pass  # dropped by shutdown() before it started
+            else:
+                with self._lock:
+                    self.hits += 1
+                return image
+
+        with self._lock:
+            self.misses += 1
+        return self._decode(key, path)
+
+    def _decode(self, key: tuple, path: str):
+        size = key[2]
+        # Only display-sized uint8 decodes are worth persisting
+        disk = self.disk if size is not None else None
+
+        with tracer.span("decode", "assets", path=os.path.basename(path)):
+            image = disk.load(path, size) if disk is not None else None
+            if image is None:
+                try:
+                    if size is None:
+                        image = mpimg.imread(path)
+                    else:
+                        image = _decode_scaled(path, size)
+                except Exception as e:
+                    logger.error("Failed to load image %s: %s", path, e)
+                    return None
+                if disk is not None:
+                    disk.store(path, size, image)
+
+        # Arrays are shared between scenes — guard against in-place edits
+        image.flags.writeable = False
+        with self._lock:
+            self._store(key, image)
+        return image
+
+    def _store(self, key: tuple, image) -> None:
+        # Caller holds self._lock
+        if key in self._entries:
+            return
+        if image.nbytes > self.max_bytes:
+            logger.debug("Image %s exceeds the cache budget — not cached", key[0])
+            return
+
+        self._entries[key] = image
+        self._bytes += image.nbytes
+        self._heap_bytes += _heap_nbytes(image)
+
+        while self._bytes > self.max_bytes:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self._heap_bytes -= _heap_nbytes(evicted)
+            self.evictions += 1
+            logger.debug("Evicted %s from asset cache", evicted_key[0])
+
+    # ── Prefetch ───────────────────────────────────────────────────────────────
+
+    def prefetch(self, requests) -> list:
+        """
+        Start decoding images in the background.
+
+        Each request is a path or a (path, size) pair as passed to load().
+        Images already cached or in flight are skipped. Returns the futures
+        of the decodes that were started.
+        """
+        started = []
+        for request in requests:
+            path, size = request if isinstance(request, tuple) else (request, None)
+            key = _asset_key(path, size)
+            if key is None:
+                continue
+            with self._lock:
+                if key in self._entries or key in self._pending:
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=PREFETCH_WORKERS,
+                        thread_name_prefix="asset-prefetch",
+                    )
+                future = self._executor.submit(self._prefetch_one, key, path)
+                self._pending[key] = future
+            started.append(future)
+        return started
+
+    def _prefetch_one(self, key: tuple, path: str):
+        try:
+            image = self._decode(key, path)
+            with self._lock:
+                self.prefetched += 1
+            return image
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def shutdown(self) -> None:
+        """Cancel queued prefetches and stop the decoder threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            self._pending.clear()
+
+    # ── Bookkeeping ────────────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "prefetched": self.prefetched,
+                "load_ms": self.load_seconds * 1000,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "heap_bytes": self._heap_bytes,
+                "max_bytes": self.max_bytes,
+            }
+        if self.disk is not None:
+            stats["disk_hits"] = self.disk.hits
+            stats["disk_misses"] = self.disk.misses
+            stats["disk_writes"] = self.disk.writes
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._heap_bytes = 0
+
+
+# One cache for the whole process — conversation and text scenes share it
+asset_cache = AssetCache()
+
+
+def load_image(path: str | None, size: tuple | None = None):
+    """Load an image through the shared cache, returning None if missing or invalid."""
+    return asset_cache.load(path, size)
+
+
+def prefetch_images(requests) -> list:
+    """Decode paths or (path, size) pairs into the shared cache in the background."""
+    return asset_cache.prefetch(requests)
@@ -0,0 +1,74 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class BlitManager:
+    """
+    Redraws only the moving artists of a figure on top of a cached background.
+
+    The static background (sky, grid, centre line, axes frame) is rasterized
+    once and saved with canvas.copy_from_bbox. Every frame restores that
+    snapshot, draws the animated artists and blits the result, so frame time
+    tracks the number of sprites rather than the pixel size of the figure.
+    The snapshot is only retaken after a resize_event.
+    """
+
+    def __init__(self, fig):
+        self.fig = fig
+        self.canvas = fig.canvas
+        self._background = None
+        self._animated: set = set()
+        self._resize_cid = self.canvas.mpl_connect("resize_event", self._on_resize)
+
+    # ── Background ─────────────────────────────────────────────────────────────
+
+    def _on_resize(self, event) -> None:
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Retake the background on the next frame, e.g. after static artists changed."""
+        self._background = None
+
+    def _capture(self) -> None:
+        # Animated artists are skipped by a full draw, leaving only the static scene
+        self.canvas.draw()
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        logger.debug("Blit background cached")
+
+    # ── Frames ─────────────────────────────────────────────────────────────────
+
+    def update(self, artists) -> None:
+        """Draw one frame containing *artists* over the cached background."""
+        # The axes frame sits above sprites that touch the edge, so it moves
+        # out of the background and is redrawn with them
+        artists = list(artists)
+        for ax in {a.axes for a in artists if a.axes is not None}:
+            artists.extend(ax.spines.values())
+
+        for artist in artists:
+            if artist not in self._animated:
+                artist.set_animated(True)
+                self._animated.add(artist)
+
+        if self._background is None:
+            self._capture()
+        else:
+            self.canvas.restore_region(self._background)
+
+        # Match the stacking order a full draw would use
+        for artist in sorted(artists, key=lambda a: a.get_zorder()):
+            if artist.get_visible():
+                self.fig.draw_artist(artist)
+
+        self.canvas.blit(self.fig.bbox)
+        self.canvas.flush_events()
+
+    def close(self) -> None:
+        """Hand the artists back to normal drawing, e.g. for an end screen."""
+        self.canvas.mpl_disconnect(self._resize_cid)
+        for artist in self._animated:
+            artist.set_animated(False)
+        self._animated.clear()
+        self._background = None
+        self.canvas.draw_idle()
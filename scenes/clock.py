@@ -0,0 +1,305 @@
+import time
+import logging
+from collections import deque
+
+import numpy as np
+
+from scenes.blit import BlitManager
+from scenes.events import wait_for_continue, wait_until, wake
+from scenes.profiler import profiler
+from scenes.quality import QualityGovernor
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+DEFAULT_INTERVAL = 30  # ms between ticks when a scene does not ask for a rate
+INTERVAL_HISTORY = 512  # recent tick intervals kept for stats()
+MAX_STEPS_PER_TICK = 5  # fixed steps run per tick before lagging time is dropped
+
+
+def lerp(previous: float, current: float, alpha: float) -> float:
+    """Blend a fixed-step value between its previous and current state."""
+    return previous + (current - previous) * alpha
+
+
+class EngineClock:
+    """
+    The engine's single frame timer.
+
+    Game owns one clock for the lifetime of the window. A running scene is
+    attached to it and, on every tick, the clock calls scene.update(dt)
+    with the measured seconds since the last tick, then scene.render(1.0),
+    and finally presents the frame — through the scene's BlitManager if it
+    has one, otherwise with a full draw_idle. When scene.finished turns
+    true the clock wakes the scene's wait_until.
+
+    A scene attached with a fixed *step* is simulated at a constant rate
+    instead: elapsed time accumulates and scene.update(step) runs as many
+    times as it covers, then scene.render(alpha) draws once, with alpha the
+    fraction of a step left over for interpolating between the last two
+    states. A slow frame therefore costs frames, not game speed.
+
+    A scene may expose a version that its mutations bump. While the
+    version is unchanged since the last render, ticks skip rendering
+    altogether; scenes without one, or with version None, render on every
+    tick.
+
+    The clock also times every frame and reports it to a QualityGovernor,
+    which skips renders while frames run late and lowers render quality
+    if they keep doing so.
+
+    The timer itself is created once; between scenes it is only paused, so
+    idle screens cost nothing and no scene builds or tears down a timer.
+    """
+
+    def __init__(
+        self,
+        fig,
+        interval: int = DEFAULT_INTERVAL,
+        quality: QualityGovernor | None = None,
+    ):
+        self.fig = fig
+        self.interval = interval
+        self.quality = quality or QualityGovernor()
+        self._timer = fig.canvas.new_timer(interval=interval)
+        self._timer.add_callback(self._tick)
+        self._running = False
+
+        self._scene = None
+        self._blitter = None
+        self._last_tick = None
+        self._step = None
+        self._accumulator = 0.0
+        self.intervals: deque = deque(maxlen=INTERVAL_HISTORY)
+        self.ticks = 0
+        self.steps = 0
+        self.dropped = 0.0  # seconds of simulation skipped to keep up
+        self.unchanged = 0  # ticks that skipped rendering an unchanged scene
+        self.frames_skipped = 0  # renders skipped to catch up, over all scenes
+        self._drawn_version = None
+
+    # ── Scenes ─────────────────────────────────────────────────────────────────
+
+    def attach(
+        self,
+        scene,
+        interval: int | None = None,
+        blitter=None,
+        step: float | None = None,
+    ) -> None:
+        """
+        Start driving *scene*, ticking every *interval* ms.
+
+        With *step* (seconds) the scene is simulated at that fixed rate,
+        independent of how often the clock actually manages to tick.
+        """
+        self._scene = scene
+        self._blitter = blitter
+        self._step = step
+        self._accumulator = 0.0
+        self.intervals.clear()
+        self.ticks = 0
+        self.steps = 0
+        self.dropped = 0.0
+        self.unchanged = 0
+        self._drawn_version = None
+
+        interval = interval or DEFAULT_INTERVAL
+        if interval != self.interval:
+            self.interval = interval
+            self._timer.interval = interval
+
+        self.quality.attach(self.fig, scene)
+        self._last_tick = time.perf_counter()
+        if not self._running:
+            self._timer.start()
+            self._running = True
+
+    def detach(self) -> None:
+        """Stop driving the current scene and pause the timer until the next one."""
+        if self._scene is not None and self.ticks:
+            stats = self.stats()
+            logger.info(
+                "Clock: %d ticks, %d steps for %s — mean %.1f ms, max %.1f ms "
+                "(target %d ms), %d unchanged, %d renders skipped, %.0f ms of "
+                "simulation dropped, quality %s",
+                stats["ticks"],
+                stats["steps"],
+                type(self._scene).__name__,
+                stats["mean_ms"],
+                stats["max_ms"],
+                self.interval,
+                stats["unchanged"],
+                stats["skipped"],
+                stats["dropped_ms"],
+                self.quality.settings["name"],
+            )
+        self.quality.detach()
+        self._scene = None
+        self._blitter = None
+        if self._running:
+            self._timer.stop()
+            self._running = False
+
+    # ── Ticks ──────────────────────────────────────────────────────────────────
+
+    def _tick(self) -> None:
+        scene = self._scene
+        if scene is None:
+            return
+
+        now = time.perf_counter()
+        dt = now - self._last_tick
+        self._last_tick = now
+        self.intervals.append(dt)
+        self.ticks += 1
+
+        with profiler.phase("update"):
+            if self._step is None:
+                scene.update(dt)
+                self.steps += 1
+                alpha = 1.0
+            else:
+                alpha = self._advance(scene, dt)
+
+        if scene.finished:
+            self._present(scene, alpha, dt)
+            wake(self.fig)
+        elif self._unchanged(scene):
+            self.unchanged += 1
+        elif self.quality.should_render():
+            self._present(scene, alpha, dt)
+        else:
+            self.frames_skipped += 1
+
+    def _unchanged(self, scene) -> bool:
+        version = getattr(scene, "version", None)
+        return version is not None and version == self._drawn_version
+
+    def _present(self, scene, alpha: float, dt: float) -> None:
+        start = time.perf_counter()
+        self._drawn_version = getattr(scene, "version", None)
+        with profiler.phase("build"):
+            artists = scene.render(alpha)
+        if self._blitter is not None:
+            with profiler.phase("rasterize"):
+                self._blitter.update(artists)
+            profiler.end_frame()
+        else:
+            # The frame ends when the figure draws; see FrameProfiler.instrument
+            self.fig.canvas.draw_idle()
+
+        # A deferred draw_idle shows up as the next tick arriving late
+        budget = self.interval / 1000
+        late = max(0.0, dt - budget)
+        if self.quality.record((time.perf_counter() - start + late) / budget):
+            if self._blitter is not None:
+                self._blitter.invalidate()
+            self.fig.canvas.draw_idle()
+
+    def _advance(self, scene, dt: float) -> float:
+        """Run the fixed steps *dt* covers and return the leftover fraction."""
+        step = self._step
+        self._accumulator += dt
+
+        steps = 0
+        while self._accumulator >= step and not scene.finished:
+            if steps == MAX_STEPS_PER_TICK:
+                # Too far behind to catch up — drop the backlog rather
+                # than spend the next frame simulating it
+                self.dropped += self._accumulator - self._accumulator % step
+                self._accumulator %= step
+                break
+            scene.update(step)
+            self._accumulator -= step
+            steps += 1
+
+        self.steps += steps
+        if scene.finished:
+            return 1.0
+        return self._accumulator / step
+
+    def stats(self) -> dict:
+        """Measured tick intervals for the current scene, in milliseconds."""
+        stats = {
+            "ticks": self.ticks,
+            "steps": self.steps,
+            "dropped_ms": self.dropped * 1000,
+            "unchanged": self.unchanged,
+            "skipped": self.quality.skipped,
+            "mean_ms": 0.0,
+            "p95_ms": 0.0,
+            "max_ms": 0.0,
+        }
+        if self.intervals:
+            ms = np.array(self.intervals) * 1000
+            stats["mean_ms"] = float(ms.mean())
+            stats["p95_ms"] = float(np.percentile(ms, 95))
+            stats["max_ms"] = float(ms.max())
+        return stats
+
+
+class ClockedGame:
+    """
+    Base for the minigames the EngineClock animates.
+
+    A subclass sets tick_interval (ms between ticks) and sim_step (seconds
+    simulated per update), implements update() and render(), keeps score
+    and game_over, and disconnects its handlers in _disconnect(). A game
+    may also keep a version bumped by every change the player can see,
+    so the clock skips ticks with nothing new to draw.
+
+    run() attaches the game to the clock until game_over, through a
+    BlitManager when *blit* is set, then shows the end screen and waits
+    for a click or space to dismiss it.
+    """
+
+    tick_interval = DEFAULT_INTERVAL
+    sim_step: float | None = None
+
+    def __init__(self, fig, ax, blit: bool = False, clock: EngineClock | None = None):
+        self.fig = fig
+        self.ax = ax
+        self.blit = blit  # redraw only moving artists over a cached background
+        self.clock = clock or EngineClock(fig)  # a standalone game gets its own
+
+    @property
+    def finished(self) -> bool:
+        return self.game_over
+
+    def update(self, dt: float) -> None:
+        """Advance one sim_step."""
+        raise NotImplementedError
+
+    def render(self, alpha: float = 1.0) -> list:
+        """
+        Update the artists and return the moving ones.
+
+        alpha places interpolated positions between the previous step (0)
+        and the current one (1).
+        """
+        raise NotImplementedError
+
+    def _show_end_screen(self) -> None:
+        self._draw()
+
+    def run(self) -> int:
+        blitter = BlitManager(self.fig) if self.blit else None
+        self.clock.attach(self, self.tick_interval, blitter, step=self.sim_step)
+
+        try:
+            wait_until(self.fig, lambda: self.game_over)
+        finally:
+            self.clock.detach()
+            if blitter is not None:
+                blitter.close()
+
+        self._show_end_screen()
+
+        # Wait for space or click to dismiss
+        try:
+            wait_for_continue(self.fig)
+        finally:
+            self._disconnect()
+
+        return self.score
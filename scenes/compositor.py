@@ -0,0 +1,119 @@
+import logging
+from collections import OrderedDict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+COMPOSITE_MEMO = 8  # composed frames kept, one per (location, speaker, side)
+BLANK_COLOR = (255, 255, 255, 255)  # what shows where there is no background
+
+
+def to_rgba8(image) -> np.ndarray:
+    """Return *image* as an (h, w, 4) uint8 array, whatever imread produced."""
+    img = np.asarray(image)
+    if img.dtype.kind == "f":
+        img = (np.clip(img, 0, 1) * 255 + 0.5).astype(np.uint8)
+    elif img.dtype != np.uint8:
+        img = img.astype(np.uint8)
+
+    if img.ndim == 2:
+        img = np.repeat(img[..., None], 3, axis=2)
+    if img.shape[2] == 3:
+        alpha = np.full(img.shape[:2] + (1,), 255, dtype=np.uint8)
+        img = np.concatenate([img, alpha], axis=2)
+    return img
+
+
+def _resample(image: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Nearest-neighbour resize — images already arrive near their display size."""
+    h, w = image.shape[:2]
+    if (h, w) == (height, width):
+        return image
+    rows = np.arange(height) * h // height
+    cols = np.arange(width) * w // width
+    return image[rows[:, None], cols]
+
+
+def _pixel_box(extent, width: int, height: int) -> tuple:
+    """Map an axes-fraction (x0, x1, y0, y1) extent to buffer rows and columns."""
+    x0, x1, y0, y1 = extent
+    c0, c1 = round(x0 * width), round(x1 * width)
+    r0, r1 = round((1 - y1) * height), round((1 - y0) * height)  # row 0 is the top
+    return r0, r1, c0, c1
+
+
+class Compositor:
+    """
+    Flattens a background, sprites and dim overlays into one RGBA frame.
+
+    Layers are alpha-blended with NumPy in a preallocated uint8 buffer the
+    size of the axes in pixels, so the figure only has to draw a single
+    image. Finished frames are memoized under a caller-chosen key; showing
+    the same combination again costs a dictionary lookup.
+    """
+
+    def __init__(self, size: tuple, memo: int = COMPOSITE_MEMO):
+        width, height = size
+        self.size = (width, height)
+        self.buffer = np.empty((height, width, 4), dtype=np.uint8)
+        self.memo = memo
+        self._frames: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def compose(self, key, background=None, sprites=(), dims=()) -> np.ndarray:
+        """
+        Return the frame for *key*, composing it on first use.
+
+        sprites is a sequence of (image, extent) drawn in order over the
+        background; dims is a sequence of (x0, x1, alpha) vertical bands
+        darkened towards black. Extents are in axes fractions.
+        """
+        frame = self._frames.get(key)
+        if frame is not None:
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return frame
+
+        self.misses += 1
+        width, height = self.size
+        buf = self.buffer
+
+        if background is None:
+            buf[...] = BLANK_COLOR
+        else:
+            buf[...] = _resample(to_rgba8(background), width, height)
+            buf[..., 3] = 255
+
+        for image, extent in sprites:
+            if image is not None:
+                self._blend(to_rgba8(image), extent)
+
+        for x0, x1, alpha in dims:
+            _, _, c0, c1 = _pixel_box((x0, x1, 0, 1), width, height)
+            keep = round(255 * (1 - alpha))
+            band = buf[:, c0:c1, :3]
+            band[...] = (band.astype(np.uint16) * keep + 127) // 255
+
+        frame = buf.copy()
+        frame.flags.writeable = False
+        self._frames[key] = frame
+        while len(self._frames) > self.memo:
+            self._frames.popitem(last=False)
+        return frame
+
+    def _blend(self, image: np.ndarray, extent) -> None:
+        width, height = self.size
+        r0, r1, c0, c1 = _pixel_box(extent, width, height)
+        if r1 <= r0 or c1 <= c0:
+            return
+
+        src = _resample(image, c1 - c0, r1 - r0).astype(np.uint16)
+        dst = self.buffer[r0:r1, c0:c1, :3]
+        alpha = src[..., 3:]
+        dst[...] = (src[..., :3] * alpha + dst * (255 - alpha) + 127) // 255
+
+    def clear(self) -> None:
+        self._frames.clear()
@@ -1,8 +1,12 @@
-import os
 import logging
 
+import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
+
+from scenes.assets import FULL_EXTENT, display_size, load_image
+from scenes.compositor import Compositor
+from scenes.events import wait_for_continue
+from scenes.profiler import profiler
 
 logger = logging.getLogger(__name__)
 
@@ -15,36 +19,71 @@ DIALOGUE_Y = 0.10
 NAME_Y = 0.95
 DIALOGUE_FONT = 16
 NAME_FONT = 12
-PAUSE_INTERVAL = 0.05  # seconds between event polls
+FALLBACK_FRAME_SIZE = (960, 600)  # frame size when the axes has no pixel size yet
+
+
+def _speakers(conversation: list) -> set:
+    return {line.get("character", "") for line in conversation}
+
 
+def _sprite_extent(side: str | None) -> list:
+    return SPRITE_RIGHT_EXTENT if side == "right" else SPRITE_LEFT_EXTENT
 
-def _load_image(path: str | None):
-    """Load an image from disk, returning None if missing or invalid."""
-    if not path or not os.path.exists(path):
-        if path:
-            logger.warning("Image not found: %s", path)
-        return None
-    try:
-        return mpimg.imread(path)
-    except Exception as e:
-        logger.error("Failed to load image %s: %s", path, e)
-        return None
 
+def conversation_assets(
+    bg_img: str | None, conversation: list, characters: dict
+) -> list:
+    """Return (path, extent) for each image a conversation will show."""
+    requests = [(bg_img, FULL_EXTENT)]
+    for name in sorted(_speakers(conversation or [])):
+        info = characters.get(name, {})
+        requests.append((info.get("sprite"), tuple(_sprite_extent(info.get("side")))))
+    return [(path, extent) for path, extent in requests if path]
 
-def _cache_assets(bg_img: str | None, characters: dict) -> tuple:
+
+def _cache_assets(
+    ax, bg_img: str | None, characters: dict, conversation: list
+) -> tuple:
     """
-    Load background and all character sprites once upfront.
+    Load the background and the sprites of characters who speak in this
+    conversation, decoded at their display size.
     Returns (bg_array | None, {char_name: image_array | None})
     """
-    bg = _load_image(bg_img)
+    bg = load_image(bg_img, display_size(ax))
 
     sprite_cache = {}
-    for name, info in characters.items():
-        sprite_cache[name] = _load_image(info.get("sprite"))
+    for name in _speakers(conversation):
+        info = characters.get(name, {})
+        size = display_size(ax, _sprite_extent(info.get("side")))
+        sprite_cache[name] = load_image(info.get("sprite"), size)
 
     return bg, sprite_cache
 
 
+# Composited frames and the layout outlive a single conversation
+_compositor: Compositor | None = None
+_layout = None  # ConversationLayout, defined below
+
+
+def _frame_compositor(ax, bg) -> Compositor:
+    global _compositor
+    size = display_size(ax)
+    if size is None:
+        size = (bg.shape[1], bg.shape[0]) if bg is not None else FALLBACK_FRAME_SIZE
+    if _compositor is None or _compositor.size != size:
+        _compositor = Compositor(size)
+    return _compositor
+
+
+def _dim_bands(side: str | None) -> list:
+    """The inactive half of the stage, darkened while the other side speaks."""
+    if side == "left":
+        return [(0.65, 1.0, DIM_ALPHA)]
+    if side == "right":
+        return [(0.0, 0.35, DIM_ALPHA)]
+    return []
+
+
 def conversation_cutscene(
     ax,
     bg_img: str | None = None,
@@ -59,96 +98,148 @@ def conversation_cutscene(
     fig = ax.figure
 
     # ── Cache all assets upfront — not per line ────────────────────────────────
-    bg, sprite_cache = _cache_assets(bg_img, characters)
-
-    # ── Event handling ─────────────────────────────────────────────────────────
-    continue_flag = {"clicked": False}
-
-    def on_click(event):
-        continue_flag["clicked"] = True
-
-    def on_key(event):
-        if event.key in (" ", "space"):
-            continue_flag["clicked"] = True
-
-    cid_click = fig.canvas.mpl_connect("button_press_event", on_click)
-    cid_key = fig.canvas.mpl_connect("key_press_event", on_key)
-
-    try:
-        for line in conversation:
-            continue_flag["clicked"] = False
-
-            char = line.get("character", "")
-            char_info = characters.get(char, {})
-            side = char_info.get("side")
-            text = line.get("text", "")
-
-            _render_line(ax, fig, bg, sprite_cache.get(char), char, text, side)
-
-            # Wait for click or spacebar
-            while not continue_flag["clicked"]:
-                plt.pause(PAUSE_INTERVAL)
-
-    finally:
-        # Always disconnect listeners — even if an exception occurs
-        fig.canvas.mpl_disconnect(cid_click)
-        fig.canvas.mpl_disconnect(cid_key)
+    bg, sprite_cache = _cache_assets(ax, bg_img, characters, conversation)
+    compositor = _frame_compositor(ax, bg)
+    layout = _stage_layout(ax)
+
+    for line in conversation:
+        char = line.get("character", "")
+        char_info = characters.get(char, {})
+        side = char_info.get("side")
+        text = line.get("text", "")
+
+        # Background, sprite and dimming only change with the speaker
+        sprites = []
+        if side in ("left", "right"):
+            sprites.append((sprite_cache.get(char), _sprite_extent(side)))
+        with profiler.phase("build"):
+            frame = compositor.compose(
+                (bg_img, char, side), bg, sprites=sprites, dims=_dim_bands(side)
+            )
+
+        layout.show(frame, char, text, side)
+
+        # Wait for click or spacebar; stop early if the window closed
+        if not wait_for_continue(fig):
+            break
 
     plt.draw()
 
 
-def _render_line(ax, fig, bg, sprite, char: str, text: str, side: str | None) -> None:
-    """Clear and redraw the scene for a single dialogue line."""
-    ax.clear()
-    ax.axis("off")
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 1)
+class ConversationLayout:
+    """
+    The persistent artists of a conversation on one axes.
+
+    Background, sprite and dimming arrive as one composited frame shown by
+    a single image; the name badge and dialogue box are animated texts.
+    The layout survives from line to line and from one conversation to
+    the next until something clears the axes, so the artist count never
+    grows.
 
-    # Background
-    if bg is not None:
-        ax.imshow(bg, extent=[0, 1, 0, 1], aspect="auto", zorder=0)
+    A line that keeps the current frame only changes text, which is
+    blitted over a snapshot of the last full draw. A new frame costs one
+    full draw, after which the snapshot is retaken.
+    """
 
-    # Character sprite
-    if sprite is not None and side in ("left", "right"):
-        extent = SPRITE_LEFT_EXTENT if side == "left" else SPRITE_RIGHT_EXTENT
-        ax.imshow(
-            sprite, extent=extent, aspect="auto", interpolation="bilinear", zorder=1
+    def __init__(self, ax):
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+
+        ax.clear()
+        ax.axis("off")
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+
+        self.image = ax.imshow(
+            np.zeros((1, 1, 4), dtype=np.uint8),
+            extent=[0, 1, 0, 1],
+            aspect="auto",
+            interpolation="nearest",  # frames are composited at display size
+            zorder=0,
         )
 
-    # Dim the inactive side
-    if side == "left":
-        ax.fill_betweenx([0, 1], 0.65, 1.0, color="black", alpha=DIM_ALPHA, zorder=1.5)
-    elif side == "right":
-        ax.fill_betweenx([0, 1], 0.0, 0.35, color="black", alpha=DIM_ALPHA, zorder=1.5)
-
-    # Character name badge
-    if side in ("left", "right"):
-        name_x = 0.05 if side == "left" else 0.95
-        name_ha = "left" if side == "left" else "right"
-        ax.text(
-            name_x,
+        # Character name badge
+        self.name = ax.text(
+            0.05,
             NAME_Y,
-            char,
-            ha=name_ha,
+            "",
             va="top",
             fontsize=NAME_FONT,
             color="white",
             weight="bold",
             bbox=dict(facecolor="black", alpha=0.5, pad=3),
             zorder=2,
+            animated=True,
+        )
+
+        # Dialogue box
+        self.dialogue = ax.text(
+            0.5,
+            DIALOGUE_Y,
+            "",
+            ha="center",
+            va="center",
+            fontsize=DIALOGUE_FONT,
+            wrap=True,
+            bbox=dict(facecolor="white", alpha=0.85, boxstyle="round,pad=0.7"),
+            zorder=3,
+            animated=True,
         )
 
-    # Dialogue box
-    ax.text(
-        0.5,
-        DIALOGUE_Y,
-        f"{char}: {text}",
-        ha="center",
-        va="center",
-        fontsize=DIALOGUE_FONT,
-        wrap=True,
-        bbox=dict(facecolor="white", alpha=0.85, boxstyle="round,pad=0.7"),
-        zorder=3,
-    )
-
-    fig.canvas.draw_idle()
+        self._frame = None
+        self._snapshot = None
+        self._draw_cid = self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    @property
+    def attached(self) -> bool:
+        """False once another scene has cleared the axes."""
+        return self.image.axes is self.ax
+
+    def show(self, frame, char: str, text: str, side: str | None) -> None:
+        """Display one dialogue line."""
+        self.name.set_visible(side in ("left", "right"))
+        if side in ("left", "right"):
+            self.name.set_text(char)
+            self.name.set_x(0.05 if side == "left" else 0.95)
+            self.name.set_horizontalalignment("left" if side == "left" else "right")
+        self.dialogue.set_text(f"{char}: {text}")
+
+        if frame is not self._frame:
+            self._frame = frame
+            self._snapshot = None
+            self.image.set_data(frame)
+
+        if self._snapshot is None or not self.canvas.supports_blit:
+            self.canvas.draw_idle()
+        else:
+            with profiler.phase("rasterize"):
+                self.canvas.restore_region(self._snapshot)
+                self._draw_text()
+                self.canvas.blit(self.ax.figure.bbox)
+            profiler.end_frame()
+
+    def _draw_text(self) -> None:
+        for artist in (self.name, self.dialogue):
+            if artist.get_visible():
+                self.ax.figure.draw_artist(artist)
+
+    def _on_draw(self, event) -> None:
+        if not self.attached:
+            self.close()
+            return
+        # A full draw leaves the animated texts out — snapshot, then add them
+        self._snapshot = self.canvas.copy_from_bbox(self.ax.figure.bbox)
+        self._draw_text()
+
+    def close(self) -> None:
+        self.canvas.mpl_disconnect(self._draw_cid)
+        self._snapshot = None
+
+
+def _stage_layout(ax) -> ConversationLayout:
+    global _layout
+    if _layout is None or _layout.ax is not ax or not _layout.attached:
+        if _layout is not None:
+            _layout.close()
+        _layout = ConversationLayout(ax)
+    return _layout
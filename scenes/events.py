@@ -0,0 +1,102 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+INPUT_EVENTS = ("button_press_event", "key_press_event")
+CONTINUE_KEYS = (" ", "space")
+
+
+def is_continue(event) -> bool:
+    """True for a click or a spacebar press — the engine's "next" gesture."""
+    if event.name == "key_press_event":
+        return event.key in CONTINUE_KEYS
+    return True
+
+
+def wake(fig) -> None:
+    """
+    End the current wait so its condition is checked again.
+
+    Call this when state a wait depends on changes outside an input event,
+    e.g. from an animation timer.
+    """
+    fig.canvas.stop_event_loop()
+
+
+def _show_pending(fig) -> None:
+    # Render whatever the scene drew before the loop starts blocking
+    if fig.stale:
+        fig.canvas.draw_idle()
+
+
+def wait_for_input(
+    fig, events=INPUT_EVENTS, timeout: float | None = None, predicate=None
+) -> bool:
+    """
+    Block in the canvas event loop until one of *events* arrives.
+
+    Unlike a plt.pause loop this does not wake up or redraw while nothing
+    happens. predicate(event), when given, filters the events that count.
+    Returns True for a matching event, False on timeout or window close.
+    """
+    canvas = fig.canvas
+    matched = {"value": False}
+
+    def on_event(event):
+        if predicate is None or predicate(event):
+            matched["value"] = True
+            canvas.stop_event_loop()
+
+    cids = [canvas.mpl_connect(name, on_event) for name in events]
+    cids.append(canvas.mpl_connect("close_event", lambda event: wake(fig)))
+    try:
+        _show_pending(fig)
+        canvas.start_event_loop(timeout if timeout is not None else 0)
+    finally:
+        for cid in cids:
+            canvas.mpl_disconnect(cid)
+
+    return matched["value"]
+
+
+def wait_for_continue(fig) -> bool:
+    """Wait for a click or spacebar press. Returns False if the window closed."""
+    return wait_for_input(fig, predicate=is_continue)
+
+
+def wait_until(fig, done, events=INPUT_EVENTS) -> bool:
+    """
+    Run the event loop until done() is true.
+
+    done() is checked after each of *events* — the game's own handlers run
+    first — and whenever wake(fig) is called. Returns False if the window
+    was closed before that.
+    """
+    canvas = fig.canvas
+    closed = {"value": False}
+
+    def on_event(event):
+        if done():
+            canvas.stop_event_loop()
+
+    def on_close(event):
+        closed["value"] = True
+        canvas.stop_event_loop()
+
+    cids = [canvas.mpl_connect(name, on_event) for name in events]
+    cids.append(canvas.mpl_connect("close_event", on_close))
+    try:
+        # Show the scene before blocking: the puzzles only redraw on input, and
+        # a clock-driven game's first frame waits for the clock's first tick
+        canvas.draw_idle()
+        while not done() and not closed["value"]:
+            canvas.start_event_loop(0)
+    finally:
+        for cid in cids:
+            canvas.mpl_disconnect(cid)
+
+    if closed["value"] and not done():
+        logger.debug("Window closed while waiting")
+        return False
+    return True
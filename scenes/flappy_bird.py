@@ -1,9 +1,10 @@
 import random
 import logging
 
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.animation import FuncAnimation
+
+from scenes.clock import ClockedGame, EngineClock, lerp
+from scenes.retained import ArtistLayer
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +17,8 @@ PIPE_SPEED = 0.15
 BIRD_X = 1.5
 BIRD_RADIUS = 0.3
 PIPE_MIN_Y = 2.0
-ANIM_INTERVAL = 30  # ms between frames
-PAUSE_INTERVAL = 0.01  # seconds between event polls
+SIM_STEP = 0.03  # seconds per physics step — the speeds above are per step
+FRAME_INTERVAL = 16  # ms between rendered frames
 
 # ── Colours ────────────────────────────────────────────────────────────────────
 SKY_COLOR = "#87ceeb"
@@ -27,7 +28,10 @@ WIN_COLOR = "lime"
 LOSE_COLOR = "red"
 
 
-class FlappyBirdGame:
+class FlappyBirdGame(ClockedGame):
+    tick_interval = FRAME_INTERVAL
+    sim_step = SIM_STEP
+
     def __init__(
         self,
         fig,
@@ -37,9 +41,10 @@ class FlappyBirdGame:
         height: int = 8,
         victory_message: str = "You win!",
         defeat_message: str = "You lose!",
+        blit: bool = False,
+        clock: EngineClock | None = None,
     ):
-        self.fig = fig
-        self.ax = ax
+        super().__init__(fig, ax, blit, clock)
         self.width = width
         self.height = height
         self.score_to_beat = score_to_beat
@@ -47,6 +52,7 @@ class FlappyBirdGame:
         self.defeat_message = defeat_message
 
         self._reset_state()
+        self._layer = None  # built on first draw
 
         # Single persistent click handler — disconnected on cleanup
         self._click_cid = self.fig.canvas.mpl_connect(
@@ -60,14 +66,16 @@ class FlappyBirdGame:
     def _reset_state(self) -> None:
         self.bird_y = self.height // 2
         self.bird_vy = 0.0
+        self.prev_bird_y = self.bird_y  # state one step back, for interpolation
         self.pipes = []
         self.score = 0
         self.game_over = False
         self.started = False
+        self._version = 0  # bumped by changes while the bird is not flying
 
     def _spawn_pipe(self) -> None:
         gap_y = random.uniform(PIPE_MIN_Y, self.height - PIPE_MIN_Y - PIPE_GAP)
-        self.pipes.append({"x": self.width, "gap_y": gap_y})
+        self.pipes.append({"x": self.width, "prev_x": self.width, "gap_y": gap_y})
 
     # ── Input ──────────────────────────────────────────────────────────────────
 
@@ -76,6 +84,7 @@ class FlappyBirdGame:
             return
         if not self.started:
             self.started = True
+            self._version += 1
         else:
             self._flap()
 
@@ -85,14 +94,20 @@ class FlappyBirdGame:
 
     # ── Update ─────────────────────────────────────────────────────────────────
 
-    def _update(self, frame) -> list:
-        if self.game_over:
-            self._draw()
-            return []
+    @property
+    def version(self) -> int | None:
+        """None while the bird flies, when every interpolated frame differs."""
+        if self.started and not self.game_over:
+            return None
+        return self._version
 
-        if not self.started:
-            self._draw(waiting=True)
-            return []
+    def update(self, dt: float) -> None:
+        if self.game_over or not self.started:
+            return
+
+        self.prev_bird_y = self.bird_y
+        for pipe in self.pipes:
+            pipe["prev_x"] = pipe["x"]
 
         # Physics
         self.bird_vy += GRAVITY
@@ -128,8 +143,9 @@ class FlappyBirdGame:
         if self.score >= self.score_to_beat:
             self.game_over = True
 
-        self._draw()
-        return []
+    def render(self, alpha: float = 1.0) -> list:
+        self._draw(waiting=not self.started and not self.game_over, alpha=alpha)
+        return self._animated_artists()
 
     # ── Drawing ────────────────────────────────────────────────────────────────
 
@@ -143,70 +159,82 @@ class FlappyBirdGame:
         self.ax.set_yticks([])
         self.ax.grid(False)
 
-    def _draw(self, waiting: bool = False) -> None:
+    def _build_artists(self) -> None:
         self._clear_axes()
+        self._layer = ArtistLayer(self.ax)
 
-        # Pipes
-        for pipe in self.pipes:
-            self.ax.add_patch(
-                patches.Rectangle(
-                    (pipe["x"], 0),
-                    PIPE_WIDTH,
-                    pipe["gap_y"],
-                    facecolor=PIPE_COLOR,
-                )
-            )
-            self.ax.add_patch(
-                patches.Rectangle(
-                    (pipe["x"], pipe["gap_y"] + PIPE_GAP),
-                    PIPE_WIDTH,
-                    self.height - pipe["gap_y"] - PIPE_GAP,
-                    facecolor=PIPE_COLOR,
-                )
-            )
-
-        # Bird
-        self.ax.add_patch(
+        self._bird = self._layer.add(
             patches.Circle(
                 (BIRD_X, self.bird_y),
                 BIRD_RADIUS,
                 facecolor=BIRD_COLOR,
                 edgecolor="black",
+                zorder=2,
             )
         )
+        self._wait_text = self._layer.text(
+            self.width / 2,
+            self.height / 2,
+            "Click anywhere to start",
+            ha="center",
+            va="center",
+            fontsize=16,
+            fontweight="bold",
+            color="black",
+            bbox=dict(facecolor="white", alpha=0.8, boxstyle="round,pad=0.5"),
+            zorder=3,
+        )
+        self._score_text = self._layer.text(
+            self.width - 0.5,
+            self.height - 0.5,
+            "",
+            ha="right",
+            va="top",
+            fontsize=14,
+            fontweight="bold",
+            color="white",
+            bbox=dict(facecolor="black", alpha=0.5, boxstyle="round,pad=0.3"),
+            zorder=3,
+        )
+
+    @staticmethod
+    def _make_pipe(index: int) -> patches.Rectangle:
+        return patches.Rectangle((0, 0), PIPE_WIDTH, 0, facecolor=PIPE_COLOR)
+
+    def _draw(self, waiting: bool = False, alpha: float = 1.0) -> None:
+        if self._layer is None:
+            self._build_artists()
+
+        # Pipes — one lower and one upper rectangle per pipe
+        lower = self._layer.pool("pipes_lower", self._make_pipe, len(self.pipes))
+        upper = self._layer.pool("pipes_upper", self._make_pipe, len(self.pipes))
+        for pipe, low, high in zip(self.pipes, lower, upper):
+            x = lerp(pipe["prev_x"], pipe["x"], alpha)
+            low.set_xy((x, 0))
+            low.set_height(pipe["gap_y"])
+            high.set_xy((x, pipe["gap_y"] + PIPE_GAP))
+            high.set_height(self.height - pipe["gap_y"] - PIPE_GAP)
+
+        # Bird
+        self._bird.set_center((BIRD_X, lerp(self.prev_bird_y, self.bird_y, alpha)))
 
         # HUD
-        if waiting:
-            self.ax.text(
-                self.width / 2,
-                self.height / 2,
-                "Click anywhere to start",
-                ha="center",
-                va="center",
-                fontsize=16,
-                fontweight="bold",
-                color="black",
-                bbox=dict(facecolor="white", alpha=0.8, boxstyle="round,pad=0.5"),
-            )
-        elif not self.game_over:
-            self.ax.text(
-                self.width - 0.5,
-                self.height - 0.5,
-                f"Score: {self.score}",
-                ha="right",
-                va="top",
-                fontsize=14,
-                fontweight="bold",
-                color="white",
-                bbox=dict(facecolor="black", alpha=0.5, boxstyle="round,pad=0.3"),
-            )
+        self._wait_text.set_visible(waiting)
+        show_score = not waiting and not self.game_over
+        self._score_text.set_visible(show_score)
+        if show_score:
+            self._score_text.set_text(f"Score: {self.score}")
+
+    def _animated_artists(self) -> list:
+        return [] if self._layer is None else self._layer.dynamic
 
     def _show_end_screen(self) -> None:
         won = self.score >= self.score_to_beat
         msg = self.victory_message if won else self.defeat_message
         color = WIN_COLOR if won else LOSE_COLOR
 
-        self.ax.text(
+        self._draw()
+        self._layer.text(
             self.width / 2,
             self.height / 2,
             msg,
@@ -216,6 +244,7 @@ class FlappyBirdGame:
             fontweight="bold",
             color=color,
             bbox=dict(facecolor="black", alpha=0.5, boxstyle="round,pad=0.3"),
+            zorder=3,
         )
         self.fig.canvas.draw_idle()
 
@@ -223,45 +252,3 @@ class FlappyBirdGame:
 
     def _disconnect(self) -> None:
         self.fig.canvas.mpl_disconnect(self._click_cid)
-
-    # ── Public API ─────────────────────────────────────────────────────────────
-
-    def run(self) -> int:
-        # cache_frame_data=False prevents a matplotlib memory leak on long runs
-        self.anim = FuncAnimation(
-            self.fig,
-            self._update,
-            interval=ANIM_INTERVAL,
-            blit=False,
-            repeat=True,
-            cache_frame_data=False,
-        )
-
-        while not self.game_over:
-            plt.pause(PAUSE_INTERVAL)
-
-        self.anim.event_source.stop()
-        self._show_end_screen()
-
-        # Wait for click or space to dismiss end screen
-        continue_flag = {"clicked": False}
-
-        def on_click(event):
-            continue_flag["clicked"] = True
-
-        def on_key(event):
-            if event.key in (" ", "space"):
-                continue_flag["clicked"] = True
-
-        cid_click = self.fig.canvas.mpl_connect("button_press_event", on_click)
-        cid_key = self.fig.canvas.mpl_connect("key_press_event", on_key)
-
-        try:
-            while not continue_flag["clicked"]:
-                plt.pause(PAUSE_INTERVAL)
-        finally:
-            self.fig.canvas.mpl_disconnect(cid_click)
-            self.fig.canvas.mpl_disconnect(cid_key)
-            self._disconnect()
-
-        return self.score
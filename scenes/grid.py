@@ -0,0 +1,138 @@
+import logging
+
+import numpy as np
+import matplotlib.colors as mcolors
+from matplotlib.collections import LineCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+MAX_IMAGE_PX = 1024  # longest side of a glyph grid image, whatever the board size
+MAX_CELL_PX = 32  # glyph tile resolution on small boards
+GLYPH_FILL = 0.6  # fraction of a cell covered by its glyph
+GLYPH_SUPERSAMPLE = 4  # samples per pixel edge when rasterizing glyphs
+EDGE_MAX_CELLS = 64  # boards larger than this skip cell borders
+EDGE_WIDTH = 1
+
+
+def _glyph_mask(char: str, size_px: int) -> np.ndarray:
+    """Rasterize *char* into a size_px × size_px coverage mask (row 0 = bottom)."""
+    path = TextPath((0, 0), char, size=1, prop=FontProperties(weight="bold"))
+    extents = path.get_extents()
+    n = size_px * GLYPH_SUPERSAMPLE
+    scale = GLYPH_FILL * n / max(extents.width, extents.height)
+    transform = (
+        Affine2D()
+        .translate(
+            -(extents.x0 + extents.width / 2), -(extents.y0 + extents.height / 2)
+        )
+        .scale(scale)
+        .translate(n / 2, n / 2)
+    )
+
+    centres = np.arange(n) + 0.5
+    xs, ys = np.meshgrid(centres, centres)
+    inside = transform.transform_path(path).contains_points(
+        np.column_stack([xs.ravel(), ys.ravel()])
+    )
+    samples = inside.reshape(size_px, GLYPH_SUPERSAMPLE, size_px, GLYPH_SUPERSAMPLE)
+    return samples.mean(axis=(1, 3))
+
+
+def _rgba(color) -> np.ndarray:
+    return np.array(mcolors.to_rgba(color), dtype=float)
+
+
+class GridRenderer:
+    """
+    Draws a whole board as one image artist.
+
+    Every cell holds an integer code. A palette lookup table, built once,
+    maps each code to its RGBA colour — or to a pre-rasterized tile when the
+    code carries a glyph such as a Minesweeper number — so a frame costs one
+    table lookup plus set_data no matter how many cells the board has.
+    """
+
+    def __init__(
+        self,
+        ax,
+        width: int,
+        height: int,
+        palette: list,
+        glyphs: dict | None = None,
+        edgecolor=None,
+        zorder: float = 1,
+    ):
+        self.width = width
+        self.height = height
+
+        if glyphs:
+            self.cell_px = int(
+                np.clip(MAX_IMAGE_PX // max(width, height), 1, MAX_CELL_PX)
+            )
+        else:
+            self.cell_px = 1
+        self._tiles = self._build_tiles(palette, glyphs or {})
+
+        k = self.cell_px
+        self._buffer = np.zeros((height * k, width * k, 4), dtype=np.uint8)
+        self._codes = None  # codes behind the current image
+
+        self.image = ax.imshow(
+            self._buffer,
+            extent=(0, width, 0, height),
+            origin="lower",
+            interpolation="nearest",
+            zorder=zorder,
+        )
+
+        self.edges = None
+        if edgecolor is not None and max(width, height) <= EDGE_MAX_CELLS:
+            segments = [[(x, 0), (x, height)] for x in range(width + 1)]
+            segments += [[(0, y), (width, y)] for y in range(height + 1)]
+            self.edges = LineCollection(
+                segments, colors=edgecolor, linewidths=EDGE_WIDTH, zorder=zorder + 0.1
+            )
+            ax.add_collection(self.edges)
+
+    # ── Lookup table ───────────────────────────────────────────────────────────
+
+    def _build_tiles(self, palette: list, glyphs: dict) -> np.ndarray:
+        """Return a (codes, cell_px, cell_px, 4) uint8 table of cell tiles."""
+        k = self.cell_px
+        tiles = np.empty((len(palette), k, k, 4), dtype=float)
+        for code, color in enumerate(palette):
+            tiles[code] = _rgba(color)
+            if code in glyphs:
+                char, glyph_color = glyphs[code]
+                coverage = _glyph_mask(char, k)[..., None]
+                tiles[code] = (
+                    tiles[code] * (1 - coverage) + _rgba(glyph_color) * coverage
+                )
+        return np.round(tiles * 255).astype(np.uint8)
+
+    # ── Frames ─────────────────────────────────────────────────────────────────
+
+    def update(self, codes: np.ndarray) -> bool:
+        """Show a (height, width) array of codes. Returns False if nothing changed."""
+        if self._codes is not None and np.array_equal(codes, self._codes):
+            return False
+
+        k = self.cell_px
+        if k == 1:
+            np.take(self._tiles[:, 0, 0], codes, axis=0, out=self._buffer)
+        else:
+            # (h, w, k, k, 4) tiles → (h, k, w, k, 4) pixel rows, written in place
+            view = self._buffer.reshape(self.height, k, self.width, k, 4)
+            view[...] = self._tiles[codes].transpose(0, 2, 1, 3, 4)
+
+        self._codes = codes.copy()
+        self.image.set_data(self._buffer)
+        return True
+
+    @property
+    def artists(self) -> list:
+        return [self.image] if self.edges is None else [self.image, self.edges]
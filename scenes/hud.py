@@ -0,0 +1,141 @@
+import time
+import logging
+from collections import deque
+
+import numpy as np
+from matplotlib.lines import Line2D
+
+from scenes.profiler import profiler
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+HUD_KEY = "f3"  # toggles the overlay
+HUD_RECT = (0.01, 0.80, 0.26, 0.18)  # figure fractions: left, bottom, width, height
+HUD_HISTORY = 120  # frames in the sparkline and averages
+HUD_REFRESH = 0.25  # seconds between text and sparkline updates
+SPARK_CEILING_MS = 50  # frame time at the top of the sparkline, at least
+
+# Colours
+HUD_BG = "#000000"
+HUD_TEXT = "#e0e0e0"
+SPARK_COLOR = "#2ecc71"
+
+
+class DebugHud:
+    """
+    A live FPS and frame-time overlay, toggled with F3.
+
+    The HUD lives on its own small axes, so scenes clearing their axes
+    leave it alone, and its artists are created once and only restyled.
+    The axes is animated: full draws and blit snapshots leave it out, and
+    the HUD adds itself after every frame the profiler sees end. Its
+    pixels are cached and only redrawn every HUD_REFRESH seconds; on other
+    frames they are restored and blitted, so the overlay costs a copy and
+    stays outside the phase timings it reports.
+    """
+
+    def __init__(self, fig, ax):
+        self.fig = fig
+        self.ax = ax  # the scene axes whose artists are counted
+        self.visible = False
+
+        self._hud_ax = None  # built on first toggle
+        self._pixels = None  # cached render of the HUD axes
+        self._ends: deque = deque(maxlen=HUD_HISTORY)  # frame end timestamps
+        self._phases: deque = deque(maxlen=HUD_HISTORY)  # per-frame phase seconds
+        self._refreshed = 0.0
+        self._resize_cid = None
+
+    # ── Toggle ─────────────────────────────────────────────────────────────────
+
+    def toggle(self) -> None:
+        if self.visible:
+            self.hide()
+        else:
+            self.show()
+
+    def show(self) -> None:
+        if self._hud_ax is None:
+            self._build()
+        self.visible = True
+        self._hud_ax.set_visible(True)
+        self._ends.clear()
+        self._phases.clear()
+        self._pixels = None
+        self._resize_cid = self.fig.canvas.mpl_connect("resize_event", self._on_resize)
+        profiler.watch(self._on_frame, self.fig)
+        self.fig.canvas.draw_idle()
+
+    def hide(self) -> None:
+        self.visible = False
+        profiler.unwatch(self._on_frame)
+        if self._resize_cid is not None:
+            self.fig.canvas.mpl_disconnect(self._resize_cid)
+            self._resize_cid = None
+        self._hud_ax.set_visible(False)
+        self._pixels = None
+        self.fig.canvas.draw_idle()  # repaint the area it covered
+
+    def _build(self) -> None:
+        ax = self.fig.add_axes(HUD_RECT, label="debug-hud")
+        ax.set_animated(True)
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.set_facecolor(HUD_BG)
+        ax.set_zorder(1000)
+
+        style = dict(fontsize=9, family="monospace", color=HUD_TEXT, va="top")
+        self.fps_text = ax.text(
+            0.03, 0.95, "", **dict(style, fontsize=11, fontweight="bold")
+        )
+        self.split_text = ax.text(0.03, 0.73, "", **style)
+        self.scene_text = ax.text(0.03, 0.56, "", **style)
+
+        self.spark = Line2D([], [], color=SPARK_COLOR, linewidth=1)
+        ax.add_line(self.spark)
+        self._hud_ax = ax
+
+    def _on_resize(self, event) -> None:
+        self._pixels = None
+
+    # ── Frames ─────────────────────────────────────────────────────────────────
+
+    def _on_frame(self, phases: tuple) -> None:
+        now = time.perf_counter()
+        self._ends.append(now)
+        self._phases.append(phases)
+
+        canvas = self.fig.canvas
+        if self._pixels is None or now - self._refreshed >= HUD_REFRESH:
+            self._refresh()
+            self._refreshed = now
+            self.fig.draw_artist(self._hud_ax)
+            if canvas.supports_blit:
+                self._pixels = canvas.copy_from_bbox(self._hud_ax.bbox)
+        else:
+            canvas.restore_region(self._pixels)
+        if canvas.supports_blit:
+            canvas.blit(self._hud_ax.bbox)
+
+    def _refresh(self) -> None:
+        """Restyle the HUD artists from the frames seen so far."""
+        intervals = np.diff(np.array(self._ends)) * 1000
+        mean = float(intervals.mean()) if len(intervals) else 0.0
+        if mean > 0:
+            self.fps_text.set_text(f"{1000 / mean:5.1f} FPS {mean:6.1f} ms")
+        else:
+            self.fps_text.set_text("  --  FPS")
+
+        update, build, rasterize = np.mean(self._phases, axis=0) * 1000
+        self.split_text.set_text(
+            f"sim {update:5.1f}  build {build:5.1f}  draw {rasterize:5.1f} ms"
+        )
+        scene = profiler.scene or "-"
+        self.scene_text.set_text(f"{len(self.ax.get_children())} artists  {scene}")
+
+        ceiling = max(SPARK_CEILING_MS, float(intervals.max()) if len(intervals) else 0)
+        heights = np.clip(intervals / ceiling, 0, 1) * 0.4 + 0.05
+        self.spark.set_data(np.linspace(0.03, 0.97, len(heights)), heights)
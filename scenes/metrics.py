@@ -0,0 +1,195 @@
+import json
+import time
+import uuid
+import queue
+import atexit
+import logging
+import platform
+import threading
+
+import numpy as np
+import matplotlib
+
+from scenes.assets import asset_cache
+from scenes.profiler import profiler
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+DEFAULT_METRICS_PATH = "metrics.jsonl"
+METRICS_QUEUE = 256  # records waiting for the writer before new ones are dropped
+INPUT_EVENTS = ("key_press_event", "button_press_event")
+
+
+class JsonlWriter:
+    """
+    Appends JSON records to a file from a background thread.
+
+    write() only enqueues, so the render loop never waits on disk. If the
+    writer falls METRICS_QUEUE records behind, new records are dropped
+    and counted rather than blocking. Whatever is still queued when the
+    process exits is written by an atexit close().
+    """
+
+    def __init__(self, path: str, maxsize: int = METRICS_QUEUE):
+        self.path = path
+        self.dropped = 0
+        self._closed = False
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._file = open(path, "a", encoding="utf-8")
+        self._thread = threading.Thread(
+            target=self._run, name="metrics-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, record: dict) -> None:
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            if record is None:
+                break
+            try:
+                self._file.write(json.dumps(record) + "\n")
+                self._file.flush()
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("Cannot write metrics record to %s: %s", self.path, e)
+
+    def close(self) -> None:
+        """Write everything queued so far, then stop the thread."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._file.close()
+        if self.dropped:
+            logger.warning("Metrics: %d records dropped", self.dropped)
+
+
+def _ms_stats(seconds: list, prefix: str) -> dict:
+    if not seconds:
+        return {f"{prefix}_mean": None, f"{prefix}_p95": None}
+    ms = np.array(seconds) * 1000
+    return {
+        f"{prefix}_mean": round(float(ms.mean()), 3),
+        f"{prefix}_p95": round(float(np.percentile(ms, 95)), 3),
+    }
+
+
+class SessionMetrics:
+    """
+    One machine-readable record per scene, for comparing builds and machines.
+
+    Watches frames through the profiler and input through the canvas.
+    SceneManager calls begin_scene() and end_scene() around every scene;
+    the record covers asset load time, time to first frame, frame time
+    (the work per frame, mean and p95), renders the clock skipped, and
+    the latency from each input event to the next finished frame.
+    Minigame scenes add their retry count and final score. The first
+    line of each session describes the machine and build.
+    """
+
+    def __init__(self, fig, path: str = DEFAULT_METRICS_PATH, clock=None):
+        self.fig = fig
+        self.clock = clock
+        self.writer = JsonlWriter(path)
+        self.session = uuid.uuid4().hex[:12]  # ties a session's records together
+
+        self._start = None
+        self._first_frame = None
+        self._frame_work: list = []
+        self._latencies: list = []
+        self._input_at = None  # oldest input still waiting for a frame
+        self._load_ms = 0.0
+        self._skipped = 0
+
+        self._cids = [
+            fig.canvas.mpl_connect(name, self._on_input) for name in INPUT_EVENTS
+        ]
+        profiler.watch(self._on_frame, fig)
+
+        self.writer.write(
+            {
+                "event": "session",
+                "session": self.session,
+                "started": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "matplotlib": matplotlib.__version__,
+                "backend": matplotlib.get_backend(),
+                "platform": platform.platform(),
+                "machine": platform.node(),
+            }
+        )
+
+    # ── Events ─────────────────────────────────────────────────────────────────
+
+    def _on_input(self, event) -> None:
+        if self._input_at is None:
+            self._input_at = time.perf_counter()
+
+    def _on_frame(self, phases: tuple) -> None:
+        now = time.perf_counter()
+        if self._start is None:
+            return
+        if self._first_frame is None:
+            self._first_frame = now - self._start
+        self._frame_work.append(sum(phases))
+        if self._input_at is not None:
+            self._latencies.append(now - self._input_at)
+            self._input_at = None
+
+    # ── Scenes ─────────────────────────────────────────────────────────────────
+
+    def begin_scene(self) -> None:
+        self._start = time.perf_counter()
+        self._first_frame = None
+        self._frame_work = []
+        self._latencies = []
+        self._input_at = None
+        self._load_ms = asset_cache.stats()["load_ms"]
+        self._skipped = self.clock.frames_skipped if self.clock is not None else 0
+
+    def end_scene(self, index: int, scene_type: str, label: str, **extra) -> dict:
+        """Queue the record for the scene that just ended and return it."""
+        now = time.perf_counter()
+        record = {
+            "event": "scene",
+            "session": self.session,
+            "index": index,
+            "type": scene_type,
+            "scene": label,
+            "duration_ms": round((now - self._start) * 1000, 3),
+            "asset_load_ms": round(asset_cache.stats()["load_ms"] - self._load_ms, 3),
+            "first_frame_ms": (
+                None
+                if self._first_frame is None
+                else round(self._first_frame * 1000, 3)
+            ),
+            "frames": len(self._frame_work),
+            **_ms_stats(self._frame_work, "frame_ms"),
+            "dropped_frames": (
+                self.clock.frames_skipped - self._skipped
+                if self.clock is not None
+                else 0
+            ),
+            "inputs": len(self._latencies),
+            **_ms_stats(self._latencies, "input_latency_ms"),
+        }
+        record.update(extra)
+        self.writer.write(record)
+        self._start = None
+        return record
+
+    def close(self) -> None:
+        profiler.unwatch(self._on_frame)
+        for cid in self._cids:
+            self.fig.canvas.mpl_disconnect(cid)
+        self.writer.close()
@@ -3,15 +3,15 @@ import logging
 from collections import deque
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.animation import FuncAnimation
+
+from scenes.events import wait_for_continue, wait_until
+from scenes.grid import GridRenderer
+from scenes.profiler import profiler
+from scenes.retained import ArtistLayer
 
 logger = logging.getLogger(__name__)
 
 # ── Constants ──────────────────────────────────────────────────────────────────
-ANIM_INTERVAL = 100  # ms between frames
-PAUSE_INTERVAL = 0.05  # seconds between event polls
 
 # Cell colours
 COLOR_HIDDEN = "gray"
@@ -31,6 +31,19 @@ NUMBER_COLORS = {
     8: "#757575",
 }
 
+# Display codes — one per visual cell state, used to redraw only changed cells
+CODE_HIDDEN = 0
+CODE_FLAG = 1
+CODE_MINE = 2
+CODE_REVEALED = 3  # revealed cells are CODE_REVEALED + neighbour count
+
+CODE_PALETTE = [COLOR_HIDDEN, COLOR_FLAG, COLOR_MINE] + [COLOR_REVEALED] * 9
+CODE_GLYPHS = {
+    CODE_FLAG: ("F", "red"),
+    CODE_MINE: ("*", "white"),
+    **{CODE_REVEALED + n: (str(n), color) for n, color in NUMBER_COLORS.items()},
+}
+
 NEIGHBORS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
 
 
@@ -43,6 +56,8 @@ class MinesweeperGame:
         self.num_mines = num_mines
 
         self._reset_state()
+        self._layer = None  # built on first draw
+
         self._click_cid = self.fig.canvas.mpl_connect(
             "button_press_event", self._on_click
         )
@@ -56,6 +71,7 @@ class MinesweeperGame:
         self.game_over = False
         self.game_won = False
         self.first_click = True
+        self.version = 0  # bumped by every change the player can see
 
     # ── Mine placement ─────────────────────────────────────────────────────────
 
@@ -93,11 +109,18 @@ class MinesweeperGame:
         if not (0 <= x < self.width and 0 <= y < self.height):
             return
 
+        version = self.version
         if event.button == 1:
             self._reveal_cell(x, y)
         elif event.button == 3:
             self._toggle_flag(x, y)
 
+        # Clicks on revealed cells change nothing — skip the redraw
+        if self.version != version:
+            with profiler.phase("build"):
+                self._draw()
+            self.fig.canvas.draw_idle()
+
     # ── Game logic ─────────────────────────────────────────────────────────────
 
     def _reveal_cell(self, x: int, y: int) -> None:
@@ -108,6 +131,7 @@ class MinesweeperGame:
             self._place_mines(x, y)
             self.first_click = False
 
+        self.version += 1
         if self.board[y, x] == -1:
             self.revealed[y, x] = True
             self.game_over = True
@@ -133,6 +157,7 @@ class MinesweeperGame:
     def _toggle_flag(self, x: int, y: int) -> None:
         if not self.revealed[y, x]:
             self.flagged[y, x] = not self.flagged[y, x]
+            self.version += 1
 
     def _reveal_all_mines(self) -> None:
         self.revealed[self.board == -1] = True
@@ -146,7 +171,7 @@ class MinesweeperGame:
 
     # ── Drawing ────────────────────────────────────────────────────────────────
 
-    def _draw(self) -> None:
+    def _build_artists(self) -> None:
         self.ax.clear()
         self.ax.set_xlim(0, self.width)
         self.ax.set_ylim(0, self.height)
@@ -155,6 +180,39 @@ class MinesweeperGame:
         self.ax.set_xticks([])
         self.ax.set_yticks([])
 
+        self._layer = ArtistLayer(self.ax)
+        self._grid = GridRenderer(
+            self.ax,
+            self.width,
+            self.height,
+            CODE_PALETTE,
+            glyphs=CODE_GLYPHS,
+            edgecolor="black",
+        )
+
+        # Instructions overlay
+        self._layer.text(
+            0.02,
+            0.98,
+            "Left click: Reveal   Right click: Flag",
+            transform=self.ax.transAxes,
+            fontsize=9,
+            verticalalignment="top",
+            bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.8),
+            zorder=3,
+        )
+
+    def _display_codes(self) -> np.ndarray:
+        revealed_codes = np.where(
+            self.board == -1, CODE_MINE, CODE_REVEALED + self.board
+        )
+        hidden_codes = np.where(self.flagged, CODE_FLAG, CODE_HIDDEN)
+        return np.where(self.revealed, revealed_codes, hidden_codes)
+
+    def _draw(self) -> None:
+        if self._layer is None:
+            self._build_artists()
+
         # Title / status
         if self.game_over:
             self.ax.set_title(
@@ -178,98 +236,8 @@ class MinesweeperGame:
                 fontweight="bold",
             )
 
-        # Cells
-        for y in range(self.height):
-            for x in range(self.width):
-                self._draw_cell(x, y)
-
-        # Instructions overlay
-        self.ax.text(
-            0.02,
-            0.98,
-            "Left click: Reveal   Right click: Flag",
-            transform=self.ax.transAxes,
-            fontsize=9,
-            verticalalignment="top",
-            bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.8),
-        )
-
-    def _draw_cell(self, x: int, y: int) -> None:
-        if self.revealed[y, x]:
-            value = self.board[y, x]
-            color = COLOR_MINE if value == -1 else COLOR_REVEALED
-            self.ax.add_patch(
-                patches.Rectangle(
-                    (x, y),
-                    1,
-                    1,
-                    facecolor=color,
-                    edgecolor="black",
-                    linewidth=1,
-                )
-            )
-            if value == -1:
-                self.ax.text(
-                    x + 0.5,
-                    y + 0.5,
-                    "*",
-                    fontsize=14,
-                    ha="center",
-                    va="center",
-                    color="white",
-                    fontweight="bold",
-                )
-            elif value > 0:
-                self.ax.text(
-                    x + 0.5,
-                    y + 0.5,
-                    str(value),
-                    fontsize=14,
-                    ha="center",
-                    va="center",
-                    color=NUMBER_COLORS.get(value, "black"),
-                    fontweight="bold",
-                )
-
-        elif self.flagged[y, x]:
-            self.ax.add_patch(
-                patches.Rectangle(
-                    (x, y),
-                    1,
-                    1,
-                    facecolor=COLOR_FLAG,
-                    edgecolor="black",
-                    linewidth=1,
-                )
-            )
-            self.ax.text(
-                x + 0.5,
-                y + 0.5,
-                "F",
-                fontsize=14,
-                ha="center",
-                va="center",
-                color="red",
-                fontweight="bold",
-            )
-
-        else:
-            self.ax.add_patch(
-                patches.Rectangle(
-                    (x, y),
-                    1,
-                    1,
-                    facecolor=COLOR_HIDDEN,
-                    edgecolor="black",
-                    linewidth=1,
-                )
-            )
-
-    # ── Animation ──────────────────────────────────────────────────────────────
-
-    def _update(self, frame) -> list:
-        self._draw()
-        return []
+        # Cells — the whole board is one image
+        self._grid.update(self._display_codes())
 
     # ── Cleanup ────────────────────────────────────────────────────────────────
 
@@ -279,40 +247,14 @@ class MinesweeperGame:
     # ── Public API ─────────────────────────────────────────────────────────────
 
     def run(self) -> bool:
-        self.anim = FuncAnimation(
-            self.fig,
-            self._update,
-            interval=ANIM_INTERVAL,
-            blit=False,
-            repeat=True,
-            cache_frame_data=False,
-        )
+        self._draw()
 
         try:
-            while not self.game_over and not self.game_won:
-                plt.pause(PAUSE_INTERVAL)
+            wait_until(self.fig, lambda: self.game_over or self.game_won)
         finally:
-            self.anim.event_source.stop()
             self._disconnect()
 
-        # Brief pause so player can see the final board state
-        end_flag = {"clicked": False}
-
-        def on_click(event):
-            end_flag["clicked"] = True
-
-        def on_key(event):
-            if event.key in (" ", "space"):
-                end_flag["clicked"] = True
-
-        cid_click = self.fig.canvas.mpl_connect("button_press_event", on_click)
-        cid_key = self.fig.canvas.mpl_connect("key_press_event", on_key)
-
-        try:
-            while not end_flag["clicked"]:
-                plt.pause(PAUSE_INTERVAL)
-        finally:
-            self.fig.canvas.mpl_disconnect(cid_click)
-            self.fig.canvas.mpl_disconnect(cid_key)
+        # Let the player see the final board state
+        wait_for_continue(self.fig)
 
         return self.game_won
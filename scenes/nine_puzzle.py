@@ -1,14 +1,16 @@
 import logging
 
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 
+from scenes.events import wait_for_continue, wait_until
+from scenes.redraw import DirtyRedraw
+from scenes.retained import ArtistLayer
+
 logger = logging.getLogger(__name__)
 
 # ── Constants ──────────────────────────────────────────────────────────────────
 GRID_SIZE = 3
-PAUSE_INTERVAL = 0.05  # seconds between event polls
 SOLVED_ORDER = np.append(np.arange(1, GRID_SIZE**2), 0)
 
 # Colours
@@ -28,6 +30,9 @@ class NinePuzzleGame:
         self.tiles = self._generate_solvable_tiles()
         self.empty = tuple(np.argwhere(self.tiles == 0)[0])  # (row, col)
 
+        self._layer = None  # built on first draw
+        self._redraw = DirtyRedraw(fig, self._draw)
+
         self._click_cid = self.fig.canvas.mpl_connect(
             "button_press_event", self._on_click
         )
@@ -101,7 +106,8 @@ class NinePuzzleGame:
         self.empty = (row, col)
         self.moves += 1
         self._check_solved()
-        self._draw()
+        # Only the two swapped tiles and the move counter change
+        self._redraw.mark((er, ec), (row, col), "title")
 
     def _check_solved(self) -> None:
         if np.array_equal(self.tiles.flatten(), SOLVED_ORDER):
@@ -120,46 +126,40 @@ class NinePuzzleGame:
         self.ax.set_xticks([])
         self.ax.set_yticks([])
 
-    def _draw(self) -> None:
+    def _build_artists(self) -> None:
         self._setup_axes()
+        self._layer = ArtistLayer(self.ax)
 
+        # One rectangle and label per board position, restyled as tiles move
+        self._cells = {}
         for row in range(GRID_SIZE):
             for col in range(GRID_SIZE):
-                val = self.tiles[row, col]
                 y = (GRID_SIZE - 1) - row  # flip row → plot y
+                rect = self._layer.add(patches.Rectangle((col, y), 1, 1, linewidth=2))
+                label = self._layer.text(
+                    col + 0.5,
+                    y + 0.5,
+                    "",
+                    fontsize=24,
+                    ha="center",
+                    va="center",
+                    color=TILE_TEXT,
+                )
+                self._cells[row, col] = (rect, label)
+
+    def _draw_cell(self, row: int, col: int) -> None:
+        rect, label = self._cells[row, col]
+        val = self.tiles[row, col]
+        if val == 0:
+            rect.set_facecolor(EMPTY_COLOR)
+            rect.set_edgecolor("white")
+            label.set_text("")
+        else:
+            rect.set_facecolor(TILE_COLOR)
+            rect.set_edgecolor("black")
+            label.set_text(str(val))
 
-                if val == 0:
-                    self.ax.add_patch(
-                        patches.Rectangle(
-                            (col, y),
-                            1,
-                            1,
-                            facecolor=EMPTY_COLOR,
-                            edgecolor="white",
-                            linewidth=2,
-                        )
-                    )
-                else:
-                    self.ax.add_patch(
-                        patches.Rectangle(
-                            (col, y),
-                            1,
-                            1,
-                            facecolor=TILE_COLOR,
-                            edgecolor="black",
-                            linewidth=2,
-                        )
-                    )
-                    self.ax.text(
-                        col + 0.5,
-                        y + 0.5,
-                        str(val),
-                        fontsize=24,
-                        ha="center",
-                        va="center",
-                        color=TILE_TEXT,
-                    )
-
+    def _draw_title(self) -> None:
         if self.solved:
             self.ax.set_title(
                 f"PUZZLE SOLVED in {self.moves} moves!\nPress space to continue",
@@ -175,11 +175,22 @@ class NinePuzzleGame:
                 color="white",
             )
 
-        self.fig.canvas.draw_idle()
+    def _draw(self, dirty=None) -> None:
+        """Update the artists for *dirty* parts — every part when None."""
+        if self._layer is None:
+            self._build_artists()
+            dirty = None
+
+        cells = self._cells if dirty is None else [p for p in dirty if p in self._cells]
+        for row, col in cells:
+            self._draw_cell(row, col)
+        if dirty is None or "title" in dirty:
+            self._draw_title()
 
     # ── Cleanup ────────────────────────────────────────────────────────────────
 
     def _disconnect(self) -> None:
+        self._redraw.close()
         self.fig.canvas.mpl_disconnect(self._click_cid)
         self.fig.canvas.mpl_disconnect(self._key_cid)
 
@@ -188,26 +199,11 @@ class NinePuzzleGame:
     def run(self) -> None:
         self._draw()
 
-        while not self.solved:
-            plt.pause(PAUSE_INTERVAL)
+        wait_until(self.fig, lambda: self.solved)
+        self._redraw.flush()  # show the solved title without waiting a frame
 
         # Wait for space/click to dismiss
-        continue_flag = {"clicked": False}
-
-        def on_click(event):
-            continue_flag["clicked"] = True
-
-        def on_key(event):
-            if event.key in (" ", "space"):
-                continue_flag["clicked"] = True
-
-        cid_click = self.fig.canvas.mpl_connect("button_press_event", on_click)
-        cid_key = self.fig.canvas.mpl_connect("key_press_event", on_key)
-
         try:
-            while not continue_flag["clicked"]:
-                plt.pause(PAUSE_INTERVAL)
+            wait_for_continue(self.fig)
         finally:
-            self.fig.canvas.mpl_disconnect(cid_click)
-            self.fig.canvas.mpl_disconnect(cid_key)
             self._disconnect()
@@ -1,12 +1,14 @@
 import logging
 
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 
+from scenes.events import wait_for_continue, wait_until
+from scenes.redraw import DirtyRedraw
+from scenes.retained import ArtistLayer
+
 logger = logging.getLogger(__name__)
 
 # ── Constants ──────────────────────────────────────────────────────────────────
-PAUSE_INTERVAL = 0.05  # seconds between event polls
 MAX_GUESS_LEN = 16
 DEFAULT_ATTEMPTS = 10
 
@@ -34,6 +36,9 @@ class PasswordPuzzleGame:
         self.state = "playing"  # "playing" | "win" | "lose"
         self.message = ""
 
+        self._layer = None  # built on first draw
+        self._redraw = DirtyRedraw(fig, self._draw)
+
         self._key_cid = self.fig.canvas.mpl_connect("key_press_event", self._handle_key)
 
     # ── Input ──────────────────────────────────────────────────────────────────
@@ -45,7 +50,9 @@ class PasswordPuzzleGame:
         key = event.key or ""
 
         if key == "backspace":
-            self.current_guess = self.current_guess[:-1]
+            if self.current_guess:
+                self.current_guess = self.current_guess[:-1]
+                self._redraw.mark("input")
 
         elif key == "enter":
             self._check_password()
@@ -56,8 +63,7 @@ class PasswordPuzzleGame:
             and len(self.current_guess) < MAX_GUESS_LEN
         ):
             self.current_guess += key.upper()
-
-        self._draw()
+            self._redraw.mark("input")
 
     # ── Game logic ─────────────────────────────────────────────────────────────
 
@@ -66,6 +72,7 @@ class PasswordPuzzleGame:
             return
 
         self.attempts += 1
+        self._redraw.mark("attempts", "message", "instructions")
 
         if self.current_guess == self.password:
             self.state = "win"
@@ -83,6 +90,7 @@ class PasswordPuzzleGame:
                 f"Incorrect! {remaining} attempt{'s' if remaining != 1 else ''} left"
             )
             self.current_guess = ""
+            self._redraw.mark("input")
 
     # ── Drawing ────────────────────────────────────────────────────────────────
 
@@ -96,11 +104,12 @@ class PasswordPuzzleGame:
         self.ax.set_xticks([])
         self.ax.set_yticks([])
 
-    def _draw(self) -> None:
+    def _build_artists(self) -> None:
         self._setup_axes()
+        self._layer = ArtistLayer(self.ax)
 
         # Title
-        self.ax.text(
+        self._layer.text(
             5,
             5.5,
             "Password Puzzle",
@@ -111,7 +120,7 @@ class PasswordPuzzleGame:
         )
 
         # Clues
-        self.ax.text(
+        self._layer.text(
             5,
             4.7,
             "Clues:",
@@ -121,23 +130,22 @@ class PasswordPuzzleGame:
             color=TEXT_COLOR,
         )
         for i, clue in enumerate(self.clues):
-            self.ax.text(
-                5, 4.3 - i * 0.4, clue, fontsize=12, ha="center", color=TEXT_COLOR
+            self._layer.text(
+                5,
+                4.3 - i * 0.4,
+                clue,
+                fontsize=12,
+                ha="center",
+                color=TEXT_COLOR,
             )
 
         # Attempt counter
-        self.ax.text(
-            9.5,
-            5.7,
-            f"{self.attempts}/{self.max_attempts}",
-            fontsize=11,
-            ha="right",
-            va="top",
-            color=TEXT_COLOR,
+        self._attempts_text = self._layer.text(
+            9.5, 5.7, "", fontsize=11, ha="right", va="top", color=TEXT_COLOR
         )
 
         # Input box
-        self.ax.add_patch(
+        self._layer.add(
             patches.Rectangle(
                 (2.5, 2.2),
                 5,
@@ -145,48 +153,54 @@ class PasswordPuzzleGame:
                 facecolor=INPUT_BG,
                 edgecolor=ACCENT_COLOR,
                 linewidth=2,
-            )
+            ),
         )
-        masked = "•" * len(self.current_guess)
-        self.ax.text(5, 2.55, masked, fontsize=24, ha="center", color=ACCENT_COLOR)
+        self._input_text = self._layer.text(
+            5, 2.55, "", fontsize=24, ha="center", color=ACCENT_COLOR
+        )
+
+        # Feedback message and instructions
+        self._message_text = self._layer.text(5, 1.5, "", fontsize=14, ha="center")
+        self._instructions_text = self._layer.text(
+            5, 0.8, "", fontsize=10, ha="center", color=TEXT_COLOR
+        )
+
+    def _draw(self, dirty=None) -> None:
+        """Update the artists for *dirty* parts — every part when None."""
+        if self._layer is None:
+            self._build_artists()
+            dirty = None
 
-        # Feedback message
-        if self.message:
+        def changed(part: str) -> bool:
+            return dirty is None or part in dirty
+
+        if changed("attempts"):
+            self._attempts_text.set_text(f"{self.attempts}/{self.max_attempts}")
+
+        if changed("input"):
+            self._input_text.set_text("•" * len(self.current_guess))
+
+        if changed("message"):
             if self.state == "win":
                 msg_color = WIN_COLOR
             elif self.state == "lose":
                 msg_color = LOSE_COLOR
             else:
                 msg_color = ACCENT_COLOR
-            self.ax.text(
-                5, 1.5, self.message, fontsize=14, ha="center", color=msg_color
-            )
+            self._message_text.set_text(self.message)
+            self._message_text.set_color(msg_color)
 
-        # Instructions
-        if self.state == "playing":
-            self.ax.text(
-                5,
-                0.8,
-                "Type your guess   Enter = Submit   Backspace = Erase",
-                fontsize=10,
-                ha="center",
-                color=TEXT_COLOR,
-            )
-        else:
-            self.ax.text(
-                5,
-                0.8,
-                "Press space or click to continue",
-                fontsize=10,
-                ha="center",
-                color=TEXT_COLOR,
-            )
-
-        self.fig.canvas.draw_idle()
+        if changed("instructions"):
+            if self.state == "playing":
+                instructions = "Type your guess   Enter = Submit   Backspace = Erase"
+            else:
+                instructions = "Press space or click to continue"
+            self._instructions_text.set_text(instructions)
 
     # ── Cleanup ────────────────────────────────────────────────────────────────
 
     def _disconnect(self) -> None:
+        self._redraw.close()
         self.fig.canvas.mpl_disconnect(self._key_cid)
 
     # ── Public API ─────────────────────────────────────────────────────────────
@@ -194,28 +208,12 @@ class PasswordPuzzleGame:
     def run(self) -> None:
         self._draw()
 
-        while self.state == "playing":
-            plt.pause(PAUSE_INTERVAL)
+        wait_until(self.fig, lambda: self.state != "playing")
 
         # Show final state then wait for dismissal
-        self._draw()
-
-        continue_flag = {"clicked": False}
-
-        def on_click(event):
-            continue_flag["clicked"] = True
-
-        def on_key(event):
-            if event.key in (" ", "space"):
-                continue_flag["clicked"] = True
-
-        cid_click = self.fig.canvas.mpl_connect("button_press_event", on_click)
-        cid_key = self.fig.canvas.mpl_connect("key_press_event", on_key)
+        self._redraw.flush()
 
         try:
-            while not continue_flag["clicked"]:
-                plt.pause(PAUSE_INTERVAL)
+            wait_for_continue(self.fig)
         finally:
-            self.fig.canvas.mpl_disconnect(cid_click)
-            self.fig.canvas.mpl_disconnect(cid_key)
             self._disconnect()
@@ -1,15 +1,17 @@
 import logging
 
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.animation import FuncAnimation
+from matplotlib.lines import Line2D
+
+from scenes.clock import ClockedGame, EngineClock, lerp
+from scenes.retained import ArtistLayer
 
 logger = logging.getLogger(__name__)
 
 # ── Constants ──────────────────────────────────────────────────────────────────
-ANIM_INTERVAL = 30  # ms between frames
-PAUSE_INTERVAL = 0.01  # seconds between event polls
+SIM_STEP = 0.03  # seconds per physics step — the speeds below are per step
+FRAME_INTERVAL = 16  # ms between rendered frames
 
 PADDLE_WIDTH = 0.3
 PADDLE_HEIGHT = 2.0
@@ -28,14 +30,26 @@ BALL_COLOR = "white"
 WALL_COLOR = "#333333"
 
 
-class PongGame:
-    def __init__(self, fig, ax, width: int = 10, height: int = 8):
-        self.fig = fig
-        self.ax = ax
+class PongGame(ClockedGame):
+    tick_interval = FRAME_INTERVAL
+    sim_step = SIM_STEP
+
+    def __init__(
+        self,
+        fig,
+        ax,
+        width: int = 10,
+        height: int = 8,
+        blit: bool = False,
+        clock: EngineClock | None = None,
+    ):
+        super().__init__(fig, ax, blit, clock)
         self.width = width
         self.height = height
 
         self._reset_state()
+        self._layer = None  # built on first draw
+        self.decorations: list = []  # hidden by the engine when frames run late
 
         # Track held keys for smooth paddle movement
         self._keys_held: set = set()
@@ -52,6 +66,9 @@ class PongGame:
         self.paddle_y = self.height / 2 - PADDLE_HEIGHT / 2
         self.ball_pos = [float(self.width // 2), float(self.height // 2)]
         self.ball_vel = list(BALL_INIT_VEL)
+        # State one step back, for interpolation
+        self.prev_paddle_y = self.paddle_y
+        self.prev_ball_pos = list(self.ball_pos)
         self.score = 0
         self.game_over = False
 
@@ -78,10 +95,12 @@ class PongGame:
 
     # ── Physics ────────────────────────────────────────────────────────────────
 
-    def _update(self, frame) -> list:
+    def update(self, dt: float) -> None:
         if self.game_over:
-            self._draw()
-            return []
+            return
+
+        self.prev_paddle_y = self.paddle_y
+        self.prev_ball_pos = list(self.ball_pos)
 
         self._apply_paddle_input()
 
@@ -138,8 +157,9 @@ class PongGame:
         elif self.ball_pos[0] < PADDLE_X - BALL_RADIUS:
             self.game_over = True
 
-        self._draw()
-        return []
+    def render(self, alpha: float = 1.0) -> list:
+        self._draw(alpha)
+        return self._animated_artists()
 
     # ── Drawing ────────────────────────────────────────────────────────────────
 
@@ -153,20 +173,25 @@ class PongGame:
         self.ax.set_xticks([])
         self.ax.set_yticks([])
 
-    def _draw(self) -> None:
+    def _build_artists(self) -> None:
         self._setup_axes()
+        self._layer = ArtistLayer(self.ax)
 
-        # Centre dashed line
+        # Centre dashed line — static, created once
+        self.decorations = []
         for y in np.arange(0.5, self.height, 1.0):
-            self.ax.plot(
-                [self.width / 2, self.width / 2],
-                [y, y + 0.5],
-                color=WALL_COLOR,
-                linewidth=1,
+            dash = self._layer.add(
+                Line2D(
+                    [self.width / 2, self.width / 2],
+                    [y, y + 0.5],
+                    color=WALL_COLOR,
+                    linewidth=1,
+                ),
+                static=True,
             )
+            self.decorations.append(dash)
 
-        # Paddle
-        self.ax.add_patch(
+        self._paddle = self._layer.add(
             patches.Rectangle(
                 (PADDLE_X, self.paddle_y),
                 PADDLE_WIDTH,
@@ -174,9 +199,7 @@ class PongGame:
                 facecolor=PADDLE_COLOR,
             )
         )
-
-        # Ball
-        self.ax.add_patch(
+        self._ball = self._layer.add(
             patches.Circle(
                 self.ball_pos,
                 BALL_RADIUS,
@@ -184,6 +207,15 @@ class PongGame:
             )
         )
 
+    def _draw(self, alpha: float = 1.0) -> None:
+        if self._layer is None:
+            self._build_artists()
+
+        paddle_y = lerp(self.prev_paddle_y, self.paddle_y, alpha)
+        ball = [lerp(p, c, alpha) for p, c in zip(self.prev_ball_pos, self.ball_pos)]
+        self._paddle.set_xy((PADDLE_X, paddle_y))
+        self._ball.set_center(tuple(ball))
+
         # HUD
         if self.game_over:
             self.ax.set_title(
@@ -200,51 +232,13 @@ class PongGame:
                 color="white",
             )
 
+    def _animated_artists(self) -> list:
+        if self._layer is None:
+            return []
+        return self._layer.dynamic + [self.ax.title]
+
     # ── Cleanup ────────────────────────────────────────────────────────────────
 
     def _disconnect(self) -> None:
         self.fig.canvas.mpl_disconnect(self._key_cid)
         self.fig.canvas.mpl_disconnect(self._keyup_cid)
-
-    # ── Public API ─────────────────────────────────────────────────────────────
-
-    def run(self) -> int:
-        self.anim = FuncAnimation(
-            self.fig,
-            self._update,
-            interval=ANIM_INTERVAL,
-            blit=False,
-            repeat=True,
-            cache_frame_data=False,
-        )
-
-        try:
-            while not self.game_over:
-                plt.pause(PAUSE_INTERVAL)
-        finally:
-            self.anim.event_source.stop()
-
-        self._draw()
-
-        # Wait for space or click to dismiss
-        continue_flag = {"clicked": False}
-
-        def on_click(event):
-            continue_flag["clicked"] = True
-
-        def on_key(event):
-            if event.key in (" ", "space"):
-                continue_flag["clicked"] = True
-
-        cid_click = self.fig.canvas.mpl_connect("button_press_event", on_click)
-        cid_key = self.fig.canvas.mpl_connect("key_press_event", on_key)
-
-        try:
-            while not continue_flag["clicked"]:
-                plt.pause(PAUSE_INTERVAL)
-        finally:
-            self.fig.canvas.mpl_disconnect(cid_click)
-            self.fig.canvas.mpl_disconnect(cid_key)
-            self._disconnect()
-
-        return self.score
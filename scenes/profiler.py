@@ -0,0 +1,214 @@
+import time
+import logging
+from contextlib import nullcontext
+
+import numpy as np
+
+from scenes.trace import tracer
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+PROFILE_FRAMES = 2048  # frames kept per scene; older ones are overwritten
+PHASES = ("update", "build", "rasterize")  # simulation, artist updates, canvas
+PERCENTILES = (50, 95, 99)
+WORST_FRAMES = 3  # slowest frames listed in each scene's report
+
+
+class _PhaseTimer:
+    """Adds the time spent inside a with block to one phase of the frame."""
+
+    __slots__ = ("totals", "index", "name", "depth", "start")
+
+    def __init__(self, totals: list, index: int):
+        self.totals = totals
+        self.index = index
+        self.name = PHASES[index]
+        self.depth = 0  # nested blocks count once, e.g. a draw inside a blit
+        self.start = 0.0
+
+    def __enter__(self):
+        self.depth += 1
+        if self.depth == 1:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.depth -= 1
+        if self.depth == 0:
+            end = time.perf_counter()
+            self.totals[self.index] += end - self.start
+            tracer.complete(self.name, self.start, end, "frame")
+        return False
+
+
+class FrameProfiler:
+    """
+    Opt-in per-phase frame timings for every scene.
+
+    Code that simulates, updates artists or rasterizes wraps the work in
+    profiler.phase(name). The time adds up until the frame is shown —
+    a blit calls end_frame() itself, and a full figure draw ends the frame
+    once the figure is instrumented. Each frame becomes one row of a
+    fixed-size ring buffer, so a long scene keeps only its most recent
+    PROFILE_FRAMES frames.
+
+    SceneManager brackets each scene with begin_scene() and end_scene(),
+    which logs p50/p95/p99 per phase and the slowest frames. Code can
+    also watch() frames as they end, e.g. the debug HUD. While nothing
+    reports or watches, phase() returns a shared no-op context and
+    nothing is kept.
+    """
+
+    def __init__(self, capacity: int = PROFILE_FRAMES):
+        self.enabled = False  # timing frames: reporting, or someone is watching
+        self.report = False  # log a summary at the end of each scene
+        self.capacity = capacity
+        self.samples = np.zeros((capacity, len(PHASES)))  # seconds per phase
+        self.frame_ids = np.zeros(capacity, dtype=np.int64)
+        self.frames = 0  # frames recorded for the current scene
+        self.scene = None
+
+        self._current = [0.0] * len(PHASES)
+        self._timers = {
+            name: _PhaseTimer(self._current, i) for i, name in enumerate(PHASES)
+        }
+        self._off = nullcontext()
+        self._listeners: list = []
+
+    def enable(self, fig=None) -> None:
+        """Start reporting, timing full draws of *fig* as rasterization."""
+        self.report = True
+        self._update_enabled()
+        if fig is not None:
+            self.instrument(fig)
+
+    def disable(self) -> None:
+        self.report = False
+        self._update_enabled()
+
+    def watch(self, callback, fig=None) -> None:
+        """Call *callback* with each frame's phase times (seconds) as it ends."""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+        self._update_enabled()
+        if fig is not None:
+            self.instrument(fig)
+
+    def unwatch(self, callback) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+        self._update_enabled()
+
+    def _update_enabled(self) -> None:
+        self.enabled = self.report or bool(self._listeners)
+
+    def instrument(self, fig) -> None:
+        """Time every full draw of *fig* and end the frame when it completes."""
+        if getattr(fig, "_profiled_draw", False):
+            return
+        draw = fig.draw
+        timer = self._timers["rasterize"]
+
+        def profiled_draw(renderer):
+            if not self.enabled:
+                return draw(renderer)
+            nested = timer.depth > 0  # e.g. a blitter capturing its background
+            with timer:
+                result = draw(renderer)
+            if not nested:
+                self.end_frame()
+            return result
+
+        fig.draw = profiled_draw
+        fig._profiled_draw = True
+
+    # ── Frames ─────────────────────────────────────────────────────────────────
+
+    def phase(self, name: str):
+        """Context manager adding its duration to phase *name* of this frame."""
+        if not self.enabled:
+            return self._off
+        return self._timers[name]
+
+    def end_frame(self) -> None:
+        """Store the current frame's phase times and start the next frame."""
+        if not self.enabled:
+            return
+        phases = tuple(self._current)
+        row = self.frames % self.capacity
+        self.samples[row] = phases
+        self.frame_ids[row] = self.frames
+        self.frames += 1
+        self._current[:] = [0.0] * len(PHASES)
+        for callback in self._listeners:
+            callback(phases)
+
+    # ── Scenes ─────────────────────────────────────────────────────────────────
+
+    def begin_scene(self, name: str) -> None:
+        self.scene = name
+        self.frames = 0
+        self._current[:] = [0.0] * len(PHASES)
+
+    def end_scene(self) -> dict | None:
+        """Log and return the current scene's timings; None if nothing was drawn."""
+        summary = self.summary() if self.report else None
+        if summary is not None:
+            self._log(summary)
+        self.scene = None
+        self.frames = 0
+        return summary
+
+    def summary(self) -> dict | None:
+        """Percentiles per phase and the slowest frames, in milliseconds."""
+        kept = min(self.frames, self.capacity)
+        if not kept:
+            return None
+
+        ms = self.samples[:kept] * 1000
+        totals = ms.sum(axis=1)
+        phases = {}
+        for i, name in enumerate(PHASES):
+            phases[name] = dict(zip(PERCENTILES, np.percentile(ms[:, i], PERCENTILES)))
+        phases["total"] = dict(zip(PERCENTILES, np.percentile(totals, PERCENTILES)))
+
+        worst = []
+        for row in np.argsort(totals)[::-1][:WORST_FRAMES]:
+            frame = {"frame": int(self.frame_ids[row]), "total": float(totals[row])}
+            frame.update(zip(PHASES, ms[row].tolist()))
+            worst.append(frame)
+
+        return {
+            "scene": self.scene,
+            "frames": self.frames,
+            "kept": kept,
+            "phases": phases,
+            "worst": worst,
+        }
+
+    def _log(self, summary: dict) -> None:
+        logger.info(
+            "Profile %s: %d frames (last %d kept)",
+            summary["scene"],
+            summary["frames"],
+            summary["kept"],
+        )
+        for name, pct in summary["phases"].items():
+            logger.info(
+                "  %-9s p50 %6.2f  p95 %6.2f  p99 %6.2f ms",
+                name,
+                pct[50],
+                pct[95],
+                pct[99],
+            )
+        for frame in summary["worst"]:
+            logger.info(
+                "  worst #%d: %.2f ms (%s)",
+                frame["frame"],
+                frame["total"],
+                ", ".join(f"{name} {frame[name]:.2f}" for name in PHASES),
+            )
+
+
+profiler = FrameProfiler()
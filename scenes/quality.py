@@ -0,0 +1,139 @@
+import logging
+import weakref
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+QUALITY_LEVELS = (
+    {"name": "full", "antialiased": True, "decorations": True},
+    {"name": "no-antialiasing", "antialiased": False, "decorations": True},
+    {"name": "minimal", "antialiased": False, "decorations": False},
+)
+MAX_FRAME_SKIP = 3  # renders skipped in a row, however far behind
+DEGRADE_AFTER = 15  # consecutive late frames before stepping quality down
+RECOVER_AFTER = 90  # consecutive frames with headroom before stepping back up
+HEADROOM = 0.6  # a frame using less than this share of its budget has headroom
+
+
+def _antialiasable(artist) -> bool:
+    return hasattr(artist, "set_antialiased") and hasattr(artist, "get_antialiased")
+
+
+class QualityGovernor:
+    """
+    Trades render quality for frame rate when a machine cannot keep up.
+
+    The clock reports each rendered frame's load: the time spent rendering
+    plus how late the tick arrived, as a share of the tick interval. A
+    late frame makes the following ticks skip rendering (up to
+    MAX_FRAME_SKIP), which lets the event loop drain instead of piling up
+    timer events. If frames stay late for DEGRADE_AFTER in a row, the
+    governor steps down one of *levels*. After RECOVER_AFTER frames with
+    headroom, it steps back up.
+
+    Each level turns antialiasing on or off for every artist in the
+    figure, and shows or hides the artists a scene lists in its optional
+    decorations attribute.
+    """
+
+    def __init__(
+        self,
+        levels=QUALITY_LEVELS,
+        degrade_after: int = DEGRADE_AFTER,
+        recover_after: int = RECOVER_AFTER,
+    ):
+        self.levels = levels
+        self.degrade_after = degrade_after
+        self.recover_after = recover_after
+        self.level = 0  # kept across scenes — a slow machine stays slow
+
+        self._fig = None
+        self._scene = None
+        # artist -> its own antialiasing, recorded the first time it is degraded.
+        # Kept across scenes: artists such as the F3 HUD outlive the scene
+        # and would otherwise be recorded again while already degraded.
+        self._originals = weakref.WeakKeyDictionary()
+        self._pending = False  # level still to apply to a new scene's artists
+        self._late = 0
+        self._easy = 0
+        self._skip = 0
+        self.skipped = 0
+
+    @property
+    def settings(self) -> dict:
+        return self.levels[self.level]
+
+    # ── Scenes ─────────────────────────────────────────────────────────────────
+
+    def attach(self, fig, scene) -> None:
+        self._fig = fig
+        self._scene = scene
+        self._late = self._easy = self._skip = 0
+        self.skipped = 0
+        # Scenes build their artists on the first frame, so wait for it
+        self._pending = self.level > 0
+
+    def detach(self) -> None:
+        self._fig = None
+        self._scene = None
+
+    # ── Frames ─────────────────────────────────────────────────────────────────
+
+    def should_render(self) -> bool:
+        """False while frames are being skipped to catch up."""
+        if self._skip:
+            self._skip -= 1
+            self.skipped += 1
+            return False
+        return True
+
+    def record(self, load: float) -> bool:
+        """
+        Account for a rendered frame that used *load* of its budget.
+
+        Returns True when the quality level changed, so every artist needs
+        a full redraw.
+        """
+        if self._pending:
+            self._pending = False
+            self._apply()
+            return True
+
+        if load > 1:
+            self._skip = min(MAX_FRAME_SKIP, int(load))
+            self._late += 1
+            self._easy = 0
+        elif load < HEADROOM:
+            self._easy += 1
+            self._late = 0
+        else:
+            self._late = self._easy = 0
+
+        if self._late >= self.degrade_after and self.level < len(self.levels) - 1:
+            return self._set_level(self.level + 1)
+        if self._easy >= self.recover_after and self.level > 0:
+            return self._set_level(self.level - 1)
+        return False
+
+    # ── Levels ─────────────────────────────────────────────────────────────────
+
+    def _set_level(self, level: int) -> bool:
+        self.level = level
+        self._late = self._easy = 0
+        logger.info("Render quality: %s", self.settings["name"])
+        if self._fig is not None:
+            self._apply()
+        return True
+
+    def _apply(self) -> None:
+        settings = self.settings
+        for artist in self._fig.findobj(_antialiasable):
+            if artist not in self._originals:
+                self._originals[artist] = artist.get_antialiased()
+            if settings["antialiased"]:
+                artist.set_antialiased(self._originals[artist])
+            else:
+                artist.set_antialiased(False)
+
+        for artist in getattr(self._scene, "decorations", ()):
+            artist.set_visible(settings["decorations"])
@@ -0,0 +1,58 @@
+import logging
+
+from scenes.profiler import profiler
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+COALESCE_INTERVAL = 16  # ms that input is gathered before one redraw
+
+
+class DirtyRedraw:
+    """
+    Redraws the parts of an input-driven scene that changed, once per frame.
+
+    Input handlers call mark() with the names of the elements they
+    changed, e.g. a tile position or "title". The first mark starts a
+    single-shot timer; when it fires, draw(dirty) receives every part
+    marked since, updates just those artists, and one draw_idle follows.
+    A burst of key repeats or fast typing therefore costs a single redraw.
+    """
+
+    def __init__(self, fig, draw, interval: int = COALESCE_INTERVAL):
+        self.fig = fig
+        self._draw = draw
+        self.dirty: set = set()
+        self.flushes = 0
+
+        self._timer = fig.canvas.new_timer(interval=interval)
+        self._timer.single_shot = True
+        self._timer.add_callback(self.flush)
+        self._pending = False
+
+    def mark(self, *parts) -> None:
+        """Schedule a redraw of *parts* with the next flush."""
+        self.dirty.update(parts)
+        if not self._pending:
+            self._pending = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Redraw everything marked so far, now."""
+        if self._pending:
+            self._pending = False
+            self._timer.stop()
+        if not self.dirty:
+            return
+
+        dirty, self.dirty = self.dirty, set()
+        with profiler.phase("build"):
+            self._draw(dirty)
+        self.flushes += 1
+        self.fig.canvas.draw_idle()
+
+    def close(self) -> None:
+        """Drop pending parts and stop the timer."""
+        self._timer.stop()
+        self._pending = False
+        self.dirty.clear()
@@ -0,0 +1,96 @@
+import logging
+
+import matplotlib.patches as patches
+from matplotlib.lines import Line2D
+from matplotlib.text import Text
+
+logger = logging.getLogger(__name__)
+
+
+class ArtistLayer:
+    """
+    Retained-mode artists for a single axes.
+
+    Artists are added once and then updated in place every frame
+    (set_xy, set_center, set_text, set_facecolor) instead of being rebuilt
+    after an ax.clear(). Variable-length groups such as snake segments or
+    pipes live in named pools that grow on demand and hide their surplus.
+
+    Artists added with static=True never change after creation; they are
+    left out of dynamic so a blitter can keep them in its cached background.
+    """
+
+    def __init__(self, ax):
+        self.ax = ax
+        self._artists: list = []
+        self._static: set = set()
+        self._pools: dict = {}
+
+    # ── Artists ────────────────────────────────────────────────────────────────
+
+    def add(self, artist, static: bool = False):
+        """Attach an artist to the axes and keep it for the layer's lifetime."""
+        if isinstance(artist, patches.Patch):
+            self.ax.add_patch(artist)
+        elif isinstance(artist, Line2D):
+            self.ax.add_line(artist)
+        else:
+            self.ax.add_artist(artist)
+        self._track(artist, static)
+        return artist
+
+    def text(
+        self, x: float, y: float, s: str = "", static: bool = False, **kwargs
+    ) -> Text:
+        """Create a persistent text artist — update it later with set_text."""
+        artist = self.ax.text(x, y, s, **kwargs)
+        self._track(artist, static)
+        return artist
+
+    def _track(self, artist, static: bool) -> None:
+        self._artists.append(artist)
+        if static:
+            self._static.add(artist)
+
+    # ── Pools ──────────────────────────────────────────────────────────────────
+
+    def pool(self, name: str, factory, count: int) -> list:
+        """
+        Return the first *count* artists of the named pool.
+
+        The pool grows by calling factory(index) when it is too short;
+        artists beyond *count* are hidden rather than removed so they can
+        be reused on a later frame.
+        """
+        members = self._pools.setdefault(name, [])
+        while len(members) < count:
+            members.append(self.add(factory(len(members))))
+
+        for i, artist in enumerate(members):
+            visible = i < count
+            if artist.get_visible() != visible:
+                artist.set_visible(visible)
+
+        return members[:count]
+
+    # ── Bookkeeping ────────────────────────────────────────────────────────────
+
+    @property
+    def artists(self) -> list:
+        return list(self._artists)
+
+    @property
+    def dynamic(self) -> list:
+        """Artists that may change from frame to frame."""
+        return [a for a in self._artists if a not in self._static]
+
+    def remove(self) -> None:
+        """Detach every artist owned by the layer from its axes."""
+        for artist in self._artists:
+            try:
+                artist.remove()
+            except (ValueError, NotImplementedError):
+                logger.debug("Artist already detached: %r", artist)
+        self._artists.clear()
+        self._static.clear()
+        self._pools.clear()
@@ -0,0 +1,151 @@
+import os
+import re
+import sys
+import cProfile
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+PROFILE_DIR = "profiles"  # where .pstats and .folded files are written
+PROFILE_MODES = ("cprofile", "sample")
+SAMPLE_INTERVAL = 0.005  # seconds between stack samples
+MATCH_ALL = "*"
+
+
+def scene_matches(selector: str, number: int, scene: dict) -> bool:
+    """
+    True if *selector* — a scene number, a scene type, a game name or * —
+    names the scene. Scenes are numbered from 1, as story errors count them.
+    """
+    if selector == MATCH_ALL:
+        return True
+    if selector.isdigit():
+        return int(selector) == number
+    return selector in (scene.get("type"), scene.get("game"))
+
+
+class StackSampler:
+    """
+    Samples one thread's Python stack at a fixed interval from a daemon thread.
+
+    The profiled thread runs untouched; every SAMPLE_INTERVAL the sampler
+    reads its current frame with sys._current_frames() and counts the
+    stack. The counts are written in the collapsed format flamegraph.pl,
+    speedscope and inferno read: "outer;inner;leaf count" per line.
+    """
+
+    def __init__(self, thread_id: int | None = None, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._labels: dict = {}  # code object -> frame label
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = os.path.basename(code.co_filename)
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class SceneProfiler:
+    """
+    Profiles the scenes a selector names, one set of files per scene.
+
+    In "cprofile" mode the scene runs under cProfile, written as .pstats
+    for pstats or snakeviz, with a StackSampler alongside for a .folded
+    flamegraph. "sample" mode runs only the sampler, whose cost is a
+    short stack walk every SAMPLE_INTERVAL — cheap enough to leave on in
+    production builds, e.g. with the * selector.
+    """
+
+    def __init__(
+        self, selector: str, mode: str = "cprofile", directory: str = PROFILE_DIR
+    ):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode {mode!r}")
+        self.selector = selector
+        self.mode = mode
+        self.directory = directory
+        self.written: list = []  # paths of every file written
+
+    def profile(self, number: int, scene: dict, label: str):
+        """Context manager profiling scene *number* if the selector matches it."""
+        if not scene_matches(self.selector, number, scene):
+            return nullcontext()
+        return self._profile(number, label)
+
+    @contextmanager
+    def _profile(self, number: int, label: str):
+        slug = re.sub(r"[^\w.-]+", "-", label).strip("-")
+        base = os.path.join(self.directory, f"scene-{number:03d}-{slug}")
+
+        sampler = StackSampler()
+        profile = cProfile.Profile() if self.mode == "cprofile" else None
+        sampler.start()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            sampler.stop()
+            self._write(base, profile, sampler)
+
+    def _write(self, base: str, profile, sampler: StackSampler) -> None:
+        paths = []
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if profile is not None:
+                profile.dump_stats(base + ".pstats")
+                paths.append(base + ".pstats")
+            sampler.write_collapsed(base + ".folded")
+            paths.append(base + ".folded")
+        except OSError as e:
+            logger.warning("Cannot write scene profile %s: %s", base, e)
+        self.written.extend(paths)
+        logger.info(
+            "Scene profile (%s, %d samples): %s",
+            self.mode,
+            sampler.samples,
+            ", ".join(paths),
+        )
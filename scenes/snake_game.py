@@ -2,15 +2,16 @@ import random
 import logging
 from collections import deque
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.animation import FuncAnimation
+import numpy as np
+
+from scenes.clock import ClockedGame, EngineClock
+from scenes.grid import GridRenderer
 
 logger = logging.getLogger(__name__)
 
 # ── Constants ──────────────────────────────────────────────────────────────────
-ANIM_INTERVAL = 200  # ms between frames (controls snake speed)
-PAUSE_INTERVAL = 0.05  # seconds between event polls
+ANIM_INTERVAL = 40  # ms between ticks — well under SIM_STEP so moves keep an even beat
+SIM_STEP = 0.2  # seconds per snake move (controls snake speed)
 
 FOOD_SCORE = 10
 
@@ -20,6 +21,10 @@ HEAD_COLOR = "darkgreen"
 BODY_COLOR = "green"
 FOOD_COLOR = "red"
 
+# Grid codes → palette index
+CODE_EMPTY, CODE_BODY, CODE_HEAD, CODE_FOOD = range(4)
+CODE_PALETTE = [BG_COLOR, BODY_COLOR, HEAD_COLOR, FOOD_COLOR]
+
 # Direction vectors
 DIR_UP = (0, 1)
 DIR_DOWN = (0, -1)
@@ -34,14 +39,25 @@ KEY_TO_DIR = {
 }
 
 
-class SnakeGame:
-    def __init__(self, fig, ax, width: int = 20, height: int = 20):
-        self.fig = fig
-        self.ax = ax
+class SnakeGame(ClockedGame):
+    tick_interval = ANIM_INTERVAL
+    sim_step = SIM_STEP
+
+    def __init__(
+        self,
+        fig,
+        ax,
+        width: int = 20,
+        height: int = 20,
+        blit: bool = False,
+        clock: EngineClock | None = None,
+    ):
+        super().__init__(fig, ax, blit, clock)
         self.width = width
         self.height = height
 
         self._reset_state()
+        self._grid = None  # board image, built on first draw
 
         self._key_cid = self.fig.canvas.mpl_connect("key_press_event", self._on_key)
 
@@ -56,6 +72,7 @@ class SnakeGame:
         self.food = self._generate_food()
         self.score = 0
         self.game_over = False
+        self.version = 0
 
     # ── Food ───────────────────────────────────────────────────────────────────
 
@@ -85,6 +102,7 @@ class SnakeGame:
 
         # Apply buffered direction once per frame
         self.direction = self._queued_dir
+        self.version += 1  # the snake moves or dies every step
 
         head_x, head_y = self.snake[0]
         new_head = (head_x + self.direction[0], head_y + self.direction[1])
@@ -127,33 +145,25 @@ class SnakeGame:
         self.ax.set_xticks([])
         self.ax.set_yticks([])
 
-    def _draw(self) -> None:
+    def _build_artists(self) -> None:
         self._setup_axes()
-
-        # Snake
-        for i, segment in enumerate(self.snake):
-            self.ax.add_patch(
-                patches.Rectangle(
-                    segment,
-                    1,
-                    1,
-                    facecolor=HEAD_COLOR if i == 0 else BODY_COLOR,
-                    edgecolor="black",
-                    linewidth=1,
-                )
-            )
-
-        # Food
-        self.ax.add_patch(
-            patches.Rectangle(
-                self.food,
-                1,
-                1,
-                facecolor=FOOD_COLOR,
-                edgecolor="black",
-                linewidth=1,
-            )
+        self._grid = GridRenderer(
+            self.ax, self.width, self.height, CODE_PALETTE, edgecolor="black"
         )
+        self._codes = np.empty((self.height, self.width), dtype=np.intp)
+
+    def _draw(self) -> None:
+        if self._grid is None:
+            self._build_artists()
+
+        # Snake and food are painted into one code array, shown as a single image
+        codes = self._codes
+        codes.fill(CODE_EMPTY)
+        xs, ys = np.array(self.snake).T
+        codes[ys, xs] = CODE_BODY
+        codes[ys[0], xs[0]] = CODE_HEAD
+        codes[self.food[1], self.food[0]] = CODE_FOOD
+        self._grid.update(codes)
 
         # HUD
         if self.game_over:
@@ -173,55 +183,26 @@ class SnakeGame:
 
     # ── Animation ──────────────────────────────────────────────────────────────
 
-    def _update(self, frame) -> list:
+    def _animated_artists(self) -> list:
+        if self._grid is None:
+            return []
+        return self._grid.artists + [self.ax.title]
+
+    @property
+    def decorations(self) -> list:
+        """Grid lines the engine may hide when frames run late."""
+        if self._grid is None or self._grid.edges is None:
+            return []
+        return [self._grid.edges]
+
+    def update(self, dt: float) -> None:
         self._move_snake()
+
+    def render(self, alpha: float = 1.0) -> list:
         self._draw()
-        return []
+        return self._animated_artists()
 
     # ── Cleanup ────────────────────────────────────────────────────────────────
 
     def _disconnect(self) -> None:
         self.fig.canvas.mpl_disconnect(self._key_cid)
-
-    # ── Public API ─────────────────────────────────────────────────────────────
-
-    def run(self) -> int:
-        self.anim = FuncAnimation(
-            self.fig,
-            self._update,
-            interval=ANIM_INTERVAL,
-            blit=False,
-            repeat=True,
-            cache_frame_data=False,
-        )
-
-        try:
-            while not self.game_over:
-                plt.pause(PAUSE_INTERVAL)
-        finally:
-            self.anim.event_source.stop()
-
-        self._draw()
-
-        # Wait for space or click to dismiss
-        continue_flag = {"clicked": False}
-
-        def on_click(event):
-            continue_flag["clicked"] = True
-
-        def on_key(event):
-            if event.key in (" ", "space"):
-                continue_flag["clicked"] = True
-
-        cid_click = self.fig.canvas.mpl_connect("button_press_event", on_click)
-        cid_key = self.fig.canvas.mpl_connect("key_press_event", on_key)
-
-        try:
-            while not continue_flag["clicked"]:
-                plt.pause(PAUSE_INTERVAL)
-        finally:
-            self.fig.canvas.mpl_disconnect(cid_click)
-            self.fig.canvas.mpl_disconnect(cid_key)
-            self._disconnect()
-
-        return self.score
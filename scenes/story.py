@@ -0,0 +1,364 @@
+import os
+import json
+import hashlib
+import logging
+import tempfile
+
+from scenes.conversation_cutscene import conversation_assets
+from scenes.text_scene import text_scene_assets
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+STORY_FORMAT_VERSION = 2  # bump when Story changes so cached artifacts are rebuilt
+SCENE_TYPES = ("conversation", "text", "minigame", "exit")
+SIDES = ("left", "right", "center")
+ARTIFACT_PREFIX = "story-"
+ARTIFACT_SUFFIX = ".json"
+
+
+class StoryError(ValueError):
+    """Raised when story.json cannot be played. problems lists every issue found."""
+
+    def __init__(self, problems: list):
+        self.problems = list(problems)
+        super().__init__("; ".join(self.problems))
+
+
+class Story:
+    """
+    A validated story, ready to play.
+
+    Asset paths are absolute. manifests[i] lists the (path, extent) images
+    scene i shows, and locations maps each location to the indices of the
+    scenes set there.
+    """
+
+    def __init__(
+        self,
+        scenes: list,
+        characters: dict,
+        settings: dict,
+        manifests: list,
+        locations: dict,
+    ):
+        self.scenes = scenes
+        self.characters = characters
+        self.settings = settings
+        self.manifests = manifests
+        self.locations = locations
+
+
+# ── Compilation ────────────────────────────────────────────────────────────────
+
+
+def _resolve(path, base_path: str):
+    if not isinstance(path, str) or not path or os.path.isabs(path):
+        return path
+    return os.path.normpath(os.path.join(base_path, path))
+
+
+def _check_characters(characters: dict, problems: list) -> dict:
+    checked = {}
+    for name, info in characters.items():
+        if not isinstance(info, dict):
+            problems.append(f"character {name!r} must be an object")
+            continue
+        if info.get("side", "center") not in SIDES:
+            problems.append(
+                f"character {name!r} has side {info['side']!r}, "
+                f"expected one of {', '.join(SIDES)}"
+            )
+        checked[name] = dict(info)
+    return checked
+
+
+def _check_settings(settings: dict, problems: list) -> dict:
+    checked = {}
+    for location, info in settings.items():
+        if not isinstance(info, dict):
+            problems.append(f"location {location!r} must be an object")
+            continue
+        checked[location] = dict(info)
+    return checked
+
+
+def _check_scene(
+    where: str,
+    scene: dict,
+    characters: dict,
+    settings: dict,
+    minigames,
+    problems: list,
+) -> None:
+    scene_type = scene.get("type")
+    if scene_type not in SCENE_TYPES:
+        problems.append(f"{where}: unknown type {scene_type!r}")
+        return
+
+    location = scene.get("location")
+    if location is not None and location not in settings:
+        problems.append(f"{where}: unknown location {location!r}")
+
+    if scene_type == "conversation":
+        if location is None:
+            problems.append(f"{where}: conversation needs a location")
+        lines = scene.get("conversation")
+        if not isinstance(lines, list) or not lines:
+            problems.append(f"{where}: conversation must be a non-empty list")
+            return
+        for n, line in enumerate(lines, start=1):
+            if not isinstance(line, dict):
+                problems.append(f"{where}, line {n}: must be an object")
+            elif line.get("character") not in characters:
+                problems.append(
+                    f"{where}, line {n}: unknown character {line.get('character')!r}"
+                )
+
+    elif scene_type == "text":
+        if not isinstance(scene.get("content", []), list):
+            problems.append(f"{where}: content must be a list of lines")
+
+    elif scene_type == "minigame":
+        game = scene.get("game")
+        if minigames is not None and game not in minigames:
+            problems.append(f"{where}: unknown minigame {game!r}")
+
+
+def _manifest(scene: dict, characters: dict, settings: dict) -> list:
+    scene_type = scene.get("type")
+    if scene_type == "conversation":
+        bg = settings[scene["location"]].get("background")
+        return conversation_assets(bg, scene["conversation"], characters)
+    if scene_type == "text":
+        return text_scene_assets(scene, settings)
+    return []
+
+
+def _compile(data, minigames) -> Story:
+    """Validate and index story data, leaving asset paths as written."""
+    if not isinstance(data, dict):
+        raise StoryError(["story.json must contain a JSON object"])
+
+    problems: list = []
+    characters = data.get("characters", {})
+    settings = data.get("settings", {})
+    scenes = data.get("scenes", [])
+
+    # Accept both list and dict scene formats
+    if isinstance(scenes, dict):
+        scenes = list(scenes.values())
+
+    for key, value, expected in (
+        ("characters", characters, dict),
+        ("settings", settings, dict),
+        ("scenes", scenes, list),
+    ):
+        if not isinstance(value, expected):
+            problems.append(f"{key} must be a JSON {expected.__name__}")
+    if problems:
+        raise StoryError(problems)
+
+    characters = _check_characters(characters, problems)
+    settings = _check_settings(settings, problems)
+
+    for i, scene in enumerate(scenes):
+        where = f"scene {i + 1}"
+        if not isinstance(scene, dict):
+            problems.append(f"{where}: must be an object")
+            continue
+        _check_scene(where, scene, characters, settings, minigames, problems)
+
+    if problems:
+        raise StoryError(problems)
+
+    manifests = [_manifest(scene, characters, settings) for scene in scenes]
+    locations: dict = {}
+    for i, scene in enumerate(scenes):
+        if scene.get("location") is not None:
+            locations.setdefault(scene["location"], []).append(i)
+
+    return Story(scenes, characters, settings, manifests, locations)
+
+
+def _rebase(story: Story, base_path: str) -> Story:
+    """Resolve a compiled story's relative asset paths against base_path."""
+    characters = {
+        name: (
+            {**info, "sprite": _resolve(info["sprite"], base_path)}
+            if "sprite" in info
+            else info
+        )
+        for name, info in story.characters.items()
+    }
+    settings = {
+        location: (
+            {**info, "background": _resolve(info["background"], base_path)}
+            if "background" in info
+            else info
+        )
+        for location, info in story.settings.items()
+    }
+    manifests = [
+        [(_resolve(path, base_path), extent) for path, extent in manifest]
+        for manifest in story.manifests
+    ]
+    return Story(story.scenes, characters, settings, manifests, story.locations)
+
+
+def _warn_missing_images(story: Story) -> None:
+    # A missing image is not fatal — the scene renders without it
+    referenced = {path for manifest in story.manifests for path, _ in manifest}
+    for path in sorted(referenced):
+        if not os.path.isfile(path):
+            logger.warning("Story references a missing image: %s", path)
+
+
+def compile_story(data, base_path: str, minigames=None) -> Story:
+    """
+    Validate parsed story.json data and index it in one pass.
+
+    Relative asset paths are resolved against base_path. minigames, when
+    given, is the set of game names scenes may refer to. Raises StoryError
+    listing every problem found, not just the first.
+    """
+    story = _rebase(_compile(data, minigames), base_path)
+    _warn_missing_images(story)
+    return story
+
+
+# ── Cached artifact ────────────────────────────────────────────────────────────
+
+
+def _artifact_key(raw: bytes, minigames) -> str:
+    # Not keyed on base_path: a one-file build unpacks to a new temp dir per run
+    digest = hashlib.sha1(raw)
+    digest.update(f"\0{STORY_FORMAT_VERSION}\0".encode())
+    digest.update("\0".join(sorted(minigames or ())).encode())
+    return digest.hexdigest()
+
+
+def _is_path(value) -> bool:
+    return value is None or isinstance(value, str)
+
+
+def _story_from_json(data) -> Story | None:
+    """Rebuild a Story from an artifact, or None if it is not a well-formed one."""
+    if not isinstance(data, dict) or data.get("format") != STORY_FORMAT_VERSION:
+        return None
+    scenes, characters = data.get("scenes"), data.get("characters")
+    settings, manifests = data.get("settings"), data.get("manifests")
+    locations = data.get("locations")
+    if not (
+        isinstance(scenes, list)
+        and all(isinstance(scene, dict) for scene in scenes)
+        and isinstance(characters, dict)
+        and all(isinstance(info, dict) for info in characters.values())
+        and all(_is_path(info.get("sprite")) for info in characters.values())
+        and isinstance(settings, dict)
+        and all(isinstance(info, dict) for info in settings.values())
+        and all(_is_path(info.get("background")) for info in settings.values())
+        and isinstance(manifests, list)
+        and len(manifests) == len(scenes)
+        and isinstance(locations, dict)
+        and all(isinstance(indices, list) for indices in locations.values())
+    ):
+        return None
+    try:
+        manifests = [
+            [(path, tuple(extent)) for path, extent in manifest]
+            for manifest in manifests
+        ]
+    except (TypeError, ValueError):
+        return None
+    for manifest in manifests:
+        for path, extent in manifest:
+            if not isinstance(path, str) or len(extent) != 4:
+                return None
+            if not all(isinstance(v, (int, float)) for v in extent):
+                return None
+    return Story(scenes, characters, settings, manifests, locations)
+
+
+def _read_artifact(path: str) -> Story | None:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable story artifact %s: %s", path, e)
+        return None
+    story = _story_from_json(data)
+    if story is None:
+        logger.warning("Ignoring malformed story artifact %s", path)
+    return story
+
+
+def _write_artifact(cache_dir: str, path: str, story: Story) -> None:
+    tmp = None
+    data = {
+        "format": STORY_FORMAT_VERSION,
+        "scenes": story.scenes,
+        "characters": story.characters,
+        "settings": story.settings,
+        "manifests": story.manifests,
+        "locations": story.locations,
+    }
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("Could not cache compiled story: %s", e)
+        if tmp is not None and os.path.exists(tmp):
+            os.remove(tmp)
+        return
+
+    # Older compilations of the story are never read again
+    for entry in os.scandir(cache_dir):
+        stale = entry.name.startswith(ARTIFACT_PREFIX) and entry.path != path
+        if stale and entry.name.endswith(ARTIFACT_SUFFIX):
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def load_story(
+    story_path: str, base_path: str, cache_dir: str | None = None, minigames=None
+) -> Story:
+    """
+    Return the compiled story at story_path.
+
+    With a cache_dir, the compiled Story is stored as JSON under a hash of
+    the file's bytes, with asset paths as story.json writes them. Later
+    starts with an unchanged story.json skip parsing and validation and
+    only resolve the paths against base_path, which may differ per run.
+    Raises FileNotFoundError or StoryError.
+    """
+    with open(story_path, "rb") as f:
+        raw = f.read()
+
+    artifact = None
+    if cache_dir:
+        name = ARTIFACT_PREFIX + _artifact_key(raw, minigames)
+        artifact = os.path.join(cache_dir, name + ARTIFACT_SUFFIX)
+        story = _read_artifact(artifact)
+        if story is not None:
+            logger.debug("Loaded compiled story from %s", artifact)
+            return _rebase(story, base_path)
+
+    try:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise StoryError([f"story.json is malformed: {e}"]) from e
+
+    portable = _compile(data, minigames)
+    if artifact is not None:
+        _write_artifact(cache_dir, artifact, portable)
+    story = _rebase(portable, base_path)
+    _warn_missing_images(story)
+    return story
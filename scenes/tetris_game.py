@@ -2,17 +2,19 @@ import random
 import logging
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.animation import FuncAnimation
+import matplotlib.colors as mcolors
+
+from scenes.clock import ClockedGame, EngineClock
+from scenes.grid import GridRenderer
+from scenes.retained import ArtistLayer
 
 logger = logging.getLogger(__name__)
 
 # ── Constants ──────────────────────────────────────────────────────────────────
 ANIM_INTERVAL = 50  # ms between frames
-PAUSE_INTERVAL = 0.05  # seconds between event polls
+SIM_STEP = 0.05  # seconds per step — drop speeds below count steps
 
-DROP_FRAMES_INIT = 20  # frames between auto-drops at start
+DROP_FRAMES_INIT = 20  # steps between auto-drops at start
 DROP_FRAMES_MIN = 5  # fastest auto-drop speed
 DROP_SPEED_EVERY = 10  # lines cleared before speeding up
 
@@ -38,15 +40,42 @@ PIECES = {
 COLOR_INDEX = {name: i + 1 for i, name in enumerate(PIECES)}
 INDEX_COLOR = {v: PIECES[k]["color"] for k, v in COLOR_INDEX.items()}
 
+# Grid codes: 0 = empty, 1-7 = piece colour, GHOST_OFFSET + 1-7 = ghost colour
+GHOST_OFFSET = len(PIECES)
+
+
+def _ghost_color(color: str) -> tuple:
+    """Ghost colour pre-blended over the background so the palette stays opaque."""
+    fg, bg = np.array(mcolors.to_rgb(color)), np.array(mcolors.to_rgb(BG_COLOR))
+    return tuple(GHOST_ALPHA * fg + (1 - GHOST_ALPHA) * bg)
+
+
+CODE_PALETTE = (
+    [BG_COLOR]
+    + [INDEX_COLOR[i] for i in range(1, GHOST_OFFSET + 1)]
+    + [_ghost_color(INDEX_COLOR[i]) for i in range(1, GHOST_OFFSET + 1)]
+)
+
+
+class TetrisGame(ClockedGame):
+    tick_interval = ANIM_INTERVAL
+    sim_step = SIM_STEP
 
-class TetrisGame:
-    def __init__(self, fig, ax, width: int = 10, height: int = 20):
-        self.fig = fig
-        self.ax = ax
+    def __init__(
+        self,
+        fig,
+        ax,
+        width: int = 10,
+        height: int = 20,
+        blit: bool = False,
+        clock: EngineClock | None = None,
+    ):
+        super().__init__(fig, ax, blit, clock)
         self.width = width
         self.height = height
 
         self._reset_state()
+        self._layer = None  # built on first draw
 
         self._key_cid = self.fig.canvas.mpl_connect("key_press_event", self._on_key)
 
@@ -58,6 +87,7 @@ class TetrisGame:
         self.score = 0
         self.lines_cleared = 0
         self.game_over = False
+        self.version = 0
         self._frame_counter = 0
         self._drop_frames = DROP_FRAMES_INIT
 
@@ -155,6 +185,7 @@ class TetrisGame:
         nx, ny = self.current_x + dx, self.current_y + dy
         if self._is_valid(self.current_piece, nx, ny):
             self.current_x, self.current_y = nx, ny
+            self.version += 1
         elif dy < 0:
             self._land_piece()
 
@@ -162,6 +193,7 @@ class TetrisGame:
         rotated = np.rot90(self.current_piece)
         if self._is_valid(rotated, self.current_x, self.current_y):
             self.current_piece = rotated
+            self.version += 1
 
     def _hard_drop(self) -> None:
         while self._is_valid(self.current_piece, self.current_x, self.current_y - 1):
@@ -173,6 +205,7 @@ class TetrisGame:
         self._place_piece()
         self._clear_lines()
         self._new_piece()
+        self.version += 1
 
     # ── Drawing ────────────────────────────────────────────────────────────────
 
@@ -186,48 +219,45 @@ class TetrisGame:
         self.ax.set_xticks([])
         self.ax.set_yticks([])
 
-    def _draw_cell(self, x: int, y: int, color: str, alpha: float = 1.0) -> None:
-        self.ax.add_patch(
-            patches.Rectangle(
-                (x, y),
-                1,
-                1,
-                facecolor=color,
-                edgecolor="black",
-                linewidth=1,
-                alpha=alpha,
-            )
+    def _build_artists(self) -> None:
+        self._setup_axes()
+        self._layer = ArtistLayer(self.ax)
+        self._grid = GridRenderer(
+            self.ax, self.width, self.height, CODE_PALETTE, edgecolor="black"
         )
 
-    def _draw(self) -> None:
-        self._setup_axes()
+        # Instructions — static, created once
+        self._layer.text(
+            0.02,
+            0.98,
+            "← → move   ↑ rotate   ↓ soft drop   space hard drop",
+            transform=self.ax.transAxes,
+            fontsize=8,
+            verticalalignment="top",
+            bbox=dict(boxstyle="round", facecolor="white", alpha=0.15),
+            color="white",
+        )
+
+    def _piece_cells(self, y: int) -> tuple:
+        """Row and column indices covered by the current piece with its top row at y."""
+        rows, cols = np.nonzero(self.current_piece)
+        ys, xs = y - rows, self.current_x + cols
+        # A game-over spawn can poke outside the board — clip before indexing
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        return ys[inside], xs[inside]
 
-        # Placed board cells — coloured by piece type
-        for y in range(self.height):
-            for x in range(self.width):
-                idx = self.board[y, x]
-                if idx:
-                    self._draw_cell(x, y, INDEX_COLOR[idx])
+    def _draw(self) -> None:
+        if self._layer is None:
+            self._build_artists()
 
-        # Ghost piece
+        # Placed cells keep their colour index; ghost and current piece go on top
+        codes = self.board.copy()
+        color_idx = COLOR_INDEX[self.current_color]
         ghost_y = self._ghost_y()
         if ghost_y != self.current_y:
-            for i in range(self.current_piece.shape[0]):
-                for j in range(self.current_piece.shape[1]):
-                    if self.current_piece[i, j]:
-                        self._draw_cell(
-                            self.current_x + j,
-                            ghost_y - i,
-                            PIECES[self.current_color]["color"],
-                            alpha=GHOST_ALPHA,
-                        )
-
-        # Current piece
-        color = PIECES[self.current_color]["color"]
-        for i in range(self.current_piece.shape[0]):
-            for j in range(self.current_piece.shape[1]):
-                if self.current_piece[i, j]:
-                    self._draw_cell(self.current_x + j, self.current_y - i, color)
+            codes[self._piece_cells(ghost_y)] = GHOST_OFFSET + color_idx
+        codes[self._piece_cells(self.current_y)] = color_idx
+        self._grid.update(codes)
 
         # HUD
         level = self.lines_cleared // DROP_SPEED_EVERY + 1
@@ -246,74 +276,32 @@ class TetrisGame:
                 color="white",
             )
 
-        # Instructions
-        self.ax.text(
-            0.02,
-            0.98,
-            "← → move   ↑ rotate   ↓ soft drop   space hard drop",
-            transform=self.ax.transAxes,
-            fontsize=8,
-            verticalalignment="top",
-            bbox=dict(boxstyle="round", facecolor="white", alpha=0.15),
-            color="white",
-        )
-
     # ── Animation ──────────────────────────────────────────────────────────────
 
-    def _update(self, frame) -> list:
+    def _animated_artists(self) -> list:
+        if self._layer is None:
+            return []
+        return self._layer.dynamic + self._grid.artists + [self.ax.title]
+
+    @property
+    def decorations(self) -> list:
+        """Grid lines the engine may hide when frames run late."""
+        if self._layer is None or self._grid.edges is None:
+            return []
+        return [self._grid.edges]
+
+    def update(self, dt: float) -> None:
         if not self.game_over:
             self._frame_counter += 1
             if self._frame_counter >= self._drop_frames:
                 self._frame_counter = 0
                 self._move(dx=0, dy=-1)
 
+    def render(self, alpha: float = 1.0) -> list:
         self._draw()
-        return []
+        return self._animated_artists()
 
     # ── Cleanup ────────────────────────────────────────────────────────────────
 
     def _disconnect(self) -> None:
         self.fig.canvas.mpl_disconnect(self._key_cid)
-
-    # ── Public API ─────────────────────────────────────────────────────────────
-
-    def run(self) -> int:
-        self.anim = FuncAnimation(
-            self.fig,
-            self._update,
-            interval=ANIM_INTERVAL,
-            blit=False,
-            repeat=True,
-            cache_frame_data=False,
-        )
-
-        try:
-            while not self.game_over:
-                plt.pause(PAUSE_INTERVAL)
-        finally:
-            self.anim.event_source.stop()
-
-        self._draw()
-
-        # Wait for space or click to dismiss
-        continue_flag = {"clicked": False}
-
-        def on_click(event):
-            continue_flag["clicked"] = True
-
-        def on_key(event):
-            if event.key in (" ", "space"):
-                continue_flag["clicked"] = True
-
-        cid_click = self.fig.canvas.mpl_connect("button_press_event", on_click)
-        cid_key = self.fig.canvas.mpl_connect("key_press_event", on_key)
-
-        try:
-            while not continue_flag["clicked"]:
-                plt.pause(PAUSE_INTERVAL)
-        finally:
-            self.fig.canvas.mpl_disconnect(cid_click)
-            self.fig.canvas.mpl_disconnect(cid_key)
-            self._disconnect()
-
-        return self.score
@@ -1,8 +1,7 @@
-import os
 import logging
 
-import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
+from scenes.assets import FULL_EXTENT, display_size, load_image
+from scenes.events import wait_for_continue
 
 logger = logging.getLogger(__name__)
 
@@ -15,20 +14,16 @@ CONTENT_MIN_Y = 0.14  # lines won't render below this threshold
 CONTENT_FONT = 12
 PROMPT_Y = 0.05
 PROMPT_FONT = 9
-PAUSE_INTERVAL = 0.05  # seconds between event polls
 
 
-def _load_image(path: str | None):
-    """Load an image from disk, returning None if missing or invalid."""
-    if not path or not os.path.exists(path):
-        if path:
-            logger.warning("Image not found: %s", path)
-        return None
-    try:
-        return mpimg.imread(path)
-    except Exception as e:
-        logger.error("Failed to load image %s: %s", path, e)
-        return None
+def _background_path(scene: dict, settings: dict) -> str | None:
+    return settings.get(scene.get("location"), {}).get("background")
+
+
+def text_scene_assets(scene: dict, settings: dict) -> list:
+    """Return (path, extent) for the background a text scene will show."""
+    path = _background_path(scene, settings)
+    return [(path, FULL_EXTENT)] if path else []
 
 
 def text_scene(ax, scene: dict, settings: dict) -> None:
@@ -41,9 +36,7 @@ def text_scene(ax, scene: dict, settings: dict) -> None:
     ax.set_ylim(0, 1)
 
     # ── Background ─────────────────────────────────────────────────────────────
-    location_key = scene.get("location")
-    background_path = settings.get(location_key, {}).get("background")
-    bg = _load_image(background_path)
+    bg = load_image(_background_path(scene, settings), display_size(ax))
 
     if bg is not None:
         ax.imshow(bg, extent=[0, 1, 0, 1], aspect="auto", zorder=0)
@@ -105,21 +98,4 @@ def text_scene(ax, scene: dict, settings: dict) -> None:
     fig.canvas.draw_idle()
 
     # ── Wait for input ─────────────────────────────────────────────────────────
-    continue_flag = {"clicked": False}
-
-    def on_click(event):
-        continue_flag["clicked"] = True
-
-    def on_key(event):
-        if event.key in (" ", "space"):
-            continue_flag["clicked"] = True
-
-    cid_click = fig.canvas.mpl_connect("button_press_event", on_click)
-    cid_key = fig.canvas.mpl_connect("key_press_event", on_key)
-
-    try:
-        while not continue_flag["clicked"]:
-            plt.pause(PAUSE_INTERVAL)
-    finally:
-        fig.canvas.mpl_disconnect(cid_click)
-        fig.canvas.mpl_disconnect(cid_key)
+    wait_for_continue(fig)
@@ -0,0 +1,157 @@
+import os
+import json
+import time
+import atexit
+import logging
+import threading
+from contextlib import nullcontext
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+DEFAULT_TRACE_PATH = "trace.json"
+TRACE_PID = 1  # the whole engine is one process in the viewer
+
+
+class _Span:
+    """Records one complete ("X") event covering a with block."""
+
+    __slots__ = ("recorder", "name", "cat", "args", "start")
+
+    def __init__(self, recorder, name: str, cat: str, args: dict):
+        self.recorder = recorder
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.recorder.complete(
+            self.name, self.start, time.perf_counter(), self.cat, **self.args
+        )
+        return False
+
+
+class TraceRecorder:
+    """
+    Collects Chrome trace events for a whole playthrough.
+
+    Spans cover story loading, every scene, minigame runs, asset decodes
+    and each frame's phases; counters track the artist count and the
+    asset cache size. Events from prefetch threads land on their own
+    tracks. save() writes trace.json for chrome://tracing or Perfetto.
+    While not started, span() returns a shared no-op context.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self.events: list = []
+        self._origin = 0.0
+        self._threads: dict = {}  # thread ident -> small track id
+        self._lock = threading.Lock()
+        self._off = nullcontext()
+        self._saved_at_exit = False
+
+    def start(self, path: str = DEFAULT_TRACE_PATH) -> None:
+        """Begin recording; the trace is written to *path* on save() or exit."""
+        if not self._saved_at_exit:
+            atexit.register(self.save)
+            self._saved_at_exit = True
+        self.enabled = True
+        self.path = path
+        self.events.clear()
+        self._threads.clear()
+        self._origin = time.perf_counter()
+
+    # ── Events ─────────────────────────────────────────────────────────────────
+
+    def _tid(self) -> int:
+        ident = threading.get_ident()
+        tid = self._threads.get(ident)
+        if tid is not None:
+            return tid
+        with self._lock:
+            tid = self._threads[ident] = len(self._threads) + 1
+            self.events.append(
+                {
+                    "ph": "M",
+                    "name": "thread_name",
+                    "pid": TRACE_PID,
+                    "tid": tid,
+                    "args": {"name": threading.current_thread().name},
+                }
+            )
+        return tid
+
+    def _us(self, seconds: float) -> float:
+        return (seconds - self._origin) * 1e6
+
+    def span(self, name: str, cat: str = "engine", **args):
+        """Context manager recording its duration as one span."""
+        if not self.enabled:
+            return self._off
+        return _Span(self, name, cat, args)
+
+    def complete(
+        self, name: str, start: float, end: float, cat: str = "engine", **args
+    ) -> None:
+        """Record a span between two perf_counter() readings."""
+        if not self.enabled:
+            return
+        event = {
+            "ph": "X",
+            "name": name,
+            "cat": cat,
+            "ts": self._us(start),
+            "dur": (end - start) * 1e6,
+            "pid": TRACE_PID,
+            "tid": self._tid(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def counter(self, name: str, **values) -> None:
+        """Record the current value of one or more series under *name*."""
+        if not self.enabled:
+            return
+        self.events.append(
+            {
+                "ph": "C",
+                "name": name,
+                "ts": self._us(time.perf_counter()),
+                "pid": TRACE_PID,
+                "tid": self._tid(),
+                "args": values,
+            }
+        )
+
+    # ── Output ─────────────────────────────────────────────────────────────────
+
+    def save(self) -> str | None:
+        """Write the events recorded so far; returns the path written."""
+        if not self.enabled or not self.events:
+            return None
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        except OSError as e:
+            logger.warning("Cannot write trace to %s: %s", self.path, e)
+            return None
+        logger.info(
+            "Trace: %d events written to %s",
+            len(self.events),
+            os.path.abspath(self.path),
+        )
+        return self.path
+
+    def stop(self) -> None:
+        self.enabled = False
+
+
+tracer = TraceRecorder()
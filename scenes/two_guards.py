@@ -1,12 +1,13 @@
 import random
 import logging
 
-import matplotlib.pyplot as plt
+from scenes.events import wait_for_continue, wait_until
+from scenes.redraw import DirtyRedraw
+from scenes.retained import ArtistLayer
 
 logger = logging.getLogger(__name__)
 
 # ── Constants ──────────────────────────────────────────────────────────────────
-PAUSE_INTERVAL = 0.05  # seconds between event polls
 
 # Colours
 BG_COLOR = "#232946"
@@ -45,6 +46,8 @@ class TwoGuardsGame:
         self.ax = ax
 
         self._reset_state()
+        self._screen = None  # ArtistLayer holding the current screen's text
+        self._redraw = DirtyRedraw(fig, self._draw)
         self._key_cid = self.fig.canvas.mpl_connect("key_press_event", self._on_key)
 
     # ── State ──────────────────────────────────────────────────────────────────
@@ -99,7 +102,7 @@ class TwoGuardsGame:
         self.guard_answer = self._guard_points_to(guard)
         self.state = "choose"
         logger.debug("Asked guard %d — pointed to door %d", guard, self.guard_answer)
-        self._draw()
+        self._redraw.mark("screen")
 
     def _choose_door(self, door: int) -> None:
         if self.state != "choose":
@@ -116,7 +119,7 @@ class TwoGuardsGame:
             self.safe_door,
             self.state,
         )
-        self._draw()
+        self._redraw.mark("screen")
 
     # ── Input ──────────────────────────────────────────────────────────────────
 
@@ -125,7 +128,7 @@ class TwoGuardsGame:
 
         if self.state == "intro" and key == " ":
             self.state = "ask"
-            self._draw()
+            self._redraw.mark("screen")
 
         elif self.state == "ask":
             if key == "1":
@@ -151,26 +154,30 @@ class TwoGuardsGame:
         self.ax.set_xticks([])
         self.ax.set_yticks([])
 
-    def _draw(self) -> None:
-        self._setup_axes()
+    def _draw(self, dirty=None) -> None:
+        """Swap in the screen for the current state — the only part that changes."""
+        if self._screen is None:
+            self._setup_axes()
+        else:
+            # Screens only ever move forward, so the old one is not kept
+            self._screen.remove()
+        self._screen = ArtistLayer(self.ax)
 
         if self.state == "intro":
-            self._draw_intro()
+            self._draw_intro(self._screen)
         elif self.state == "ask":
-            self._draw_ask()
+            self._draw_ask(self._screen)
         elif self.state == "choose":
-            self._draw_choose()
+            self._draw_choose(self._screen)
         elif self.state in ("win", "lose"):
-            self._draw_end()
-
-        self.fig.canvas.draw_idle()
+            self._draw_end(self._screen)
 
-    def _draw_intro(self) -> None:
+    def _draw_intro(self, layer: ArtistLayer) -> None:
         self.ax.set_title(
             "The Two Guards", fontsize=18, fontweight="bold", color=ACCENT_COLOR
         )
         for i, line in enumerate(INTRO_LINES):
-            self.ax.text(
+            layer.text(
                 5,
                 7.2 - i * 0.55,
                 line,
@@ -178,7 +185,7 @@ class TwoGuardsGame:
                 ha="center",
                 color=ACCENT_COLOR if line.startswith('"') else TEXT_COLOR,
             )
-        self.ax.text(
+        layer.text(
             5,
             0.4,
             "Press SPACE to begin",
@@ -190,14 +197,14 @@ class TwoGuardsGame:
             ),
         )
 
-    def _draw_ask(self) -> None:
+    def _draw_ask(self, layer: ArtistLayer) -> None:
         self.ax.set_title(
             "Choose a guard to ask", fontsize=16, fontweight="bold", color=ACCENT_COLOR
         )
-        self.ax.text(
+        layer.text(
             5, 6.5, "You may ask ONE guard:", fontsize=13, ha="center", color=TEXT_COLOR
         )
-        self.ax.text(
+        layer.text(
             5,
             5.8,
             '"Which door would the OTHER guard say leads to freedom?"',
@@ -206,7 +213,7 @@ class TwoGuardsGame:
             color=ACCENT_COLOR,
             style="italic",
         )
-        self.ax.text(
+        layer.text(
             3,
             3.5,
             "Guard 1",
@@ -215,7 +222,7 @@ class TwoGuardsGame:
             color=TEXT_COLOR,
             fontweight="bold",
         )
-        self.ax.text(
+        layer.text(
             7,
             3.5,
             "Guard 2",
@@ -224,14 +231,14 @@ class TwoGuardsGame:
             color=TEXT_COLOR,
             fontweight="bold",
         )
-        self.ax.text(
+        layer.text(
             3, 2.8, "Press 1 to ask", fontsize=11, ha="center", color=ACCENT_COLOR
         )
-        self.ax.text(
+        layer.text(
             7, 2.8, "Press 2 to ask", fontsize=11, ha="center", color=ACCENT_COLOR
         )
 
-    def _draw_choose(self) -> None:
+    def _draw_choose(self, layer: ArtistLayer) -> None:
         self.ax.set_title(
             "Now choose your door", fontsize=16, fontweight="bold", color=ACCENT_COLOR
         )
@@ -240,11 +247,11 @@ class TwoGuardsGame:
         answer = GUARD_ANSWER.format(guard=self.asked_guard, door=self.guard_answer)
 
         for i, line in enumerate(question.split("\n")):
-            self.ax.text(
+            layer.text(
                 5, 7.0 - i * 0.6, line, fontsize=12, ha="center", color=TEXT_COLOR
             )
 
-        self.ax.text(
+        layer.text(
             5,
             5.5,
             answer,
@@ -253,11 +260,11 @@ class TwoGuardsGame:
             color=ACCENT_COLOR,
             fontweight="bold",
         )
-        self.ax.text(
+        layer.text(
             5, 4.6, HINT, fontsize=11, ha="center", color=TEXT_COLOR, style="italic"
         )
 
-        self.ax.text(
+        layer.text(
             3,
             3.0,
             "Door 1",
@@ -266,7 +273,7 @@ class TwoGuardsGame:
             color=TEXT_COLOR,
             fontweight="bold",
         )
-        self.ax.text(
+        layer.text(
             7,
             3.0,
             "Door 2",
@@ -275,19 +282,19 @@ class TwoGuardsGame:
             color=TEXT_COLOR,
             fontweight="bold",
         )
-        self.ax.text(3, 2.3, "Press 1", fontsize=11, ha="center", color=ACCENT_COLOR)
-        self.ax.text(7, 2.3, "Press 2", fontsize=11, ha="center", color=ACCENT_COLOR)
+        layer.text(3, 2.3, "Press 1", fontsize=11, ha="center", color=ACCENT_COLOR)
+        layer.text(7, 2.3, "Press 2", fontsize=11, ha="center", color=ACCENT_COLOR)
 
-    def _draw_end(self) -> None:
+    def _draw_end(self, layer: ArtistLayer) -> None:
         won = self.state == "win"
         color = WIN_COLOR if won else LOSE_COLOR
         title = "YOU ESCAPE!" if won else "DOOM AWAITS!"
 
         self.ax.set_title(title, fontsize=20, fontweight="bold", color=color)
-        self.ax.text(5, 5.5, self.message, fontsize=14, ha="center", color=color)
+        layer.text(5, 5.5, self.message, fontsize=14, ha="center", color=color)
 
         # Reveal the truth
-        self.ax.text(
+        layer.text(
             5,
             4.2,
             f"The safe door was Door {self.safe_door}.",
@@ -295,7 +302,7 @@ class TwoGuardsGame:
             ha="center",
             color=TEXT_COLOR,
         )
-        self.ax.text(
+        layer.text(
             5,
             3.5,
             f"Guard {self.truth_guard} was the truth-teller.",
@@ -303,7 +310,7 @@ class TwoGuardsGame:
             ha="center",
             color=TEXT_COLOR,
         )
-        self.ax.text(
+        layer.text(
             5,
             2.0,
             "Press space or click to continue",
@@ -315,6 +322,7 @@ class TwoGuardsGame:
     # ── Cleanup ────────────────────────────────────────────────────────────────
 
     def _disconnect(self) -> None:
+        self._redraw.close()
         self.fig.canvas.mpl_disconnect(self._key_cid)
 
     # ── Public API ─────────────────────────────────────────────────────────────
@@ -323,26 +331,11 @@ class TwoGuardsGame:
         self._draw()
 
         # Run until win or lose
-        while self.state not in ("win", "lose"):
-            plt.pause(PAUSE_INTERVAL)
+        wait_until(self.fig, lambda: self.state in ("win", "lose"))
+        self._redraw.flush()  # show the outcome without waiting a frame
 
         # Wait for space or click to dismiss
-        continue_flag = {"clicked": False}
-
-        def on_click(event):
-            continue_flag["clicked"] = True
-
-        def on_key(event):
-            if event.key in (" ", "space"):
-                continue_flag["clicked"] = True
-
-        cid_click = self.fig.canvas.mpl_connect("button_press_event", on_click)
-        cid_key = self.fig.canvas.mpl_connect("key_press_event", on_key)
-
         try:
-            while not continue_flag["clicked"]:
-                plt.pause(PAUSE_INTERVAL)
+            wait_for_continue(self.fig)
         finally:
-            self.fig.canvas.mpl_disconnect(cid_click)
-            self.fig.canvas.mpl_disconnect(cid_key)
             self._disconnect()
@@ -0,0 +1,154 @@
+import gc
+import logging
+import tracemalloc
+
+import matplotlib.cbook
+import matplotlib.image
+from matplotlib.animation import Animation
+
+import scenes.compositor
+from scenes.assets import asset_cache
+
+logger = logging.getLogger(__name__)
+
+# ── Constants ──────────────────────────────────────────────────────────────────
+WATCHDOG_MODES = ("warn", "strict")  # warn logs a leak, strict raises LeakError
+LEAK_STREAK = 3  # consecutive scenes a count must grow before it is reported
+TRACEMALLOC_FRAMES = 1  # stack depth kept per allocation — enough for file:line
+TOP_ALLOCATORS = 5  # biggest growing allocation sites listed with a report
+HEAP_GROWTH_KB = 512  # heap growth per scene below this is treated as noise
+
+# Allocations bounded by something other than the heap check, left out of it:
+# the compositor's memo of composed frames, and the pixel copies image artists
+# keep (imshow copies its data in cbook), which the artist counts already watch
+BOUNDED_ALLOCATORS = frozenset(
+    (
+        tracemalloc.__file__,
+        scenes.compositor.__file__,
+        matplotlib.image.__file__,
+        matplotlib.cbook.__file__,
+    )
+)
+
+
+class LeakError(RuntimeError):
+    """Raised by a strict watchdog; .problems lists every growing count."""
+
+    def __init__(self, problems: list):
+        self.problems = problems
+        super().__init__("; ".join(problems))
+
+
+def callback_count(canvas) -> int:
+    """Callbacks connected to *canvas* with mpl_connect, across all events."""
+    return sum(len(cids) for cids in canvas.callbacks.callbacks.values())
+
+
+def _bounded(stat) -> bool:
+    return stat.traceback[0].filename in BOUNDED_ALLOCATORS
+
+
+def live_animations() -> int:
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, Animation))
+
+
+class LeakWatchdog:
+    """
+    Watches for resources that pile up from one scene to the next.
+
+    SceneManager calls check() after every scene. Each check snapshots the
+    canvas callback registry, the children of the scene axes and figure,
+    the live matplotlib animations and, through tracemalloc, the traced
+    heap outside the asset cache and BOUNDED_ALLOCATORS. A count that
+    grows for *streak* scenes in a row is logged as a warning together
+    with the allocation sites that grew the most since the previous
+    scene — or raised as LeakError when *strict*, as tests want.
+    """
+
+    def __init__(self, fig, ax, strict: bool = False, streak: int = LEAK_STREAK):
+        self.fig = fig
+        self.ax = ax
+        self.strict = strict
+        self.streak = streak
+
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self._memory = self._take_memory()
+
+        self.history = [self.snapshot(self._memory)]  # one per scene boundary
+        self._growth: dict = {}  # count name -> scenes in a row it grew
+
+    # ── Snapshots ──────────────────────────────────────────────────────────────
+
+    def snapshot(self, memory=None) -> dict:
+        """Current counts; *memory* is a _take_memory() snapshot for the heap."""
+        counts = {
+            "callbacks": callback_count(self.fig.canvas),
+            "axes artists": len(self.ax.get_children()),
+            "figure artists": len(self.fig.get_children()),
+            "animations": live_animations(),
+        }
+        if memory is not None:
+            traced = sum(
+                stat.size
+                for stat in memory.statistics("filename")
+                if not _bounded(stat)
+            )
+            # Decoded images are bounded by the asset cache's own budget, and
+            # memory-mapped ones were never traced
+            counts["heap KB"] = (traced - asset_cache.stats()["heap_bytes"]) // 1024
+        return counts
+
+    def _take_memory(self):
+        if not tracemalloc.is_tracing():
+            return None
+        return tracemalloc.take_snapshot()
+
+    def top_allocators(self, memory) -> list:
+        """The allocation sites that grew the most since the previous check."""
+        if memory is None or self._memory is None:
+            return []
+        growth = memory.compare_to(self._memory, "lineno")
+        grown = [stat for stat in growth if stat.size_diff > 0 and not _bounded(stat)]
+        return [str(stat) for stat in grown[:TOP_ALLOCATORS]]
+
+    # ── Checks ─────────────────────────────────────────────────────────────────
+
+    def check(self, scene: str) -> list:
+        """Compare against the previous scene; returns the problems found."""
+        memory = self._take_memory()
+        counts = self.snapshot(memory)
+        previous = self.history[-1]
+        self.history.append(counts)
+
+        problems = []
+        for name, value in counts.items():
+            slack = HEAP_GROWTH_KB if name == "heap KB" else 0
+            grew = value > previous.get(name, value) + slack
+            self._growth[name] = self._growth.get(name, 0) + 1 if grew else 0
+            if self._growth[name] >= self.streak:
+                problems.append(
+                    f"{name} grew for {self._growth[name]} scenes in a row "
+                    f"to {value} (after {scene})"
+                )
+
+        allocators = self.top_allocators(memory) if problems else []
+        self._memory = memory
+
+        if problems:
+            for problem in problems:
+                logger.warning("Leak watchdog: %s", problem)
+            for line in allocators:
+                logger.warning("  %s", line)
+            if self.strict:
+                raise LeakError(problems)
+        else:
+            logger.debug("Leak watchdog after %s: %s", scene, counts)
+        return problems
+
+    def close(self) -> None:
+        """Stop tracemalloc if this watchdog started it."""
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._memory = None
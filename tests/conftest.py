@@ -1,5 +1,14 @@
+import os
+import sys
+
 import pytest
 from unittest.mock import MagicMock
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Scene modules import shared helpers as `scenes.<module>` — make the repo root
+# importable even though each test adds scenes/ itself.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 
 @pytest.fixture
@@ -13,3 +22,17 @@ def mock_fig_ax():
     fig.canvas.mpl_disconnect.return_value = None
     fig.canvas.draw_idle.return_value = None
     return fig, ax
+
+
+@pytest.fixture
+def agg_fig():
+    """A real figure on a headless Agg canvas, for tests that draw or blit."""
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig
+
+
+@pytest.fixture
+def agg_fig_ax(agg_fig):
+    """agg_fig with a single subplot."""
+    return agg_fig, agg_fig.add_subplot()
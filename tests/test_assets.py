@@ -0,0 +1,301 @@
+import os
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import matplotlib.image as mpimg
+import matplotlib.pyplot as plt
+from PIL import Image
+
+from scenes.assets import AssetCache, DiskCache, display_size
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+def write_image(path, size=4, value=0.5):
+    mpimg.imsave(path, np.full((size, size, 3), value))
+    return str(path)
+
+
+# ── Hits and misses ────────────────────────────────────────────────────────────
+
+
+def test_missing_path_returns_none():
+    cache = AssetCache()
+    assert cache.load("does/not/exist.png") is None
+    assert cache.load(None) is None
+
+
+def test_first_load_is_a_miss(tmp_path):
+    cache = AssetCache()
+    image = cache.load(write_image(tmp_path / "a.png"))
+    assert image is not None
+    assert cache.misses == 1
+    assert cache.hits == 0
+
+
+def test_repeat_load_is_a_hit_and_shares_array(tmp_path):
+    cache = AssetCache()
+    path = write_image(tmp_path / "a.png")
+    first = cache.load(path)
+    second = cache.load(path)
+    assert first is second
+    assert cache.hits == 1
+
+
+def test_equivalent_paths_share_entry(tmp_path):
+    cache = AssetCache()
+    path = write_image(tmp_path / "a.png")
+    cache.load(path)
+    cache.load(os.path.join(str(tmp_path), ".", "a.png"))
+    assert cache.hits == 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_modified_file_is_decoded_again(tmp_path):
+    cache = AssetCache()
+    path = write_image(tmp_path / "a.png", value=0.0)
+    cache.load(path)
+    write_image(tmp_path / "a.png", value=1.0)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    image = cache.load(path)
+    assert cache.misses == 2
+    assert image[0, 0, 0] == 1.0
+
+
+def test_cached_arrays_are_read_only(tmp_path):
+    cache = AssetCache()
+    image = cache.load(write_image(tmp_path / "a.png"))
+    assert not image.flags.writeable
+
+
+# ── Eviction ───────────────────────────────────────────────────────────────────
+
+
+def test_least_recently_used_entry_evicted(tmp_path):
+    a = write_image(tmp_path / "a.png")
+    b = write_image(tmp_path / "b.png")
+    c = write_image(tmp_path / "c.png")
+    probe = AssetCache()
+    one_image = probe.load(a).nbytes
+
+    cache = AssetCache(max_bytes=2 * one_image)
+    cache.load(a)
+    cache.load(b)
+    cache.load(a)  # a is now most recent
+    cache.load(c)  # evicts b
+
+    assert cache.evictions == 1
+    cache.load(a)
+    assert cache.hits == 2
+    cache.load(b)
+    assert cache.misses == 4
+
+
+def test_budget_is_respected(tmp_path):
+    paths = [write_image(tmp_path / f"{i}.png") for i in range(5)]
+    one_image = AssetCache().load(paths[0]).nbytes
+    cache = AssetCache(max_bytes=3 * one_image)
+    for path in paths:
+        cache.load(path)
+    assert cache.stats()["bytes"] <= cache.max_bytes
+    assert cache.stats()["entries"] == 3
+
+
+def test_oversized_image_not_cached(tmp_path):
+    cache = AssetCache(max_bytes=1)
+    assert cache.load(write_image(tmp_path / "a.png")) is not None
+    assert cache.stats()["entries"] == 0
+
+
+# ── Prefetch ───────────────────────────────────────────────────────────────────
+
+
+def test_prefetch_decodes_into_cache(tmp_path):
+    cache = AssetCache()
+    path = write_image(tmp_path / "a.png")
+    futures = cache.prefetch([path])
+    for future in futures:
+        future.result()
+
+    image = cache.load(path)
+    assert image is not None
+    assert cache.hits == 1
+    assert cache.misses == 0
+    assert cache.prefetched == 1
+    cache.shutdown()
+
+
+def test_prefetch_skips_cached_and_missing(tmp_path):
+    cache = AssetCache()
+    path = write_image(tmp_path / "a.png")
+    cache.load(path)
+    assert cache.prefetch([path, None, "does/not/exist.png"]) == []
+    cache.shutdown()
+
+
+def test_prefetch_does_not_queue_duplicates(tmp_path):
+    cache = AssetCache()
+    path = write_image(tmp_path / "a.png")
+    futures = cache.prefetch([path, path])
+    assert len(futures) == 1
+    futures[0].result()
+    cache.shutdown()
+
+
+def test_load_waits_for_pending_prefetch(tmp_path):
+    cache = AssetCache()
+    path = write_image(tmp_path / "a.png")
+    release = threading.Event()
+    original = cache._decode
+
+    def slow_decode(key, p):
+        release.wait(timeout=5)
+        return original(key, p)
+
+    cache._decode = slow_decode
+    (future,) = cache.prefetch([path])
+    threading.Timer(0.05, release.set).start()
+
+    image = cache.load(path)
+    assert image is future.result()
+    assert cache.misses == 0
+    cache.shutdown()
+
+
+# ── Display-size decoding ──────────────────────────────────────────────────────
+
+
+def write_jpeg(path, width, height):
+    Image.new("RGB", (width, height), (200, 100, 50)).save(path, quality=90)
+    return str(path)
+
+
+def test_display_size_from_figure_and_extent():
+    fig = plt.figure(figsize=(12, 8), dpi=100)
+    ax = fig.add_axes((0, 0, 1, 1))
+    assert display_size(ax) == (1200, 800)
+    assert display_size(ax, (0.05, 0.35, 0.55, 0.95)) == (360, 320)
+    assert display_size(None) is None
+    plt.close(fig)
+
+
+def test_sized_load_decodes_at_display_size(tmp_path):
+    cache = AssetCache()
+    image = cache.load(write_jpeg(tmp_path / "a.jpg", 1024, 1024), size=(360, 320))
+    assert image.shape == (320, 360, 3)
+    assert image.dtype == np.uint8
+
+
+def test_sized_load_never_enlarges(tmp_path):
+    cache = AssetCache()
+    image = cache.load(write_jpeg(tmp_path / "a.jpg", 100, 50), size=(400, 400))
+    assert image.shape == (50, 100, 3)
+
+
+def test_sized_load_keeps_alpha(tmp_path):
+    path = tmp_path / "a.png"
+    Image.new("RGBA", (64, 64), (0, 0, 0, 0)).save(path)
+    image = AssetCache().load(str(path), size=(32, 32))
+    assert image.shape == (32, 32, 4)
+
+
+def test_each_size_cached_separately(tmp_path):
+    cache = AssetCache()
+    path = write_jpeg(tmp_path / "a.jpg", 256, 256)
+    small = cache.load(path, size=(32, 32))
+    large = cache.load(path, size=(128, 128))
+    assert small.shape != large.shape
+    assert cache.load(path, size=(32, 32)) is small
+    assert cache.misses == 2
+
+
+def test_prefetch_accepts_sized_requests(tmp_path):
+    cache = AssetCache()
+    path = write_jpeg(tmp_path / "a.jpg", 256, 256)
+    (future,) = cache.prefetch([(path, (64, 64))])
+    assert future.result().shape == (64, 64, 3)
+    assert cache.load(path, size=(64, 64)) is future.result()
+    cache.shutdown()
+
+
+# ── Disk cache ─────────────────────────────────────────────────────────────────
+
+
+def test_disk_cache_skips_decoding_on_next_run(tmp_path):
+    path = write_jpeg(tmp_path / "a.jpg", 256, 256)
+    disk_dir = str(tmp_path / "cache")
+
+    first = AssetCache(disk=DiskCache(disk_dir)).load(path, size=(64, 64))
+    assert len(os.listdir(disk_dir)) == 1
+
+    second_run = AssetCache(disk=DiskCache(disk_dir))
+    with patch("scenes.assets._decode_scaled") as mock_decode:
+        image = second_run.load(path, size=(64, 64))
+
+    mock_decode.assert_not_called()
+    assert isinstance(image, np.memmap)
+    assert not image.flags.writeable
+    np.testing.assert_array_equal(image, first)
+    assert second_run.disk.hits == 1
+
+
+def test_memory_mapped_entries_are_not_heap_bytes(tmp_path):
+    path = write_jpeg(tmp_path / "a.jpg", 256, 256)
+    disk_dir = str(tmp_path / "cache")
+    first_run = AssetCache(disk=DiskCache(disk_dir))
+    first_run.load(path, size=(64, 64))
+    assert first_run.stats()["heap_bytes"] == first_run.stats()["bytes"] > 0
+
+    second_run = AssetCache(disk=DiskCache(disk_dir))
+    second_run.load(path, size=(64, 64))
+    assert second_run.stats()["bytes"] > 0
+    assert second_run.stats()["heap_bytes"] == 0
+
+
+def test_disk_entry_invalidated_when_source_changes(tmp_path):
+    path = write_jpeg(tmp_path / "a.jpg", 256, 256)
+    disk = DiskCache(str(tmp_path / "cache"))
+    AssetCache(disk=disk).load(path, size=(64, 64))
+
+    Image.new("RGB", (256, 256), (0, 0, 255)).save(path)
+    image = AssetCache(disk=disk).load(path, size=(64, 64))
+
+    assert image[0, 0, 2] > 200
+    assert disk.writes == 2
+
+
+def test_disk_cache_keys_include_size(tmp_path):
+    path = write_jpeg(tmp_path / "a.jpg", 256, 256)
+    disk = DiskCache(str(tmp_path / "cache"))
+    assert disk.entry_path(path, (64, 64)) != disk.entry_path(path, (32, 32))
+
+
+def test_full_resolution_loads_not_persisted(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache"))
+    AssetCache(disk=disk).load(write_image(tmp_path / "a.png"))
+    assert os.listdir(disk.directory) == []
+
+
+def test_corrupt_disk_entry_is_replaced(tmp_path):
+    path = write_jpeg(tmp_path / "a.jpg", 256, 256)
+    disk = DiskCache(str(tmp_path / "cache"))
+    with open(disk.entry_path(path, (64, 64)), "wb") as f:
+        f.write(b"not an array")
+
+    image = AssetCache(disk=disk).load(path, size=(64, 64))
+    assert image.shape == (64, 64, 3)
+    assert disk.writes == 1
+
+
+def test_prune_removes_least_recently_used(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    for i, name in enumerate(["old.npy", "new.npy"]):
+        entry = cache_dir / name
+        entry.write_bytes(b"x" * 100)
+        os.utime(entry, (i, i))
+
+    disk = DiskCache(str(cache_dir), max_bytes=150)
+    assert sorted(os.listdir(disk.directory)) == ["new.npy"]
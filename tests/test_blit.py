@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+import pytest
+import matplotlib.patches as patches
+from matplotlib.backend_bases import ResizeEvent
+
+from scenes.blit import BlitManager
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def scene(agg_fig_ax):
+    fig, ax = agg_fig_ax
+    ball = patches.Circle((0.5, 0.5), 0.1)
+    ax.add_patch(ball)
+    return fig, ball
+
+
+# ── Background caching ─────────────────────────────────────────────────────────
+
+
+def test_first_frame_caches_background(scene):
+    fig, ball = scene
+    blitter = BlitManager(fig)
+    with patch.object(fig.canvas, "draw", wraps=fig.canvas.draw) as draw:
+        blitter.update([ball])
+    draw.assert_called_once()
+    assert blitter._background is not None
+
+
+def test_later_frames_reuse_background(scene):
+    fig, ball = scene
+    blitter = BlitManager(fig)
+    blitter.update([ball])
+    with patch.object(fig.canvas, "draw") as draw:
+        ball.set_center((0.2, 0.2))
+        blitter.update([ball])
+        blitter.update([ball])
+    draw.assert_not_called()
+
+
+def test_resize_event_invalidates_background(scene):
+    fig, ball = scene
+    blitter = BlitManager(fig)
+    blitter.update([ball])
+    ResizeEvent("resize_event", fig.canvas)._process()
+    assert blitter._background is None
+    with patch.object(fig.canvas, "draw", wraps=fig.canvas.draw) as draw:
+        blitter.update([ball])
+    draw.assert_called_once()
+
+
+# ── Animated artists ───────────────────────────────────────────────────────────
+
+
+def test_update_marks_artists_animated(scene):
+    fig, ball = scene
+    blitter = BlitManager(fig)
+    blitter.update([ball])
+    assert ball.get_animated()
+
+
+def test_close_restores_normal_drawing(scene):
+    fig, ball = scene
+    blitter = BlitManager(fig)
+    blitter.update([ball])
+    blitter.close()
+    assert not ball.get_animated()
@@ -0,0 +1,250 @@
+from unittest.mock import ANY, MagicMock
+
+import pytest
+
+from scenes.clock import DEFAULT_INTERVAL, MAX_STEPS_PER_TICK, ClockedGame, EngineClock
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+class FakeScene:
+    def __init__(self, finish_after=None):
+        self.dts = []
+        self.alphas = []
+        self.finish_after = finish_after
+
+    @property
+    def finished(self):
+        return self.finish_after is not None and len(self.dts) >= self.finish_after
+
+    def update(self, dt):
+        self.dts.append(dt)
+
+    def render(self, alpha=1.0):
+        self.alphas.append(alpha)
+        return ["artist"]
+
+
+class FakeGame(ClockedGame):
+    tick_interval = 40
+    sim_step = 0.1
+
+    def __init__(self, fig, clock):
+        super().__init__(fig, None, blit=True, clock=clock)
+        self.game_over = False
+        self.score = 7
+        self.calls = []
+
+    def _draw(self):
+        self.calls.append("draw")
+
+    def _disconnect(self):
+        self.calls.append("disconnect")
+
+
+@pytest.fixture
+def now(monkeypatch):
+    """A controllable perf_counter: append to advance time."""
+    times = [0.0]
+    monkeypatch.setattr("scenes.clock.time.perf_counter", lambda: times[-1])
+    return times
+
+
+@pytest.fixture
+def clock(agg_fig):
+    clock = EngineClock(agg_fig)
+    clock._timer = MagicMock()
+    return clock
+
+
+# ── Attach / detach ────────────────────────────────────────────────────────────
+
+
+def test_attach_starts_timer_once(clock):
+    clock.attach(FakeScene())
+    clock.attach(FakeScene())
+    clock._timer.start.assert_called_once()
+
+
+def test_attach_sets_interval(clock):
+    clock.attach(FakeScene(), interval=16)
+    assert clock._timer.interval == 16
+    clock.detach()
+    clock.attach(FakeScene())
+    assert clock.interval == DEFAULT_INTERVAL
+
+
+def test_detach_pauses_timer_and_drops_scene(clock):
+    scene = FakeScene()
+    clock.attach(scene)
+    clock.detach()
+    clock._timer.stop.assert_called_once()
+    clock._tick()
+    assert scene.dts == []
+
+
+# ── Ticks ──────────────────────────────────────────────────────────────────────
+
+
+def test_tick_updates_then_renders(clock):
+    scene = FakeScene()
+    clock.attach(scene)
+    clock._tick()
+    clock._tick()
+    assert len(scene.dts) == 2 and all(dt >= 0 for dt in scene.dts)
+    assert scene.alphas == [1.0, 1.0]
+
+
+def test_tick_presents_through_blitter(clock, agg_fig):
+    blitter = MagicMock()
+    agg_fig.canvas.draw_idle = MagicMock()
+    clock.attach(FakeScene(), blitter=blitter)
+    clock._tick()
+    blitter.update.assert_called_once_with(["artist"])
+    agg_fig.canvas.draw_idle.assert_not_called()
+
+
+def test_tick_without_blitter_draws_idle(clock, agg_fig):
+    agg_fig.canvas.draw_idle = MagicMock()
+    clock.attach(FakeScene())
+    clock._tick()
+    agg_fig.canvas.draw_idle.assert_called_once()
+
+
+def test_finished_scene_wakes_waiter(clock, agg_fig):
+    agg_fig.canvas.stop_event_loop = MagicMock()
+    clock.attach(FakeScene(finish_after=2))
+    clock._tick()
+    agg_fig.canvas.stop_event_loop.assert_not_called()
+    clock._tick()
+    agg_fig.canvas.stop_event_loop.assert_called_once()
+
+
+def test_stats_reset_per_scene(clock):
+    clock.attach(FakeScene())
+    for _ in range(3):
+        clock._tick()
+    stats = clock.stats()
+    assert stats["ticks"] == 3
+    assert stats["max_ms"] >= stats["mean_ms"] >= 0
+
+    clock.detach()
+    clock.attach(FakeScene())
+    assert clock.stats()["ticks"] == 0
+
+
+# ── Fixed timestep ─────────────────────────────────────────────────────────────
+
+
+def test_fixed_step_runs_steps_elapsed_time_covers(clock, now):
+    scene = FakeScene()
+    clock.attach(scene, step=0.01)
+    now.append(0.035)
+    clock._tick()
+    assert scene.dts == [0.01] * 3
+    assert scene.alphas == [pytest.approx(0.5)]
+
+
+def test_fixed_step_carries_remainder_between_ticks(clock, now):
+    scene = FakeScene()
+    clock.attach(scene, step=0.01)
+    now.append(0.006)
+    clock._tick()
+    assert scene.dts == []
+    now.append(0.012)
+    clock._tick()
+    assert scene.dts == [0.01]
+
+
+def test_fixed_step_drops_backlog_when_far_behind(clock, now):
+    scene = FakeScene()
+    clock.attach(scene, step=1 / 64)
+    now.append(1.0)
+    clock._tick()
+    assert len(scene.dts) == MAX_STEPS_PER_TICK
+    dropped = (64 - MAX_STEPS_PER_TICK) / 64 * 1000
+    assert clock.stats()["dropped_ms"] == pytest.approx(dropped)
+
+
+def test_fixed_step_stops_when_scene_finishes(clock, now):
+    scene = FakeScene(finish_after=2)
+    clock.attach(scene, step=0.01)
+    now.append(0.045)
+    clock._tick()
+    assert len(scene.dts) == 2
+    assert scene.alphas == [1.0]
+
+
+# ── Frame skipping ─────────────────────────────────────────────────────────────
+
+
+def test_late_frame_skips_following_renders(clock, now):
+    scene = FakeScene()
+    clock.attach(scene, interval=10, step=0.01)
+    now.append(0.035)  # 25 ms late — two renders' worth of budget
+    clock._tick()
+    now.append(0.045)
+    clock._tick()
+    now.append(0.055)
+    clock._tick()
+    now.append(0.065)
+    clock._tick()
+    assert len(scene.alphas) == 2
+    assert len(scene.dts) == 6
+    assert clock.stats()["skipped"] == 2
+
+
+def test_finished_scene_renders_even_when_skipping(clock, now):
+    scene = FakeScene(finish_after=4)
+    clock.attach(scene, interval=10, step=0.01)
+    now.append(0.035)
+    clock._tick()
+    now.append(0.045)
+    clock._tick()
+    assert len(scene.alphas) == 2
+
+
+# ── Change-driven redraw ───────────────────────────────────────────────────────
+
+
+def test_unchanged_version_skips_render(clock):
+    scene = FakeScene()
+    scene.version = 0
+    clock.attach(scene)
+    clock._tick()
+    clock._tick()
+    scene.version = 1
+    clock._tick()
+    assert len(scene.dts) == 3
+    assert len(scene.alphas) == 2
+    assert clock.stats()["unchanged"] == 1
+
+
+def test_none_version_always_renders(clock):
+    scene = FakeScene()
+    scene.version = None
+    clock.attach(scene)
+    clock._tick()
+    clock._tick()
+    assert len(scene.alphas) == 2
+
+
+# ── Clocked games ──────────────────────────────────────────────────────────────
+
+
+def test_clocked_game_plays_one_round(agg_fig, monkeypatch):
+    clock = MagicMock()
+    game = FakeGame(agg_fig, clock)
+
+    def play(fig, done):
+        assert not done()
+        game.game_over = True
+        assert done()
+
+    monkeypatch.setattr("scenes.clock.wait_until", play)
+    monkeypatch.setattr("scenes.clock.wait_for_continue", lambda fig: True)
+    assert game.run() == 7
+    clock.attach.assert_called_once_with(game, 40, ANY, step=0.1)
+    clock.detach.assert_called_once()
+    assert game.finished
+    assert game.calls == ["draw", "disconnect"]
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from scenes.compositor import BLANK_COLOR, Compositor, to_rgba8
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+def solid(color, size=(4, 4)):
+    w, h = size
+    return np.tile(np.array(color, dtype=np.uint8), (h, w, 1))
+
+
+# ── Conversion ─────────────────────────────────────────────────────────────────
+
+
+def test_float_rgb_becomes_opaque_uint8():
+    rgba = to_rgba8(np.full((2, 2, 3), 0.5, dtype=np.float32))
+    assert rgba.dtype == np.uint8 and rgba.shape == (2, 2, 4)
+    assert rgba[0, 0].tolist() == [128, 128, 128, 255]
+
+
+def test_greyscale_is_expanded():
+    assert to_rgba8(np.zeros((3, 2), dtype=np.uint8)).shape == (3, 2, 4)
+
+
+# ── Composition ────────────────────────────────────────────────────────────────
+
+
+def test_background_is_resampled_to_frame_size():
+    comp = Compositor((8, 6))
+    frame = comp.compose("bg", solid((10, 20, 30, 255), (4, 3)))
+    assert frame.shape == (6, 8, 4)
+    assert (frame == [10, 20, 30, 255]).all()
+
+
+def test_missing_background_is_blank():
+    frame = Compositor((4, 4)).compose("none")
+    assert (frame == BLANK_COLOR).all()
+
+
+def test_sprite_is_alpha_blended_into_its_extent():
+    comp = Compositor((10, 10))
+    sprite = solid((255, 0, 0, 128))
+    frame = comp.compose(
+        "k", solid((0, 0, 255, 255), (10, 10)), sprites=[(sprite, (0, 0.5, 0.5, 1))]
+    )
+    # Top-left quarter: half red over blue
+    assert frame[0, 0, :3].tolist() == [128, 0, 127]
+    assert frame[9, 9, :3].tolist() == [0, 0, 255]
+
+
+def test_dim_band_darkens_only_its_columns():
+    comp = Compositor((10, 2))
+    frame = comp.compose(
+        "k", solid((200, 200, 200, 255), (10, 2)), dims=[(0.5, 1.0, 0.5)]
+    )
+    assert frame[0, 0, 0] == 200
+    assert frame[0, 9, 0] == 100
+
+
+# ── Memo ───────────────────────────────────────────────────────────────────────
+
+
+def test_same_key_returns_memoized_frame():
+    comp = Compositor((4, 4))
+    first = comp.compose("k", solid((1, 2, 3, 255)))
+    assert comp.compose("k", solid((9, 9, 9, 255))) is first
+    assert (comp.hits, comp.misses) == (1, 1)
+
+
+def test_memo_evicts_least_recently_used():
+    comp = Compositor((2, 2), memo=2)
+    a = comp.compose("a")
+    comp.compose("b")
+    comp.compose("a")
+    comp.compose("c")  # evicts "b"
+    assert comp.compose("a") is a
+    comp.compose("b")
+    assert comp.misses == 4
+
+
+def test_frames_are_read_only():
+    frame = Compositor((2, 2)).compose("k")
+    with pytest.raises(ValueError):
+        frame[0, 0, 0] = 1
@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+
+import scenes.conversation_cutscene as cutscene
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+CHARACTERS = {"A": {"side": "left"}, "B": {"side": "right"}, "N": {"side": "center"}}
+
+
+@pytest.fixture
+def ax(agg_fig_ax):
+    cutscene._compositor = None
+    cutscene._layout = None
+    return agg_fig_ax[1]
+
+
+def play(ax, speakers, on_line=None):
+    conversation = [
+        {"character": c, "text": f"line {i}"} for i, c in enumerate(speakers)
+    ]
+
+    def advance(fig):
+        if on_line is not None:
+            on_line()
+        return True
+
+    with patch.object(cutscene, "wait_for_continue", advance):
+        cutscene.conversation_cutscene(ax, None, conversation, CHARACTERS)
+
+
+# ── Compositing ────────────────────────────────────────────────────────────────
+
+
+def test_frames_composed_once_per_speaker(ax):
+    play(ax, "ABAB")
+    comp = cutscene._compositor
+    assert (comp.misses, comp.hits) == (2, 2)
+    assert ax.texts[-1].get_text() == "B: line 3"
+
+
+# ── Layout ─────────────────────────────────────────────────────────────────────
+
+
+def test_artist_count_constant_across_lines(ax):
+    counts = []
+    play(ax, "ABNNA", on_line=lambda: counts.append(len(ax.get_children())))
+    assert len(set(counts)) == 1
+
+
+def test_layout_reused_by_next_conversation(ax):
+    play(ax, "AB")
+    layout = cutscene._layout
+    play(ax, "BA")
+    assert cutscene._layout is layout
+
+
+def test_layout_rebuilt_after_axes_cleared(ax):
+    play(ax, "AB")
+    layout = cutscene._layout
+    ax.clear()
+    play(ax, "AB")
+    assert cutscene._layout is not layout
+    assert not layout.attached
+
+
+def test_same_frame_line_is_blitted_not_redrawn(ax):
+    play(ax, "N")
+    canvas = ax.figure.canvas
+    with patch.object(canvas, "draw") as draw, patch.object(canvas, "blit") as blit:
+        cutscene._layout.show(cutscene._layout._frame, "N", "again", "center")
+    draw.assert_not_called()
+    blit.assert_called_once()
+
+
+def test_name_badge_follows_speaker_side(ax):
+    play(ax, "B")
+    name = cutscene._layout.name
+    assert name.get_visible() and name.get_text() == "B"
+    assert name.get_horizontalalignment() == "right"
+
+    play(ax, "N")
+    assert not name.get_visible()
@@ -0,0 +1,96 @@
+from matplotlib.backend_bases import CloseEvent, KeyEvent, MouseEvent
+
+from scenes.events import wait_for_continue, wait_for_input, wait_until
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+def press(fig, key):
+    KeyEvent("key_press_event", fig.canvas, key)._process()
+
+
+def click(fig):
+    MouseEvent("button_press_event", fig.canvas, 10, 10, button=1)._process()
+
+
+def close(fig):
+    CloseEvent("close_event", fig.canvas)._process()
+
+
+def run_loop_with(fig, *actions):
+    """Replace the blocking loop with one that performs *actions* in turn."""
+    calls = iter(actions)
+
+    def fake_loop(timeout=0):
+        next(calls)()
+
+    fig.canvas.start_event_loop = fake_loop
+
+
+def callback_count(fig, name):
+    return len(fig.canvas.callbacks.callbacks.get(name, {}))
+
+
+# ── wait_for_input ─────────────────────────────────────────────────────────────
+
+
+def test_space_continues(agg_fig):
+    run_loop_with(agg_fig, lambda: press(agg_fig, " "))
+    assert wait_for_continue(agg_fig) is True
+
+
+def test_click_continues(agg_fig):
+    run_loop_with(agg_fig, lambda: click(agg_fig))
+    assert wait_for_continue(agg_fig) is True
+
+
+def test_other_key_does_not_continue(agg_fig):
+    run_loop_with(agg_fig, lambda: press(agg_fig, "a"))
+    assert wait_for_continue(agg_fig) is False
+
+
+def test_timeout_returns_false(agg_fig):
+    assert wait_for_input(agg_fig, timeout=0.02) is False
+
+
+def test_close_returns_false(agg_fig):
+    run_loop_with(agg_fig, lambda: close(agg_fig))
+    assert wait_for_continue(agg_fig) is False
+
+
+def test_predicate_receives_event(agg_fig):
+    seen = []
+    run_loop_with(agg_fig, lambda: press(agg_fig, "x"))
+    wait_for_input(agg_fig, events=("key_press_event",), predicate=seen.append)
+    assert [event.key for event in seen] == ["x"]
+
+
+def test_handlers_disconnected_after_wait(agg_fig):
+    before = callback_count(agg_fig, "key_press_event")
+    run_loop_with(agg_fig, lambda: press(agg_fig, " "))
+    wait_for_continue(agg_fig)
+    assert callback_count(agg_fig, "key_press_event") == before
+
+
+# ── wait_until ─────────────────────────────────────────────────────────────────
+
+
+def test_wait_until_returns_once_done(agg_fig):
+    state = {"done": False}
+
+    def finish():
+        state["done"] = True
+        press(agg_fig, "q")
+
+    run_loop_with(agg_fig, lambda: press(agg_fig, "a"), finish)
+    assert wait_until(agg_fig, lambda: state["done"]) is True
+
+
+def test_wait_until_skips_loop_when_already_done(agg_fig):
+    run_loop_with(agg_fig)  # any loop call would raise StopIteration
+    assert wait_until(agg_fig, lambda: True) is True
+
+
+def test_wait_until_stops_on_close(agg_fig):
+    run_loop_with(agg_fig, lambda: close(agg_fig))
+    assert wait_until(agg_fig, lambda: False) is False
@@ -3,6 +3,8 @@ from unittest.mock import patch
 import os
 import sys
 
+import pytest
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scenes"))
 
 with patch("matplotlib.pyplot.pause"), patch("matplotlib.pyplot.draw"), patch(
@@ -15,6 +17,7 @@ with patch("matplotlib.pyplot.pause"), patch("matplotlib.pyplot.draw"), patch(
         BIRD_RADIUS,
         PIPE_GAP,
         PIPE_WIDTH,
+        SIM_STEP,
     )
 
 
@@ -35,7 +38,8 @@ def test_gravity_pulls_bird_down(mock_fig_ax):
     game.started = True
     initial_y = game.bird_y
     with patch.object(game, "_draw"):
-        game._update(0)
+        game.update(SIM_STEP)
+        game.render()
     assert game.bird_y < initial_y or game.bird_vy < 0
 
 
@@ -67,7 +71,8 @@ def test_floor_collision_triggers_game_over(mock_fig_ax):
     game.bird_y = BIRD_RADIUS - 0.1  # below floor
     game.bird_vy = -1.0
     with patch.object(game, "_draw"):
-        game._update(0)
+        game.update(SIM_STEP)
+        game.render()
     assert game.game_over
 
 
@@ -78,7 +83,8 @@ def test_ceiling_collision_triggers_game_over(mock_fig_ax):
     game.bird_y = game.height - BIRD_RADIUS + 0.1  # above ceiling
     game.bird_vy = 1.0
     with patch.object(game, "_draw"):
-        game._update(0)
+        game.update(SIM_STEP)
+        game.render()
     assert game.game_over
 
 
@@ -93,7 +99,8 @@ def test_pipe_collision_below_gap(mock_fig_ax):
     game.bird_y = 2.0  # below gap (gap starts at 4.0)
     game.bird_vy = 0.0
     with patch.object(game, "_draw"):
-        game._update(0)
+        game.update(SIM_STEP)
+        game.render()
     assert game.game_over
 
 
@@ -105,7 +112,8 @@ def test_pipe_no_collision_inside_gap(mock_fig_ax):
     game.bird_y = 2.0 + PIPE_GAP / 2  # inside gap
     game.bird_vy = 0.0
     with patch.object(game, "_draw"):
-        game._update(0)
+        game.update(SIM_STEP)
+        game.render()
     assert not game.game_over
 
 
@@ -121,7 +129,8 @@ def test_score_increments_on_pipe_pass(mock_fig_ax):
     game.bird_y = 4.0
     game.bird_vy = 0.0
     with patch.object(game, "_draw"):
-        game._update(0)
+        game.update(SIM_STEP)
+        game.render()
     assert game.score == 1
 
 
@@ -134,7 +143,8 @@ def test_win_when_score_reaches_target(mock_fig_ax):
     game.bird_vy = 0.0
     game.pipes = []
     with patch.object(game, "_draw"):
-        game._update(0)
+        game.update(SIM_STEP)
+        game.render()
     assert game.game_over
 
 
@@ -159,3 +169,18 @@ def test_spawn_pipe_gap_within_bounds(mock_fig_ax):
         gap_y = game.pipes[0]["gap_y"]
         assert gap_y + PIPE_GAP <= game.height
         assert gap_y >= 0
+
+
+# ── Interpolation ──────────────────────────────────────────────────────────────
+
+
+def test_render_interpolates_between_steps(agg_fig_ax):
+    game = FlappyBirdGame(*agg_fig_ax, width=10, height=8)
+    game.started = True
+    game.update(SIM_STEP)
+
+    game.render(0.5)
+    midpoint = (game.prev_bird_y + game.bird_y) / 2
+    assert game._bird.center[1] == pytest.approx(midpoint)
+    game.render(1.0)
+    assert game._bird.center[1] == pytest.approx(game.bird_y)
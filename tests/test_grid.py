@@ -0,0 +1,91 @@
+import numpy as np
+from matplotlib.figure import Figure
+
+from scenes.grid import MAX_IMAGE_PX, EDGE_MAX_CELLS, GridRenderer
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+PALETTE = ["black", "red", "lime"]
+
+
+def make_grid(width=4, height=3, **kwargs):
+    ax = Figure().add_subplot()
+    return GridRenderer(ax, width, height, PALETTE, **kwargs)
+
+
+# ── Palette lookup ─────────────────────────────────────────────────────────────
+
+
+def test_codes_map_through_palette():
+    grid = make_grid()
+    codes = np.zeros((3, 4), dtype=int)
+    codes[1, 2] = 1
+    codes[0, 0] = 2
+    grid.update(codes)
+    image = grid.image.get_array()
+    assert tuple(image[1, 2]) == (255, 0, 0, 255)
+    assert tuple(image[0, 0]) == (0, 255, 0, 255)
+    assert tuple(image[2, 3]) == (0, 0, 0, 255)
+
+
+def test_single_image_artist_regardless_of_size():
+    small = make_grid(4, 3)
+    large = make_grid(200, 200)
+    assert list(small.image.axes.images) == [small.image]
+    assert list(large.image.axes.images) == [large.image]
+
+
+def test_unchanged_codes_skip_update():
+    grid = make_grid()
+    codes = np.ones((3, 4), dtype=int)
+    assert grid.update(codes)
+    assert not grid.update(codes.copy())
+
+
+def test_changed_codes_update_image():
+    grid = make_grid()
+    codes = np.ones((3, 4), dtype=int)
+    grid.update(codes)
+    codes[0, 0] = 2
+    assert grid.update(codes)
+
+
+# ── Glyph tiles ────────────────────────────────────────────────────────────────
+
+
+def test_glyph_tiles_scale_image_per_cell():
+    grid = make_grid(glyphs={1: ("1", "white")})
+    assert grid.cell_px > 1
+    assert grid.image.get_array().shape == (3 * grid.cell_px, 4 * grid.cell_px, 4)
+
+
+def test_glyph_image_size_is_capped_on_large_boards():
+    grid = make_grid(400, 400, glyphs={1: ("1", "white")})
+    assert max(grid.image.get_array().shape[:2]) <= MAX_IMAGE_PX
+
+
+def test_glyph_drawn_inside_its_cell():
+    grid = make_grid(glyphs={1: ("8", "white")})
+    codes = np.ones((3, 4), dtype=int)
+    grid.update(codes)
+    k = grid.cell_px
+    tile = grid.image.get_array()[:k, :k]
+    # Some pixels are pure cell colour, others picked up the glyph
+    assert (tile[..., 1] > 0).any()
+    assert (tile == (255, 0, 0, 255)).all(axis=-1).any()
+
+
+# ── Cell borders ───────────────────────────────────────────────────────────────
+
+
+def test_edges_drawn_on_small_boards():
+    grid = make_grid(edgecolor="black")
+    assert grid.edges is not None
+    assert grid.artists == [grid.image, grid.edges]
+
+
+def test_edges_skipped_on_large_boards():
+    size = EDGE_MAX_CELLS + 1
+    grid = make_grid(size, size, edgecolor="black")
+    assert grid.edges is None
+    assert grid.artists == [grid.image]
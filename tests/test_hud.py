@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scenes.hud import HUD_KEY, HUD_REFRESH, DebugHud
+from scenes.profiler import profiler
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def now(monkeypatch):
+    """A controllable perf_counter: append to advance time."""
+    times = [0.0]
+    monkeypatch.setattr("scenes.hud.time.perf_counter", lambda: times[-1])
+    return times
+
+
+@pytest.fixture
+def hud(agg_fig_ax):
+    fig, ax = agg_fig_ax
+    ax.plot([0, 1], [0, 1])
+    hud = DebugHud(fig, ax)
+    yield hud
+    if hud.visible:
+        hud.hide()
+
+
+def frames(hud, now, count, seconds=0.02, phases=(0.001, 0.002, 0.005)):
+    for _ in range(count):
+        now.append(now[-1] + seconds)
+        hud._on_frame(phases)
+
+
+# ── Toggle ─────────────────────────────────────────────────────────────────────
+
+
+def test_toggle_watches_profiler_frames(hud):
+    hud.toggle()
+    assert hud.visible and profiler.enabled
+    hud.toggle()
+    assert not hud.visible and not profiler.enabled
+
+
+def test_hud_axes_built_once_and_survives_scene_clear(hud):
+    hud.show()
+    hud_ax = hud._hud_ax
+    hud.ax.clear()
+    hud.hide()
+    hud.show()
+    assert hud._hud_ax is hud_ax
+    assert hud_ax in hud.fig.axes
+
+
+def test_hud_is_left_out_of_full_draws(hud):
+    hud.show()
+    assert hud._hud_ax.get_animated()
+
+
+# ── Frames ─────────────────────────────────────────────────────────────────────
+
+
+def test_reports_fps_split_and_artist_count(hud, now):
+    with patch.object(hud.fig.canvas, "draw_idle"):  # no frame of its own
+        hud.show()
+    frames(hud, now, 5, seconds=HUD_REFRESH)
+    assert hud.fps_text.get_text().split()[:2] == ["4.0", "FPS"]
+    assert hud.split_text.get_text() == "sim   1.0  build   2.0  draw   5.0 ms"
+    assert hud.scene_text.get_text().startswith(f"{len(hud.ax.get_children())} ")
+    assert len(hud.spark.get_xdata()) == 4  # one point per frame interval
+
+
+def test_text_refreshes_only_every_interval(hud, now):
+    hud.show()
+    frames(hud, now, 2)
+    with patch.object(hud, "_refresh") as refresh:
+        frames(hud, now, 3, seconds=0.01)
+        refresh.assert_not_called()
+        frames(hud, now, 1, seconds=HUD_REFRESH)
+        refresh.assert_called_once()
+
+
+def test_full_draw_adds_hud_after_the_frame(hud):
+    profiler.begin_scene("text intro")
+    hud.show()
+    hud.fig.canvas.draw()
+    assert hud.scene_text.get_text().endswith("text intro")
+    assert hud._pixels is not None
+    profiler.end_scene()
+
+
+# ── Game ───────────────────────────────────────────────────────────────────────
+
+
+def test_hotkey_toggles_hud():
+    with patch("matplotlib.pyplot.ion"), patch("matplotlib.pyplot.subplots"):
+        from game import Game
+
+    game = SimpleNamespace(hud=MagicMock(), space_pressed=False)
+    Game.on_key_press(game, SimpleNamespace(key=HUD_KEY))
+    game.hud.toggle.assert_called_once()
+    assert not game.space_pressed
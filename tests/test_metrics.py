@@ -0,0 +1,133 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from scenes.metrics import JsonlWriter, SessionMetrics
+from scenes.profiler import profiler
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def now(monkeypatch):
+    """A controllable perf_counter: append to advance time."""
+    times = [0.0]
+    monkeypatch.setattr("scenes.metrics.time.perf_counter", lambda: times[-1])
+    return times
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """The asset cache's cumulative load time, in ms."""
+    load_ms = [0.0]
+    cache = SimpleNamespace(stats=lambda: {"load_ms": load_ms[-1]})
+    monkeypatch.setattr("scenes.metrics.asset_cache", cache)
+    return load_ms
+
+
+@pytest.fixture
+def metrics(tmp_path, loads, agg_fig):
+    clock = SimpleNamespace(frames_skipped=0)
+    session = SessionMetrics(agg_fig, str(tmp_path / "metrics.jsonl"), clock)
+    yield session
+    if session.writer._thread.is_alive():
+        session.close()
+
+
+def read_records(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+# ── Writer ─────────────────────────────────────────────────────────────────────
+
+
+def test_writer_appends_one_line_per_record(tmp_path):
+    path = tmp_path / "out.jsonl"
+    writer = JsonlWriter(str(path))
+    writer.write({"a": 1})
+    writer.write({"b": 2})
+    writer.close()
+    assert read_records(path) == [{"a": 1}, {"b": 2}]
+
+
+def test_writer_drops_instead_of_blocking(tmp_path):
+    writer = JsonlWriter(str(tmp_path / "out.jsonl"), maxsize=1)
+    writer._queue.put(None)  # stop the thread so nothing drains the queue
+    writer._thread.join()
+    writer.write({"queued": True})
+    writer.write({"late": True})
+    assert writer.dropped == 1
+    writer.close()
+
+
+def test_writer_flushes_queue_at_exit(tmp_path):
+    path = tmp_path / "out.jsonl"
+    with patch("scenes.metrics.atexit.register") as register:
+        writer = JsonlWriter(str(path))
+    writer.write({"scene": 1})
+    writer.write({"scene": 2})
+
+    (at_exit,), _ = register.call_args
+    at_exit()  # as the interpreter does when the window's close handler exits
+    at_exit()  # and again after an explicit close — a no-op
+    assert read_records(path) == [{"scene": 1}, {"scene": 2}]
+
+
+# ── Scene records ──────────────────────────────────────────────────────────────
+
+
+def test_session_record_comes_first(metrics):
+    metrics.close()
+    (record,) = read_records(metrics.writer.path)
+    assert record["event"] == "session" and record["session"] == metrics.session
+    assert "matplotlib" in record and "backend" in record
+
+
+def test_scene_record_covers_frames_and_loads(metrics, now, loads):
+    metrics.begin_scene()
+    loads.append(12.5)
+    now.append(0.040)
+    profiler.end_frame()
+    for _ in range(3):
+        now.append(now[-1] + 0.016)
+        profiler.end_frame()
+    metrics.clock.frames_skipped = 2
+    record = metrics.end_scene(4, "minigame", "minigame snake_game", score=7)
+
+    assert record["index"] == 4 and record["type"] == "minigame"
+    assert record["asset_load_ms"] == 12.5
+    assert record["first_frame_ms"] == pytest.approx(40)
+    assert record["frames"] == 4
+    assert record["dropped_frames"] == 2
+    assert record["score"] == 7
+
+
+def test_input_latency_measured_to_next_frame(metrics, now):
+    metrics.begin_scene()
+    now.append(1.0)
+    metrics._on_input(None)
+    now.append(1.010)
+    metrics._on_input(None)  # still waiting — the first press counts
+    now.append(1.030)
+    profiler.end_frame()
+    record = metrics.end_scene(0, "conversation", "conversation hall")
+    assert record["inputs"] == 1
+    assert record["input_latency_ms_mean"] == pytest.approx(30)
+
+
+def test_scene_without_frames_has_no_frame_times(metrics):
+    metrics.begin_scene()
+    record = metrics.end_scene(0, "exit", "exit")
+    assert record["first_frame_ms"] is None and record["frame_ms_mean"] is None
+
+
+def test_records_written_in_background(metrics):
+    metrics.begin_scene()
+    metrics.end_scene(0, "text", "text intro")
+    metrics.close()
+    events = [r["event"] for r in read_records(metrics.writer.path)]
+    assert events == ["session", "scene"]
+    assert not profiler.enabled
@@ -1,4 +1,5 @@
 import numpy as np
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import os
@@ -148,3 +149,33 @@ def test_reveal_all_mines(mock_fig_ax):
     mine_positions = np.argwhere(game.board == -1)
     for y, x in mine_positions:
         assert game.revealed[y, x]
+
+
+# ── Redraws ────────────────────────────────────────────────────────────────────
+
+
+def click(game, x, y, button=1):
+    game._on_click(
+        SimpleNamespace(inaxes=game.ax, xdata=x + 0.5, ydata=y + 0.5, button=button)
+    )
+
+
+def test_click_that_changes_nothing_skips_redraw(mock_fig_ax):
+    fig, ax = mock_fig_ax
+    game = make_game(fig, ax)
+    game._place_mines(0, 0)
+    game.first_click = False
+    game.revealed[0, 0] = True
+
+    with patch.object(game, "_draw") as draw:
+        click(game, 0, 0)
+        click(game, 0, 0, button=3)  # revealed cells cannot be flagged
+    draw.assert_not_called()
+
+
+def test_flag_click_redraws(mock_fig_ax):
+    fig, ax = mock_fig_ax
+    game = make_game(fig, ax)
+    with patch.object(game, "_draw") as draw:
+        click(game, 1, 1, button=3)
+    draw.assert_called_once()
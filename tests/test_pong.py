@@ -16,6 +16,7 @@ with patch("matplotlib.pyplot.pause"), patch("matplotlib.pyplot.draw"), patch(
         PADDLE_HEIGHT,
         BALL_RADIUS,
         MAX_SPEED,
+        SIM_STEP,
     )
 
 
@@ -85,7 +86,8 @@ def test_ball_bounces_off_top_wall(mock_fig_ax):
     game.ball_pos = [5.0, game.height - BALL_RADIUS + 0.1]
     game.ball_vel = [0.1, 0.1]  # moving up
     with patch.object(game, "_draw"):
-        game._update(0)
+        game.update(SIM_STEP)
+        game.render()
     assert game.ball_vel[1] < 0  # now moving down
 
 
@@ -95,7 +97,8 @@ def test_ball_bounces_off_bottom_wall(mock_fig_ax):
     game.ball_pos = [5.0, BALL_RADIUS - 0.1]
     game.ball_vel = [0.1, -0.1]  # moving down
     with patch.object(game, "_draw"):
-        game._update(0)
+        game.update(SIM_STEP)
+        game.render()
     assert game.ball_vel[1] > 0  # now moving up
 
 
@@ -105,7 +108,8 @@ def test_ball_bounces_off_right_wall(mock_fig_ax):
     game.ball_pos = [game.width - BALL_RADIUS + 0.1, 4.0]
     game.ball_vel = [0.1, 0.0]  # moving right
     with patch.object(game, "_draw"):
-        game._update(0)
+        game.update(SIM_STEP)
+        game.render()
     assert game.ball_vel[0] < 0  # now moving left
 
 
@@ -122,7 +126,8 @@ def test_paddle_hit_increments_score(mock_fig_ax):
     ]
     game.ball_vel = [-0.15, 0.0]  # moving left into paddle
     with patch.object(game, "_draw"):
-        game._update(0)
+        game.update(SIM_STEP)
+        game.render()
     assert game.score == 1
     assert game.ball_vel[0] > 0  # deflected right
 
@@ -134,7 +139,8 @@ def test_ball_miss_triggers_game_over(mock_fig_ax):
     game.ball_pos = [PADDLE_X - BALL_RADIUS - 0.5, 4.0]
     game.ball_vel = [-0.15, 0.0]
     with patch.object(game, "_draw"):
-        game._update(0)
+        game.update(SIM_STEP)
+        game.render()
     assert game.game_over
 
 
@@ -154,7 +160,8 @@ def test_ball_speed_never_exceeds_max(mock_fig_ax):
         game.ball_pos[0] = PADDLE_X + PADDLE_WIDTH - BALL_RADIUS
         game.ball_vel[0] = -abs(game.ball_vel[0])
         with patch.object(game, "_draw"):
-            game._update(0)
+            game.update(SIM_STEP)
+            game.render()
         speed = float(np.hypot(*game.ball_vel))
         assert speed <= MAX_SPEED + 0.01  # small float tolerance
 
@@ -0,0 +1,133 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from scenes.clock import EngineClock
+from scenes.profiler import PHASES, WORST_FRAMES, FrameProfiler, profiler
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def now(monkeypatch):
+    """A controllable perf_counter: append to advance time."""
+    times = [0.0]
+    monkeypatch.setattr("scenes.profiler.time.perf_counter", lambda: times[-1])
+    return times
+
+
+@pytest.fixture
+def prof():
+    p = FrameProfiler(capacity=4)
+    p.enable()
+    p.begin_scene("test")
+    return p
+
+
+@pytest.fixture
+def shared():
+    """The process-wide profiler, switched off again afterwards."""
+    profiler.enable()
+    profiler.begin_scene("test")
+    yield profiler
+    profiler.end_scene()
+    profiler.disable()
+
+
+def frame(prof, now, **phases):
+    for name, seconds in phases.items():
+        with prof.phase(name):
+            now.append(now[-1] + seconds)
+    prof.end_frame()
+
+
+# ── Recording ──────────────────────────────────────────────────────────────────
+
+
+def test_disabled_profiler_records_nothing(now):
+    prof = FrameProfiler()
+    frame(prof, now, update=0.01)
+    assert prof.frames == 0
+    assert prof.end_scene() is None
+
+
+def test_phases_accumulate_until_frame_ends(prof, now):
+    frame(prof, now, update=0.002, build=0.003)
+    with prof.phase("update"):
+        now.append(now[-1] + 0.001)
+    frame(prof, now, update=0.001, rasterize=0.010)
+    assert prof.samples[0].tolist() == pytest.approx([0.002, 0.003, 0.0])
+    assert prof.samples[1].tolist() == pytest.approx([0.002, 0.0, 0.010])
+
+
+def test_nested_phase_counts_once(prof, now):
+    with prof.phase("rasterize"):
+        with prof.phase("rasterize"):
+            now.append(now[-1] + 0.004)
+        now.append(now[-1] + 0.001)
+    prof.end_frame()
+    assert prof.samples[0][PHASES.index("rasterize")] == pytest.approx(0.005)
+
+
+def test_ring_buffer_keeps_latest_frames(prof, now):
+    for i in range(6):
+        frame(prof, now, update=0.001 * (i + 1))
+    summary = prof.summary()
+    assert (summary["frames"], summary["kept"]) == (6, 4)
+    assert sorted(prof.frame_ids.tolist()) == [2, 3, 4, 5]
+
+
+# ── Reports ────────────────────────────────────────────────────────────────────
+
+
+def test_summary_percentiles_and_worst_frames(prof, now):
+    for ms in (1, 2, 3, 40):
+        frame(prof, now, build=ms / 1000)
+    summary = prof.summary()
+    assert summary["phases"]["build"][50] == pytest.approx(2.5)
+    assert summary["phases"]["total"][99] == pytest.approx(38.89, abs=0.01)
+    worst = summary["worst"]
+    assert len(worst) == WORST_FRAMES
+    assert worst[0]["frame"] == 3 and worst[0]["build"] == pytest.approx(40)
+
+
+def test_end_scene_logs_and_resets(prof, now, caplog):
+    frame(prof, now, update=0.001)
+    with caplog.at_level("INFO", logger="scenes.profiler"):
+        summary = prof.end_scene()
+    assert summary["scene"] == "test"
+    assert "Profile test: 1 frames" in caplog.text
+    assert prof.frames == 0
+
+
+# ── Integration ────────────────────────────────────────────────────────────────
+
+
+def test_full_figure_draw_is_one_rasterize_frame(prof, agg_fig):
+    fig = agg_fig
+    prof.instrument(fig)
+    prof.instrument(fig)  # only wrapped once
+    fig.canvas.draw()
+    assert prof.frames == 1
+    assert prof.samples[0][PHASES.index("rasterize")] > 0
+
+
+def test_clock_times_update_build_and_blit(shared, agg_fig):
+    fig = agg_fig
+    clock = EngineClock(fig)
+    clock._timer = MagicMock()
+
+    class Scene:
+        finished = False
+
+        def update(self, dt):
+            pass
+
+        def render(self, alpha=1.0):
+            return []
+
+    clock.attach(Scene(), blitter=MagicMock())
+    clock._tick()
+    clock._tick()
+    clock.detach()
+    assert shared.frames == 2
@@ -0,0 +1,122 @@
+import matplotlib.patches as patches
+
+from scenes.quality import MAX_FRAME_SKIP, QUALITY_LEVELS, QualityGovernor
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+class DecoratedScene:
+    def __init__(self, ax):
+        self.decorations = [ax.axvline(0.5)]
+
+
+def governor(**kwargs):
+    kwargs.setdefault("degrade_after", 3)
+    kwargs.setdefault("recover_after", 3)
+    return QualityGovernor(**kwargs)
+
+
+# ── Frame skipping ─────────────────────────────────────────────────────────────
+
+
+def test_on_time_frames_are_all_rendered():
+    quality = governor()
+    quality.record(0.5)
+    assert quality.should_render()
+
+
+def test_late_frame_skips_renders_in_proportion():
+    quality = governor()
+    quality.record(2.5)
+    assert [quality.should_render() for _ in range(3)] == [False, False, True]
+    assert quality.skipped == 2
+
+
+def test_frame_skip_is_capped():
+    quality = governor()
+    quality.record(50)
+    skipped = 0
+    while not quality.should_render():
+        skipped += 1
+    assert skipped == MAX_FRAME_SKIP
+
+
+# ── Quality levels ─────────────────────────────────────────────────────────────
+
+
+def test_sustained_lateness_steps_quality_down():
+    quality = governor()
+    changes = [quality.record(1.5) for _ in range(3)]
+    assert changes == [False, False, True]
+    assert quality.level == 1
+
+
+def test_occasional_lateness_keeps_quality():
+    quality = governor()
+    for _ in range(10):
+        quality.record(1.5)
+        quality.record(0.8)
+    assert quality.level == 0
+
+
+def test_level_never_passes_the_last():
+    quality = governor()
+    for _ in range(30):
+        quality.record(3)
+    assert quality.level == len(QUALITY_LEVELS) - 1
+
+
+def test_headroom_steps_quality_back_up():
+    quality = governor()
+    quality.level = 2
+    for _ in range(3):
+        quality.record(0.1)
+    assert quality.level == 1
+
+
+# ── Applying levels ────────────────────────────────────────────────────────────
+
+
+def test_lower_level_disables_then_restores_antialiasing(agg_fig):
+    ax = agg_fig.add_subplot()
+    circle = ax.add_patch(patches.Circle((0.5, 0.5), 0.1))
+    quality = governor()
+    quality.attach(agg_fig, None)
+
+    for _ in range(3):
+        quality.record(2)
+    assert not circle.get_antialiased()
+
+    for _ in range(3):
+        quality.record(0.1)
+    assert circle.get_antialiased()
+
+
+def test_artist_kept_across_scenes_recovers_its_antialiasing(agg_fig):
+    persistent = agg_fig.text(0.5, 0.5, "HUD", antialiased=True)
+    quality = governor()
+    quality.attach(agg_fig, None)
+    for _ in range(3):
+        quality.record(2)
+    assert not persistent.get_antialiased()
+
+    # The next scene starts while quality is still lowered
+    quality.detach()
+    quality.attach(agg_fig, None)
+    quality.record(0.5)
+    for _ in range(3):
+        quality.record(0.1)
+    assert quality.level == 0
+    assert persistent.get_antialiased()
+
+
+def test_minimal_level_hides_decorations(agg_fig):
+    scene = DecoratedScene(agg_fig.add_subplot())
+    quality = governor()
+    quality.level = len(QUALITY_LEVELS) - 1
+    quality.attach(agg_fig, scene)
+
+    # Applied after the scene's first frame, when its artists exist
+    assert scene.decorations[0].get_visible()
+    assert quality.record(0.5) is True
+    assert not scene.decorations[0].get_visible()
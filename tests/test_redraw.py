@@ -0,0 +1,82 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from scenes.redraw import DirtyRedraw
+from scenes.nine_puzzle import NinePuzzleGame
+from scenes.password_puzzle import PasswordPuzzleGame
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def fig(agg_fig):
+    agg_fig.canvas.draw_idle = MagicMock()
+    return agg_fig
+
+
+# ── DirtyRedraw ────────────────────────────────────────────────────────────────
+
+
+def test_marks_within_a_frame_make_one_redraw(fig):
+    draw = MagicMock()
+    redraw = DirtyRedraw(fig, draw)
+    redraw.mark("a")
+    redraw.mark("b", "a")
+    redraw.flush()
+    draw.assert_called_once_with({"a", "b"})
+    fig.canvas.draw_idle.assert_called_once()
+
+
+def test_flush_without_marks_draws_nothing(fig):
+    draw = MagicMock()
+    DirtyRedraw(fig, draw).flush()
+    draw.assert_not_called()
+    fig.canvas.draw_idle.assert_not_called()
+
+
+def test_first_mark_starts_timer_once(fig):
+    redraw = DirtyRedraw(fig, MagicMock())
+    redraw._timer = MagicMock()
+    redraw.mark("a")
+    redraw.mark("b")
+    redraw._timer.start.assert_called_once()
+    redraw.flush()
+    redraw.mark("c")
+    assert redraw._timer.start.call_count == 2
+
+
+def test_close_drops_pending_parts(fig):
+    draw = MagicMock()
+    redraw = DirtyRedraw(fig, draw)
+    redraw.mark("a")
+    redraw.close()
+    redraw.flush()
+    draw.assert_not_called()
+
+
+# ── Puzzles ────────────────────────────────────────────────────────────────────
+
+
+def test_nine_puzzle_move_restyles_only_swapped_cells(fig):
+    game = NinePuzzleGame(fig, fig.add_subplot())
+    game._draw()
+    er, ec = game.empty
+    row, col = (er, ec + 1) if ec + 1 < 3 else (er, ec - 1)
+
+    game._move_tile(row, col)
+    game._draw_cell = spy = MagicMock()
+    game._redraw.flush()
+    cells = {call.args for call in spy.call_args_list}
+    assert cells == {(er, ec), (row, col)}
+    assert "Moves: 1" in game.ax.get_title()
+
+
+def test_password_typing_burst_is_one_redraw(fig):
+    game = PasswordPuzzleGame(fig, fig.add_subplot(), ["clue"], "abc")
+    game._draw()
+    for key in "ABCD":
+        game._handle_key(MagicMock(key=key))
+    game._redraw.flush()
+    assert game._redraw.flushes == 1
+    assert game._input_text.get_text() == "••••"
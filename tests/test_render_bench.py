@@ -0,0 +1,90 @@
+import os
+import sys
+import json
+from unittest.mock import patch
+
+import pytest
+
+from scenes.grid import GridRenderer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+
+import harness  # noqa: E402
+from render_bench import CASES  # noqa: E402
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+def result(**medians):
+    return {"results": {name: {"median_ms": ms} for name, ms in medians.items()}}
+
+
+def statuses(rows):
+    return {name: status for name, *_, status in rows}
+
+
+# ── Comparison ─────────────────────────────────────────────────────────────────
+
+
+def test_compare_flags_slowdown_beyond_threshold():
+    rows = harness.compare(
+        result(a=10.0, b=10.0, c=10.0), result(a=12.0, b=11.0, c=8.0), threshold=0.15
+    )
+    assert statuses(rows) == {"a": "regressed", "b": "ok", "c": "improved"}
+
+
+def test_compare_ignores_differences_below_noise_floor():
+    rows = harness.compare(result(tiny=0.01), result(tiny=0.05))
+    assert statuses(rows) == {"tiny": "ok"}
+
+
+def test_compare_reports_new_and_missing_cases():
+    rows = harness.compare(result(old=1.0), result(new=1.0))
+    assert statuses(rows) == {"old": "missing", "new": "new"}
+
+
+def test_compare_command_exits_nonzero_on_regression(tmp_path, capsys):
+    baseline, current = tmp_path / "base.json", tmp_path / "cur.json"
+    baseline.write_text(json.dumps(result(draw=10.0)))
+    current.write_text(json.dumps(result(draw=20.0)))
+    argv = ["compare", str(baseline), str(current)]
+    assert harness.main("render", {}, argv) == 1
+    assert "regressed" in capsys.readouterr().out
+    assert harness.main("render", {}, argv + ["--threshold", "1.5"]) == 0
+
+
+def test_run_command_writes_baseline(tmp_path):
+    out = tmp_path / "render.json"
+    cases = {"noop": lambda: (lambda: None)}
+    harness.main("render", cases, ["run", "--out", str(out), "--repeat", "3"])
+    saved = json.loads(out.read_text())
+    assert saved["suite"] == "render" and "matplotlib" in saved["environment"]
+    assert saved["results"]["noop"]["repeat"] == 3
+
+
+# ── Render cases ───────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_render_case_runs(name):
+    timing = harness.time_case(CASES[name](), repeat=1, warmup=0)
+    assert timing["median_ms"] > 0
+
+
+@pytest.mark.parametrize(
+    "name",
+    [name for name in CASES if name.split()[0] in ("tetris", "minesweeper", "snake")],
+)
+def test_board_cases_change_the_board_every_frame(name):
+    run = CASES[name]()
+    changed = []
+    update = GridRenderer.update
+
+    def record(grid, codes):
+        changed.append(update(grid, codes))
+        return changed[-1]
+
+    with patch.object(GridRenderer, "update", record):
+        for _ in range(5):
+            run()
+    assert changed == [True] * 5
@@ -0,0 +1,103 @@
+import matplotlib.patches as patches
+from matplotlib.figure import Figure
+
+from scenes.retained import ArtistLayer
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+def make_layer():
+    ax = Figure().add_subplot()
+    return ArtistLayer(ax)
+
+
+def make_rect(index):
+    return patches.Rectangle((0, 0), 1, 1)
+
+
+# ── Artists ────────────────────────────────────────────────────────────────────
+
+
+def test_add_attaches_patch_to_axes():
+    layer = make_layer()
+    rect = layer.add(make_rect(0))
+    assert rect in layer.ax.patches
+    assert layer.artists == [rect]
+
+
+def test_text_is_tracked():
+    layer = make_layer()
+    label = layer.text(0.5, 0.5, "hello")
+    assert label in layer.ax.texts
+    assert label in layer.artists
+
+
+# ── Pools ──────────────────────────────────────────────────────────────────────
+
+
+def test_pool_grows_to_requested_count():
+    layer = make_layer()
+    rects = layer.pool("cells", make_rect, 3)
+    assert len(rects) == 3
+    assert len(layer.ax.patches) == 3
+
+
+def test_pool_reuses_artists_between_frames():
+    layer = make_layer()
+    first = layer.pool("cells", make_rect, 3)
+    second = layer.pool("cells", make_rect, 3)
+    assert first == second
+    assert len(layer.ax.patches) == 3
+
+
+def test_pool_hides_surplus_instead_of_removing():
+    layer = make_layer()
+    rects = layer.pool("cells", make_rect, 3)
+    layer.pool("cells", make_rect, 1)
+    assert rects[0].get_visible()
+    assert not rects[1].get_visible()
+    assert not rects[2].get_visible()
+    assert len(layer.ax.patches) == 3
+
+
+def test_pool_shows_hidden_artists_again():
+    layer = make_layer()
+    rects = layer.pool("cells", make_rect, 2)
+    layer.pool("cells", make_rect, 0)
+    layer.pool("cells", make_rect, 2)
+    assert all(r.get_visible() for r in rects)
+
+
+def test_pool_factory_receives_index():
+    layer = make_layer()
+    seen = []
+
+    def factory(index):
+        seen.append(index)
+        return make_rect(index)
+
+    layer.pool("cells", factory, 2)
+    layer.pool("cells", factory, 4)
+    assert seen == [0, 1, 2, 3]
+
+
+# ── Bookkeeping ────────────────────────────────────────────────────────────────
+
+
+def test_remove_detaches_everything():
+    layer = make_layer()
+    layer.pool("cells", make_rect, 2)
+    layer.text(0, 0, "x")
+    layer.remove()
+    assert not layer.ax.patches
+    assert not layer.ax.texts
+    assert layer.artists == []
+
+
+def test_static_artists_excluded_from_dynamic():
+    layer = make_layer()
+    label = layer.text(0, 0, "help", static=True)
+    rects = layer.pool("cells", make_rect, 2)
+    assert label in layer.artists
+    assert label not in layer.dynamic
+    assert layer.dynamic == rects
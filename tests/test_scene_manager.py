@@ -1,6 +1,11 @@
 import os
+import subprocess
+from collections import OrderedDict
+from importlib.metadata import EntryPoint
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -8,7 +13,13 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 with patch("matplotlib.pyplot.ion"), patch("matplotlib.pyplot.subplots"), patch(
     "matplotlib.pyplot.pause"
 ), patch("matplotlib.pyplot.draw"):
-    from game import SceneManager
+    from game import (
+        MINIGAME_REGISTRY,
+        SceneManager,
+        parse_args,
+        register_plugins,
+        resolve_minigame,
+    )
 
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
@@ -123,3 +134,254 @@ def test_scenes_dict_converted_to_list():
     manager = make_manager(scenes)
     assert len(manager.scenes) == 2
     assert manager.has_next
+
+
+# ── Asset prefetch ─────────────────────────────────────────────────────────────
+
+
+def test_conversation_assets_include_background_and_speakers():
+    characters = {
+        "Alice": {"sprite": "alice.png"},
+        "Bob": {"sprite": "bob.png"},
+    }
+    settings = {"forest": {"background": "forest.png"}}
+    manager = SceneManager([], characters, settings)
+    scene = {
+        "type": "conversation",
+        "location": "forest",
+        "conversation": [{"character": "Alice", "text": "Hi"}],
+    }
+    assert sorted(manager.scene_assets(scene)) == [
+        ("alice.png", (0.05, 0.35, 0.55, 0.95)),
+        ("forest.png", (0, 1, 0, 1)),
+    ]
+
+
+def test_text_scene_assets_use_location_background():
+    settings = {"forest": {"background": "forest.png"}}
+    manager = SceneManager([], CHARACTERS, settings)
+    assert manager.scene_assets({"type": "text", "location": "forest"}) == [
+        ("forest.png", (0, 1, 0, 1))
+    ]
+
+
+def test_minigame_scene_has_no_assets():
+    manager = make_manager([])
+    assert manager.scene_assets({"type": "minigame", "game": "snake_game"}) == []
+
+
+def test_next_prefetches_following_scenes():
+    settings = {name: {"background": f"{name}.png"} for name in "abcd"}
+    scenes = [{"type": "text", "location": name} for name in "abcd"]
+    manager = SceneManager(scenes, CHARACTERS, settings, lookahead=2)
+
+    with patch("game.prefetch_images") as mock_prefetch:
+        manager.next()
+
+    mock_prefetch.assert_called_once_with([("b.png", None), ("c.png", None)])
+
+
+def test_prefetch_uses_compiled_manifests():
+    scenes = [{"type": "text"}, {"type": "minigame", "game": "snake_game"}]
+    manifests = [[], [("compiled.png", (0, 1, 0, 1))]]
+    manager = SceneManager(scenes, CHARACTERS, SETTINGS, manifests=manifests)
+
+    with patch("game.prefetch_images") as mock_prefetch:
+        manager.next()
+
+    mock_prefetch.assert_called_once_with([("compiled.png", None)])
+
+
+def test_conversation_with_unknown_location_does_not_raise(mock_fig_ax):
+    fig, ax = mock_fig_ax
+    manager = make_manager([])
+    scene = {"type": "conversation", "location": "nowhere", "conversation": []}
+    with patch("game.conversation_cutscene") as mock_conv:
+        manager.render(scene, fig, ax)
+    mock_conv.assert_called_once()
+
+
+# ── Minigame registry ──────────────────────────────────────────────────────────
+
+
+def test_importing_game_skips_minigame_modules():
+    code = (
+        "import sys, game; "
+        "print([ref for ref in game.MINIGAME_REGISTRY.values()"
+        " if ref.partition(':')[0] in sys.modules])"
+    )
+    root = os.path.join(os.path.dirname(__file__), "..")
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root,
+        env={**os.environ, "MPLBACKEND": "Agg"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_resolve_imports_and_caches_class():
+    with patch.dict("game.MINIGAME_REGISTRY", {"demo": "collections:OrderedDict"}):
+        cls = resolve_minigame("demo")
+        assert cls is OrderedDict
+        assert MINIGAME_REGISTRY["demo"] is OrderedDict
+
+
+def test_resolve_bad_reference_returns_none():
+    with patch.dict("game.MINIGAME_REGISTRY", {"demo": "no_such_module:Game"}):
+        assert resolve_minigame("demo") is None
+
+
+def test_plugins_discovered_from_entry_points():
+    plugin = EntryPoint(
+        "chess", "my_games.chess:ChessGame", "matplotlib_engine.minigames"
+    )
+    clash = EntryPoint(
+        "snake_game", "my_games.snake:Snake", "matplotlib_engine.minigames"
+    )
+
+    with patch.dict("game.MINIGAME_REGISTRY"), patch(
+        "importlib.metadata.entry_points", return_value=[plugin, clash]
+    ):
+        assert register_plugins() == ["chess"]
+        assert MINIGAME_REGISTRY["chess"] == "my_games.chess:ChessGame"
+        assert MINIGAME_REGISTRY["snake_game"] == "scenes.snake_game:SnakeGame"
+
+
+def test_plugin_minigame_built_with_fig_and_ax(mock_fig_ax):
+    fig, ax = mock_fig_ax
+    manager = make_manager([])
+    mock_cls = MagicMock()
+
+    with patch.dict("game.MINIGAME_REGISTRY", {"chess": mock_cls}):
+        manager.render({"type": "minigame", "game": "chess"}, fig, ax)
+
+    mock_cls.assert_called_once_with(fig, ax)
+    mock_cls.return_value.run.assert_called_once()
+
+
+# ── Profiling ──────────────────────────────────────────────────────────────────
+
+
+def test_render_reports_each_scene_to_profiler(mock_fig_ax):
+    fig, ax = mock_fig_ax
+    manager = make_manager([])
+    with patch("game.profiler") as profiler:
+        manager.render({"type": "minigame", "game": "missing"}, fig, ax)
+    profiler.begin_scene.assert_called_once_with("minigame missing")
+    profiler.end_scene.assert_called_once()
+
+
+def test_render_traces_scene_and_minigame_run(mock_fig_ax, tmp_path):
+    from scenes.trace import tracer
+
+    fig, ax = mock_fig_ax
+    ax.get_children.return_value = [1, 2, 3]
+    manager = make_manager([])
+    manager.ax = ax
+    game_cls = MagicMock()
+    tracer.start(str(tmp_path / "trace.json"))
+    try:
+        with patch.dict(MINIGAME_REGISTRY, {"chess": game_cls}):
+            manager.render({"type": "minigame", "game": "chess"}, fig, ax)
+    finally:
+        tracer.stop()
+
+    spans = [e["name"] for e in tracer.events if e["ph"] == "X"]
+    assert spans == ["chess.run", "minigame chess"]
+    artists = [e["args"] for e in tracer.events if e["name"] == "artists"]
+    assert artists == [{"count": 3}, {"count": 3}]
+
+
+def test_render_checks_watchdog_after_scene(mock_fig_ax):
+    fig, ax = mock_fig_ax
+    manager = make_manager([])
+    manager.watchdog = MagicMock()
+    manager.render({"type": "exit"}, fig, ax)
+    manager.watchdog.check.assert_called_once_with("exit")
+
+
+def test_render_records_minigame_retries_and_score(mock_fig_ax):
+    fig, ax = mock_fig_ax
+    manager = make_manager([])
+    manager.metrics = MagicMock()
+    results = iter([False, False, True])
+
+    class Sweeper:
+        def __init__(self, *args, **kwargs):
+            self.score = 3
+
+        def run(self):
+            return next(results)
+
+    with patch.dict(MINIGAME_REGISTRY, {"minesweeper": Sweeper}):
+        manager.render({"type": "minigame", "game": "minesweeper"}, fig, ax)
+
+    manager.metrics.begin_scene.assert_called_once()
+    _, kwargs = manager.metrics.end_scene.call_args
+    assert kwargs == {"game": "minesweeper", "score": 3, "retries": 2}
+
+
+def test_scene_cut_short_by_exit_is_still_recorded(mock_fig_ax):
+    fig, ax = mock_fig_ax
+    manager = make_manager([{"type": "text"}])
+    manager.metrics = MagicMock()
+    with patch("game.text_scene", side_effect=SystemExit(0)):
+        with pytest.raises(SystemExit):
+            manager.render(manager.next(), fig, ax)
+
+    _, kwargs = manager.metrics.end_scene.call_args
+    assert kwargs == {"interrupted": True}
+
+
+def test_render_profiles_selected_scene(mock_fig_ax, tmp_path):
+    from scenes.scene_profile import SceneProfiler
+
+    fig, ax = mock_fig_ax
+    manager = make_manager([{"type": "text"}, {"type": "exit"}])
+    manager.scene_profiler = SceneProfiler("exit", directory=str(tmp_path))
+    with patch("game.text_scene"):
+        manager.render(manager.next(), fig, ax)
+    manager.render(manager.next(), fig, ax)
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == ["scene-002-exit.folded", "scene-002-exit.pstats"]
+
+
+def test_scene_numbers_count_from_one_like_story_errors(mock_fig_ax, tmp_path):
+    from scenes.scene_profile import SceneProfiler
+
+    fig, ax = mock_fig_ax
+    manager = make_manager([{"type": "text"}, {"type": "exit"}])
+    manager.scene_profiler = SceneProfiler("1", directory=str(tmp_path))
+    with patch("game.text_scene"):
+        manager.render(manager.next(), fig, ax)
+    manager.render(manager.next(), fig, ax)
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == ["scene-001-text.folded", "scene-001-text.pstats"]
+
+
+# ── Command line ───────────────────────────────────────────────────────────────
+
+
+def test_invalid_profile_mode_env_falls_back(monkeypatch, caplog):
+    monkeypatch.setenv("ENGINE_PROFILE_MODE", "perf")
+    assert parse_args([]).profile_mode == "cprofile"
+    assert "ENGINE_PROFILE_MODE" in caplog.text
+
+    monkeypatch.setenv("ENGINE_PROFILE_MODE", "sample")
+    assert parse_args([]).profile_mode == "sample"
+
+
+def test_invalid_watchdog_env_is_ignored(monkeypatch, caplog):
+    monkeypatch.delenv("ENGINE_WATCHDOG", raising=False)
+    assert parse_args([]).watchdog is None
+    assert caplog.text == ""
+
+    monkeypatch.setenv("ENGINE_WATCHDOG", "strcit")
+    assert parse_args([]).watchdog is None
+    assert "ENGINE_WATCHDOG=strcit" in caplog.text
+
+    monkeypatch.setenv("ENGINE_WATCHDOG", "strict")
+    assert parse_args([]).watchdog == "strict"
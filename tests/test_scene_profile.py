@@ -0,0 +1,90 @@
+import time
+import pstats
+
+import pytest
+
+from scenes.scene_profile import SceneProfiler, StackSampler, scene_matches
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+SNAKE = {"type": "minigame", "game": "snake_game"}
+
+
+def busy_scene(seconds=0.05):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(100))
+
+
+# ── Selection ──────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "selector, expected",
+    [("3", True), ("4", False), ("minigame", True), ("snake_game", True)]
+    + [("text", False), ("*", True)],
+)
+def test_scene_matches(selector, expected):
+    assert scene_matches(selector, 3, SNAKE) is expected
+
+
+# ── Sampling ───────────────────────────────────────────────────────────────────
+
+
+def test_sampler_collects_stacks_of_profiled_thread(tmp_path):
+    sampler = StackSampler(interval=0.001)
+    sampler.start()
+    busy_scene()
+    sampler.stop()
+    assert sampler.samples > 0
+    assert any("busy_scene (test_scene_profile.py" in s for s in sampler.stacks)
+
+    path = tmp_path / "out.folded"
+    sampler.write_collapsed(str(path))
+    stack, count = path.read_text().splitlines()[0].rsplit(" ", 1)
+    assert int(count) > 0 and ";" in stack
+
+
+# ── Scene profiles ─────────────────────────────────────────────────────────────
+
+
+def test_cprofile_mode_writes_pstats_and_folded(tmp_path):
+    profiler = SceneProfiler("snake_game", directory=str(tmp_path))
+    with profiler.profile(3, SNAKE, "minigame snake_game"):
+        busy_scene()
+
+    pstats_path, folded_path = profiler.written
+    assert pstats_path.endswith("scene-003-minigame-snake_game.pstats")
+    assert folded_path.endswith(".folded")
+    functions = {name for _, _, name in pstats.Stats(pstats_path).stats}
+    assert "busy_scene" in functions
+
+
+def test_sample_mode_writes_only_folded(tmp_path):
+    profiler = SceneProfiler("*", mode="sample", directory=str(tmp_path))
+    with profiler.profile(0, {"type": "text"}, "text intro"):
+        busy_scene(0.02)
+    assert [p.rsplit(".", 1)[1] for p in profiler.written] == ["folded"]
+
+
+def test_unmatched_scene_is_not_profiled(tmp_path):
+    profiler = SceneProfiler("7", directory=str(tmp_path))
+    with profiler.profile(3, SNAKE, "minigame snake_game"):
+        pass
+    assert profiler.written == []
+    assert not any(tmp_path.iterdir())
+
+
+def test_unwritable_directory_warns_instead_of_failing(tmp_path, caplog):
+    blocker = tmp_path / "profiles"
+    blocker.write_text("not a directory")
+    profiler = SceneProfiler("*", directory=str(blocker / "nested"))
+    with profiler.profile(0, SNAKE, "minigame snake_game"):
+        busy_scene(0.01)
+    assert profiler.written == []
+    assert "Cannot write scene profile" in caplog.text
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        SceneProfiler("*", mode="perf")
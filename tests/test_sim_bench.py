@@ -0,0 +1,52 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+
+import harness  # noqa: E402
+from sim_bench import CASES, allocations, hamiltonian_cycle  # noqa: E402
+
+# ── Measurement ────────────────────────────────────────────────────────────────
+
+
+def test_time_case_reports_time_per_call():
+    calls = []
+    timing = harness.time_case(lambda: calls.append(1), repeat=3, warmup=1, number=5)
+    assert len(calls) == 1 + 3 * 5
+    assert timing["number"] == 5
+
+
+def test_allocations_separate_peak_from_retained():
+    kept = []
+    stats = allocations(lambda: bytearray(100_000), calls=5)
+    assert stats["alloc_peak_bytes"] >= 100_000
+    assert stats["alloc_net_bytes"] < 1_000
+
+    stats = allocations(lambda: kept.append(bytearray(100_000)), calls=5)
+    assert stats["alloc_net_bytes"] >= 100_000
+
+
+def test_hamiltonian_cycle_visits_every_cell_once_in_steps():
+    cycle = hamiltonian_cycle(6, 4)
+    assert sorted(cycle) == sorted((x, y) for x in range(6) for y in range(4))
+    for (x0, y0), (x1, y1) in zip(cycle, cycle[1:] + cycle[:1]):
+        assert abs(x1 - x0) + abs(y1 - y0) == 1
+
+
+# ── Simulation cases ───────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_sim_case_runs(name):
+    timing = harness.time_case(CASES[name](), repeat=3, warmup=0)
+    assert timing["median_ms"] > 0
+
+
+def test_snake_move_case_never_collides(caplog):
+    run = CASES["snake._move_snake 20x20"]()
+    with caplog.at_level("DEBUG", logger="scenes.snake_game"):
+        for _ in range(1000):  # more than two laps of the board
+            run()
+    assert "collision" not in caplog.text
@@ -1,6 +1,10 @@
 from unittest.mock import MagicMock, patch
 from collections import deque
 
+import pytest
+
+from scenes.clock import EngineClock
+
 import sys
 import os
 
@@ -9,8 +13,15 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scenes"))
 with patch("matplotlib.pyplot.pause"), patch("matplotlib.pyplot.draw"), patch(
     "matplotlib.animation.FuncAnimation"
 ):
-    from snake_game import SnakeGame, DIR_LEFT, DIR_RIGHT, DIR_UP, DIR_DOWN
-
+    from snake_game import (
+        SnakeGame,
+        ANIM_INTERVAL,
+        SIM_STEP,
+        DIR_LEFT,
+        DIR_RIGHT,
+        DIR_UP,
+        DIR_DOWN,
+    )
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
@@ -172,3 +183,28 @@ def test_valid_direction_change(mock_fig_ax):
     event.key = "up"
     game._on_key(event)
     assert game._queued_dir == DIR_UP
+
+
+# ── Timing ─────────────────────────────────────────────────────────────────────
+
+
+def test_late_ticks_never_move_twice(mock_fig_ax, monkeypatch):
+    """The timer reschedules after its callback, so ticks arrive a little late."""
+    fig, ax = mock_fig_ax
+    times = [0.0]
+    monkeypatch.setattr("scenes.clock.time.perf_counter", lambda: times[-1])
+    clock = EngineClock(fig)
+    game = SnakeGame(fig, ax, width=100, height=10, clock=clock)
+    game.render = MagicMock(return_value=[])
+    clock.attach(game, ANIM_INTERVAL, step=SIM_STEP)
+
+    tick = ANIM_INTERVAL / 1000 + 0.005
+    moves = []
+    for _ in range(100):
+        times.append(times[-1] + tick)
+        before = clock.steps
+        clock._tick()
+        moves.append(clock.steps - before)
+
+    assert max(moves) == 1
+    assert sum(moves) == pytest.approx(100 * tick / SIM_STEP, abs=1)
@@ -0,0 +1,230 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from scenes.story import Story, StoryError, compile_story, load_story
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+MINIGAMES = {"snake_game"}
+
+
+def make_story(**overrides):
+    story = {
+        "characters": {
+            "Alice": {"sprite": "assets/alice.png", "side": "left"},
+            "Narrator": {"side": "center"},
+        },
+        "settings": {"forest": {"background": "assets/forest.png"}},
+        "scenes": [
+            {
+                "type": "conversation",
+                "location": "forest",
+                "conversation": [
+                    {"character": "Alice", "text": "Hi"},
+                    {"character": "Narrator", "text": "..."},
+                ],
+            },
+            {"type": "text", "location": "forest", "content": ["Hello"]},
+            {"type": "minigame", "game": "snake_game"},
+            {"type": "exit"},
+        ],
+    }
+    story.update(overrides)
+    return story
+
+
+def problems_of(data):
+    with pytest.raises(StoryError) as info:
+        compile_story(data, "/base", MINIGAMES)
+    return info.value.problems
+
+
+# ── Compilation ────────────────────────────────────────────────────────────────
+
+
+def test_valid_story_compiles():
+    story = compile_story(make_story(), "/base", MINIGAMES)
+    assert isinstance(story, Story)
+    assert len(story.scenes) == 4
+
+
+def test_asset_paths_resolved_against_base():
+    story = compile_story(make_story(), "/base", MINIGAMES)
+    assert story.characters["Alice"]["sprite"] == os.path.normpath(
+        "/base/assets/alice.png"
+    )
+    assert story.settings["forest"]["background"] == os.path.normpath(
+        "/base/assets/forest.png"
+    )
+
+
+def test_manifests_list_images_per_scene():
+    story = compile_story(make_story(), "/base", MINIGAMES)
+    conversation, text, minigame, exit_ = story.manifests
+    assert [path for path, _ in conversation] == [
+        os.path.normpath("/base/assets/forest.png"),
+        os.path.normpath("/base/assets/alice.png"),
+    ]
+    assert len(text) == 1
+    assert minigame == [] and exit_ == []
+
+
+def test_location_index():
+    story = compile_story(make_story(), "/base", MINIGAMES)
+    assert story.locations == {"forest": [0, 1]}
+
+
+def test_dict_scenes_accepted():
+    data = make_story(scenes={"a": {"type": "exit"}})
+    assert len(compile_story(data, "/base").scenes) == 1
+
+
+# ── Validation ─────────────────────────────────────────────────────────────────
+
+
+def test_unknown_location_reported():
+    data = make_story(
+        scenes=[
+            {
+                "type": "conversation",
+                "location": "castle",
+                "conversation": [{"character": "Alice", "text": "Hi"}],
+            }
+        ]
+    )
+    assert problems_of(data) == ["scene 1: unknown location 'castle'"]
+
+
+def test_unknown_character_reported():
+    data = make_story(
+        scenes=[
+            {
+                "type": "conversation",
+                "location": "forest",
+                "conversation": [{"character": "Bob", "text": "Hi"}],
+            }
+        ]
+    )
+    assert problems_of(data) == ["scene 1, line 1: unknown character 'Bob'"]
+
+
+def test_unknown_scene_type_and_minigame_reported_together():
+    data = make_story(
+        scenes=[{"type": "cutscene"}, {"type": "minigame", "game": "chess"}]
+    )
+    assert problems_of(data) == [
+        "scene 1: unknown type 'cutscene'",
+        "scene 2: unknown minigame 'chess'",
+    ]
+
+
+def test_bad_character_side_reported():
+    data = make_story(characters={"Alice": {"side": "up"}}, scenes=[])
+    assert len(problems_of(data)) == 1
+
+
+def test_non_object_top_level_rejected():
+    with pytest.raises(StoryError):
+        compile_story([], "/base")
+
+
+# ── Cached artifact ────────────────────────────────────────────────────────────
+
+
+def write_story(tmp_path, data):
+    path = tmp_path / "story.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+def test_second_load_reads_artifact(tmp_path):
+    path = write_story(tmp_path, make_story())
+    cache_dir = str(tmp_path / "cache")
+    load_story(path, str(tmp_path), cache_dir, MINIGAMES)
+
+    with patch("scenes.story._compile") as mock_compile:
+        story = load_story(path, str(tmp_path), cache_dir, MINIGAMES)
+
+    mock_compile.assert_not_called()
+    assert len(story.scenes) == 4
+
+
+def test_edited_story_recompiled_and_old_artifact_removed(tmp_path):
+    path = write_story(tmp_path, make_story())
+    cache_dir = str(tmp_path / "cache")
+    load_story(path, str(tmp_path), cache_dir, MINIGAMES)
+
+    write_story(tmp_path, make_story(scenes=[{"type": "exit"}]))
+    story = load_story(path, str(tmp_path), cache_dir, MINIGAMES)
+
+    assert len(story.scenes) == 1
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_corrupt_artifact_recompiled(tmp_path):
+    path = write_story(tmp_path, make_story())
+    cache_dir = tmp_path / "cache"
+    load_story(path, str(tmp_path), str(cache_dir), MINIGAMES)
+    for artifact in cache_dir.iterdir():
+        artifact.write_bytes(b"garbage")
+
+    story = load_story(path, str(tmp_path), str(cache_dir), MINIGAMES)
+    assert len(story.scenes) == 4
+
+
+def test_artifact_reused_from_a_different_base_path(tmp_path):
+    path = write_story(tmp_path, make_story())
+    cache_dir = str(tmp_path / "cache")
+    load_story(path, "/run1", cache_dir, MINIGAMES)
+
+    with patch("scenes.story._compile") as mock_compile:
+        story = load_story(path, "/run2", cache_dir, MINIGAMES)
+
+    mock_compile.assert_not_called()
+    assert story.characters["Alice"]["sprite"] == os.path.normpath(
+        "/run2/assets/alice.png"
+    )
+    assert story.manifests[0][0][0] == os.path.normpath("/run2/assets/forest.png")
+
+
+def test_artifact_is_data_with_relative_paths(tmp_path):
+    path = write_story(tmp_path, make_story())
+    cache_dir = tmp_path / "cache"
+    load_story(path, str(tmp_path), str(cache_dir), MINIGAMES)
+
+    (artifact,) = cache_dir.iterdir()
+    data = json.loads(artifact.read_text(encoding="utf-8"))
+    assert data["settings"]["forest"]["background"] == "assets/forest.png"
+
+
+def test_artifact_with_wrong_shape_recompiled(tmp_path):
+    path = write_story(tmp_path, make_story())
+    cache_dir = tmp_path / "cache"
+    load_story(path, str(tmp_path), str(cache_dir), MINIGAMES)
+    (artifact,) = cache_dir.iterdir()
+    data = json.loads(artifact.read_text(encoding="utf-8"))
+    data["manifests"] = [[["assets/forest.png", "not an extent"]]] * 4
+    artifact.write_text(json.dumps(data), encoding="utf-8")
+
+    story = load_story(path, str(tmp_path), str(cache_dir), MINIGAMES)
+    assert story.manifests[0][0][1] == (0, 1, 0, 1)
+
+
+def test_malformed_json_raises_story_error(tmp_path):
+    path = tmp_path / "story.json"
+    path.write_text("{not json", encoding="utf-8")
+    with pytest.raises(StoryError, match="malformed"):
+        load_story(str(path), str(tmp_path))
+
+
+def test_missing_story_raises_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_story(str(tmp_path / "missing.json"), str(tmp_path))
+
+
+def test_bundled_story_compiles():
+    root = os.path.join(os.path.dirname(__file__), "..")
+    load_story(os.path.join(root, "data", "story.json"), root)
@@ -198,3 +198,33 @@ def test_hard_drop_awards_bonus(mock_fig_ax):
     with patch.object(game, "_draw"):
         game._hard_drop()
     assert game.score > 0
+
+
+# ── State version ──────────────────────────────────────────────────────────────
+
+
+def test_version_bumped_by_moves_and_rotations(mock_fig_ax):
+    fig, ax = mock_fig_ax
+    game = make_game(fig, ax)
+    set_piece(game, "T", 4, 10)
+    before = game.version
+    game._move(dx=1, dy=0)
+    game._rotate()
+    assert game.version == before + 2
+
+
+def test_version_unchanged_by_blocked_move(mock_fig_ax):
+    fig, ax = mock_fig_ax
+    game = make_game(fig, ax)
+    set_piece(game, "O", 0, 10)
+    before = game.version
+    game._move(dx=-1, dy=0)
+    assert game.version == before
+
+
+def test_waiting_ticks_leave_version_alone(mock_fig_ax):
+    fig, ax = mock_fig_ax
+    game = make_game(fig, ax)
+    before = game.version
+    game.update(0.05)
+    assert game.version == before
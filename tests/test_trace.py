@@ -0,0 +1,93 @@
+import json
+import threading
+
+import pytest
+
+from scenes.profiler import profiler
+from scenes.trace import TraceRecorder, tracer
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def rec(tmp_path):
+    recorder = TraceRecorder()
+    recorder.start(str(tmp_path / "trace.json"))
+    yield recorder
+    recorder.stop()  # nothing left for the exit hook to write
+
+
+@pytest.fixture
+def shared(tmp_path):
+    """The process-wide tracer and profiler, switched off again afterwards."""
+    tracer.start(str(tmp_path / "trace.json"))
+    profiler.enable()
+    yield tracer
+    profiler.disable()
+    tracer.stop()
+
+
+def of_phase(events, ph):
+    return [e for e in events if e["ph"] == ph]
+
+
+# ── Events ─────────────────────────────────────────────────────────────────────
+
+
+def test_stopped_recorder_keeps_nothing():
+    recorder = TraceRecorder()
+    with recorder.span("scene"):
+        pass
+    recorder.counter("artists", count=3)
+    assert recorder.events == []
+    assert recorder.save() is None
+
+
+def test_span_records_complete_event(rec):
+    with rec.span("load story", "engine", scenes=4):
+        pass
+    (event,) = of_phase(rec.events, "X")
+    assert event["name"] == "load story" and event["cat"] == "engine"
+    assert event["args"] == {"scenes": 4}
+    assert event["ts"] >= 0 and event["dur"] >= 0
+
+
+def test_counter_records_values(rec):
+    rec.counter("asset cache", MB=1.5)
+    (event,) = of_phase(rec.events, "C")
+    assert event["args"] == {"MB": 1.5}
+
+
+def test_threads_get_named_tracks(rec):
+    with rec.span("main"):
+        pass
+    worker = threading.Thread(target=lambda: rec.counter("c", v=1), name="decoder")
+    worker.start()
+    worker.join()
+    names = {e["args"]["name"]: e["tid"] for e in of_phase(rec.events, "M")}
+    assert names["decoder"] != names[threading.current_thread().name]
+
+
+# ── Output ─────────────────────────────────────────────────────────────────────
+
+
+def test_save_writes_chrome_trace_json(rec):
+    with rec.span("scene"):
+        pass
+    path = rec.save()
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["displayTimeUnit"] == "ms"
+    assert [e["name"] for e in of_phase(data["traceEvents"], "X")] == ["scene"]
+
+
+# ── Integration ────────────────────────────────────────────────────────────────
+
+
+def test_profiler_phases_become_frame_spans(shared):
+    with profiler.phase("update"):
+        with profiler.phase("update"):  # nested blocks are one span
+            pass
+    profiler.end_frame()
+    spans = of_phase(shared.events, "X")
+    assert [(e["name"], e["cat"]) for e in spans] == [("update", "frame")]
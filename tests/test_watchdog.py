@@ -0,0 +1,160 @@
+import os
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+from matplotlib.animation import FuncAnimation
+
+import scenes.conversation_cutscene as cutscene
+from scenes.assets import asset_cache
+from scenes.conversation_cutscene import conversation_cutscene
+from scenes.story import load_story
+from scenes.text_scene import text_scene
+from scenes.watchdog import LeakError, LeakWatchdog, callback_count, live_animations
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def make_watchdog(agg_fig_ax):
+    made = []
+
+    def make(**kwargs):
+        watchdog = LeakWatchdog(*agg_fig_ax, **kwargs)
+        made.append(watchdog)
+        return watchdog
+
+    yield make
+    for watchdog in made:
+        watchdog.close()
+
+
+def play_scenes(watchdog, scene, count):
+    problems = []
+    for i in range(count):
+        scene(i)
+        problems = watchdog.check(f"scene {i}")
+    return problems
+
+
+# ── Counts ─────────────────────────────────────────────────────────────────────
+
+
+def test_callback_count_tracks_connections(agg_fig_ax):
+    canvas = agg_fig_ax[0].canvas
+    before = callback_count(canvas)
+    cid = canvas.mpl_connect("key_press_event", print)
+    assert callback_count(canvas) == before + 1
+    canvas.mpl_disconnect(cid)
+    assert callback_count(canvas) == before
+
+
+def test_live_animations_counted(agg_fig_ax):
+    before = live_animations()
+    anim = FuncAnimation(agg_fig_ax[0], lambda i: [], frames=1, cache_frame_data=False)
+    assert live_animations() == before + 1
+    anim._draw_was_started = True  # silence the "never rendered" warning
+
+
+# ── Checks ─────────────────────────────────────────────────────────────────────
+
+
+def test_clean_scenes_report_nothing(make_watchdog, agg_fig_ax):
+    fig, ax = agg_fig_ax
+    watchdog = make_watchdog()
+
+    def scene(i):
+        ax.clear()
+        ax.text(0.5, 0.5, "hello")
+        cid = fig.canvas.mpl_connect("key_press_event", print)
+        fig.canvas.mpl_disconnect(cid)
+
+    assert play_scenes(watchdog, scene, 6) == []
+
+
+def test_forgotten_disconnect_is_reported_after_streak(
+    make_watchdog, agg_fig_ax, caplog
+):
+    fig, _ = agg_fig_ax
+    watchdog = make_watchdog(streak=3)
+
+    def scene(i):
+        # A fresh handler each scene, as a game instance's bound method would be
+        fig.canvas.mpl_connect("key_press_event", lambda event: None)
+
+    assert play_scenes(watchdog, scene, 2) == []
+    scene(2)
+    with caplog.at_level("WARNING", logger="scenes.watchdog"):
+        problems = watchdog.check("scene 2")
+    assert problems and problems[0].startswith("callbacks grew for 3 scenes")
+    assert "Leak watchdog: callbacks" in caplog.text
+
+
+def test_growth_streak_resets_when_count_drops(make_watchdog, agg_fig_ax):
+    _, ax = agg_fig_ax
+    watchdog = make_watchdog(streak=3)
+
+    def scene(i):
+        if i == 2:
+            ax.clear()  # a scene that cleans up breaks the streak
+        ax.plot([0, 1], [0, 1])
+
+    assert play_scenes(watchdog, scene, 4) == []
+
+
+def test_strict_watchdog_raises(make_watchdog, agg_fig_ax):
+    _, ax = agg_fig_ax
+    watchdog = make_watchdog(strict=True, streak=2)
+    ax.plot([0, 1])
+    watchdog.check("first")
+    ax.plot([0, 1])
+    with pytest.raises(LeakError) as err:
+        watchdog.check("second")
+    assert any(p.startswith("axes artists") for p in err.value.problems)
+
+
+# ── Memory ─────────────────────────────────────────────────────────────────────
+
+
+def test_heap_tracked_and_tracing_stopped_on_close(make_watchdog):
+    was_tracing = tracemalloc.is_tracing()
+    watchdog = make_watchdog()
+    assert "heap KB" in watchdog.history[0]
+    watchdog.close()
+    assert tracemalloc.is_tracing() == was_tracing
+
+
+def test_top_allocators_point_at_growing_lines(make_watchdog):
+    watchdog = make_watchdog()
+    hoard = bytearray(1 << 20)
+    sites = watchdog.top_allocators(watchdog._take_memory())
+    assert "test_watchdog.py" in sites[0]
+    del hoard
+
+
+def test_story_scenes_pass_strict_watchdog(make_watchdog, agg_fig_ax, monkeypatch):
+    """Cached images, composed frames and image artists are bounded, not leaks."""
+    fig, ax = agg_fig_ax
+    fig.set_size_inches(12, 8)  # the game window, so frames are full size
+    story = load_story(os.path.join(REPO_ROOT, "data", "story.json"), REPO_ROOT)
+    monkeypatch.setattr(cutscene, "_compositor", None)
+    monkeypatch.setattr(cutscene, "_layout", None)
+    asset_cache.clear()
+
+    watchdog = make_watchdog(strict=True)
+    played = [s for s in story.scenes if s["type"] in ("text", "conversation")]
+    with patch("scenes.text_scene.wait_for_continue"), patch(
+        "scenes.conversation_cutscene.wait_for_continue"
+    ):
+        for scene in played[:8]:
+            if scene["type"] == "text":
+                text_scene(ax, scene, story.settings)
+            else:
+                bg = story.settings.get(scene["location"], {}).get("background")
+                lines = scene["conversation"][:3]  # enough to change speaker
+                conversation_cutscene(ax, bg, lines, story.characters)
+            fig.canvas.draw()
+            watchdog.check(scene["type"])
+    asset_cache.clear()